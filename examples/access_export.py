@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+import sys
+import os
+import argparse
+from pprint import pprint
+
+# Add the project root directory to the sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from library.access_vapi import AccessVapi
+from library.export import export
+
+def main():
+    parser = argparse.ArgumentParser(description="Export access users, groups and credentials, or reconcile group memberships.")
+    parser.add_argument('source', choices=['users', 'groups', 'credentials', 'sync'], help='What to export, or sync to reconcile memberships.')
+    parser.add_argument('path', help='Output file for exports (.ndjson, .ndjson.gz or .parquet), or the JSON membership file for sync.')
+    parser.add_argument('-w', '--workers', type=int, default=8, help='Concurrent detail requests.')
+    parser.add_argument('--dry-run', action='store_true', help='With sync, print the plan without making changes.')
+    parser.add_argument('--keep-missing', action='store_true', help='With sync, do not remove members missing from the file.')
+    args = parser.parse_args()
+
+    vaccess = AccessVapi()
+    if args.source == 'sync':
+        plan = vaccess.sync_access_group_memberships(args.path, dry_run=args.dry_run, remove_missing=not args.keep_missing, max_workers=args.workers)
+        print(f"add: {len(plan['add'])}")
+        print(f"remove: {len(plan['remove'])}")
+        for group_id, error in plan["errors"]:
+            print(f"Skipped group {group_id}, its members could not be read: {error}")
+        if args.dry_run:
+            pprint(plan)
+        else:
+            failed = [result for result in plan["results"] if result[3] != 200]
+            print(f"Applied {len(plan['results']) - len(failed)} changes, {len(failed)} failed.")
+            for action, group_id, user_id, status in failed:
+                print(f"Failed to {action} user {user_id} in group {group_id}: {status}")
+        return
+
+    errors = []
+    if args.source == 'users':
+        items = vaccess.iter_access_user_details(max_workers=args.workers, errors=errors)
+    elif args.source == 'groups':
+        items = vaccess.iter_access_group_details(max_workers=args.workers, errors=errors)
+    else:
+        items = vaccess.iter_access_credentials(max_workers=args.workers, errors=errors)
+    count = export(items, args.path)
+    print(f"Exported {count} {args.source} to {args.path}")
+    for key, error in errors:
+        print(f"Skipped {key}: {error}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+import sys
+import os
+import json
+import argparse
+# Add the project root directory to the sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from library.base_vapi import BaseVapi
+from library.audit_log import AuditLogTailer
+
+def main():
+    parser = argparse.ArgumentParser(description="Continuously print new audit log entries as JSON lines, resuming from a saved cursor.")
+    parser.add_argument('-c', '--cursor', default='audit_log.cursor', help='Cursor file used to resume between runs.')
+    parser.add_argument('--since', type=int, help='Unix time to start from when there is no cursor yet (default: now).')
+    args = parser.parse_args()
+
+    tailer = AuditLogTailer(BaseVapi(run_test=False), cursor_path=args.cursor, start_time=args.since)
+    try:
+        for entry in tailer.follow():
+            print(json.dumps(entry), flush=True)
+    except KeyboardInterrupt:
+        tailer.stop()
+
+if __name__ == "__main__":
+    main()
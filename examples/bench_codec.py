@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+import sys
+import os
+import argparse
+import gzip
+import random
+import time
+import zlib
+# Add the project root directory to the sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from library.codec import CODECS, get_codec
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Synthetic payloads shaped like large search_helix_events and camera device-list responses
+def helix_search_payload(count):
+    cameras = [f"{random.getrandbits(128):032x}" for _ in range(100)]
+    event_type_uid = f"{random.getrandbits(128):032x}"
+    return {
+        "events": [
+            {
+                "camera_id": random.choice(cameras),
+                "time_ms": 1700000000000 + i * 1500,
+                "event_type_uid": event_type_uid,
+                "attributes": {"mph": random.randint(5, 80), "direction": random.choice(["East", "West"])},
+                "flagged": False,
+            }
+            for i in range(count)
+        ],
+        "next_page_token": None,
+    }
+
+def device_list_payload(count):
+    return {
+        "cameras": [
+            {
+                "camera_id": f"{random.getrandbits(128):032x}", "name": f"Camera {i}", "model": random.choice(["CD52", "CB52-E", "CH52-E"]),
+                "serial": f"SER{i:08d}", "site": f"Site {i % 40}", "site_id": f"site-{i % 40}", "status": "Live",
+                "local_ip": f"10.0.{i // 250 % 250}.{i % 250}", "mac": f"e0:a7:00:{i // 65536 % 256:02x}:{i // 256 % 256:02x}:{i % 256:02x}",
+                "firmware": "2.4.1", "timezone": "America/Denver", "last_online": 1700000000 + i,
+            }
+            for i in range(count)
+        ]
+    }
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare bytes on the wire and JSON decode time for large API payloads.")
+    parser.add_argument('-n', '--events', type=int, default=100_000, help='Helix events in the search payload.')
+    parser.add_argument('-d', '--devices', type=int, default=20_000, help='Cameras in the device-list payload.')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='Timing repetitions (best is reported).')
+    args = parser.parse_args()
+
+    random.seed(0)
+    payloads = [
+        ("search_helix_events", helix_search_payload(args.events)),
+        ("camera_devices", device_list_payload(args.devices)),
+    ]
+    codecs = []
+    for name in CODECS:
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            print(f"Skipping {name}: not installed")
+
+    for label, payload in payloads:
+        body = get_codec("json").dumps(payload)
+        print(f"\n{label}")
+        print(f"  {'encoding':<10}{'bytes':>14}{'ratio':>8}")
+        wire = [("identity", body), ("gzip", gzip.compress(body, 6)), ("deflate", zlib.compress(body, 6))]
+        if brotli is not None:
+            wire.append(("br", brotli.compress(body, quality=5)))
+        for encoding, data in wire:
+            print(f"  {encoding:<10}{len(data):>14,}{len(data) / len(body):>8.1%}")
+
+        print(f"  {'codec':<10}{'decode ms':>14}{'encode ms':>12}")
+        for codec in codecs:
+            decode = best_of(lambda: codec.loads(body), args.repeat)
+            encode = best_of(lambda: codec.dumps(payload), args.repeat)
+            print(f"  {codec.name:<10}{decode * 1000:>14.1f}{encode * 1000:>12.1f}")
+
+if __name__ == "__main__":
+    main()
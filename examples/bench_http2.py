@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+import sys
+import os
+import argparse
+import time
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+# Add the project root directory to the sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from library.base_vapi import BaseVapi
+from library.standin import Http2StandinServer
+from library.tracing import summarize_latencies
+
+# Compares the default HTTP/1.1 session with the HTTP/2 transport on a fan-out
+# workload (many concurrent small GETs) against one local stand-in that speaks both.
+# The server runs in a child process so the CPU figures are the client's alone.
+
+def serve(latency_ms, response_bytes, pipe):
+    trace = [{"method": "GET", "endpoint": "cameras/v1/devices", "status": 200, "response_bytes": response_bytes}]
+    server = Http2StandinServer(trace=trace, latency_ms=latency_ms).start()
+    pipe.send(server.url)
+    while True:
+        command = pipe.recv()
+        if command == "stop":
+            break
+        # Any other message asks for the connection count so far
+        pipe.send(server.connections_accepted)
+    server.stop()
+
+def run(url, http2, requests_count, concurrency, pipe):
+    vapi = BaseVapi(run_test=False, api_key="bench", streaming_api_key="bench", api_url=url)
+    vapi.singleflight = None
+    if http2:
+        vapi.enable_http2(prior_knowledge=True)
+    pipe.send("count")
+    connections_before = pipe.recv()
+    latencies = []
+
+    def call(i):
+        start = time.perf_counter()
+        vapi.send_request("cameras/v1/devices", params={"i": i})
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(call, range(requests_count)))
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    pipe.send("count")
+    sockets = pipe.recv() - connections_before
+    if http2:
+        vapi.disable_http2()
+    return wall, cpu, sockets, summarize_latencies(latencies)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the HTTP/2 transport against the HTTP/1.1 session pool.")
+    parser.add_argument('-n', '--requests', type=int, default=2000, help='Requests per transport.')
+    parser.add_argument('-c', '--concurrency', type=int, default=64, help='Concurrent requests.')
+    parser.add_argument('-l', '--latency', type=float, default=20, help='Server-side latency per response, in ms.')
+    parser.add_argument('-b', '--bytes', type=int, default=2048, help='Response body size.')
+    args = parser.parse_args()
+
+    pipe, child_pipe = multiprocessing.Pipe()
+    server = multiprocessing.Process(target=serve, args=(args.latency, args.bytes, child_pipe), daemon=True)
+    server.start()
+    url = pipe.recv()
+    try:
+        print(f"{args.requests} requests, concurrency {args.concurrency}, {args.latency:g} ms server latency, {args.bytes} byte bodies")
+        print(f"{'transport':<10} {'wall s':>8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'sockets':>8} {'cpu s':>8} {'cpu us/req':>11}")
+        for name, http2 in (("HTTP/1.1", False), ("HTTP/2", True)):
+            wall, cpu, sockets, latency = run(url, http2, args.requests, args.concurrency, pipe)
+            print(f"{name:<10} {wall:>8.2f} {args.requests / wall:>8.0f} {latency['p50']:>8.1f} {latency['p99']:>8.1f} "
+                  f"{sockets:>8} {cpu:>8.2f} {cpu / args.requests * 1e6:>11.0f}")
+    finally:
+        pipe.send("stop")
+        server.join(5)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+import sys
+import os
+import gc
+import json
+import argparse
+import random
+import tracemalloc
+# Add the project root directory to the sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from library.records import HelixEvent, CameraDevice, AlarmDevice, LprDetection
+
+# Synthetic payloads shaped like the API responses, decoded from JSON so strings are
+# not shared the way Python literals would be.
+def helix_payload(i, cameras, event_type_uid):
+    return {
+        "camera_id": random.choice(cameras),
+        "time_ms": 1700000000000 + i,
+        "event_type_uid": event_type_uid,
+        "attributes": {"mph": random.randint(5, 80), "direction": random.choice(["East", "West"])},
+        "flagged": False,
+    }
+
+def camera_payload(i, cameras):
+    return {
+        "camera_id": cameras[i % len(cameras)], "name": f"Camera {i}", "model": "CD52", "serial": f"SER{i:08d}",
+        "site": "Main", "site_id": "7b1c1b2e-5fd0-4ad6-8e0e-8f5ad0d1c6a3", "status": "Live", "local_ip": "10.0.0.12",
+        "mac": "e0:a7:00:00:00:01", "firmware": "2.4.1", "timezone": "America/Denver", "last_online": 1700000000,
+    }
+
+def alarm_payload(i):
+    return {
+        "device_id": f"dev-{i % 5000}", "device_type": "door_contact_sensor", "name": f"Door {i}",
+        "site_id": "7b1c1b2e-5fd0-4ad6-8e0e-8f5ad0d1c6a3", "serial_number": f"SN{i:08d}", "status": "online",
+    }
+
+def lpr_payload(i):
+    return {"license_plate": f"ABC{i % 20000:04d}", "timestamp": 1700000000 + i, "image_url": f"https://example.invalid/{i}.jpg"}
+
+def decoded(payloads, batch=10000):
+    # Decode in page-sized batches like real paginated responses
+    page = []
+    for payload in payloads:
+        page.append(payload)
+        if len(page) == batch:
+            yield from json.loads(json.dumps(page))
+            page = []
+    if page:
+        yield from json.loads(json.dumps(page))
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare memory per record for raw API dicts and slot-based records.")
+    parser.add_argument('-n', '--count', type=int, default=200_000, help='Number of records per type (results are scaled to one million).')
+    args = parser.parse_args()
+
+    cameras = [f"{random.getrandbits(128):032x}" for _ in range(200)]
+    event_type_uid = f"{random.getrandbits(128):032x}"
+    cases = [
+        ("HelixEvent", HelixEvent.from_json, lambda: (helix_payload(i, cameras, event_type_uid) for i in range(args.count))),
+        ("CameraDevice", CameraDevice.from_json, lambda: (camera_payload(i, cameras) for i in range(args.count))),
+        ("AlarmDevice", AlarmDevice.from_json, lambda: (alarm_payload(i) for i in range(args.count))),
+        ("LprDetection", lambda d: LprDetection.from_json(d, cameras[0]), lambda: (lpr_payload(i) for i in range(args.count))),
+    ]
+
+    print(f"{'type':<14}{'dict MB':>10}{'record MB':>12}{'saved':>8}")
+    for name, convert, payloads in cases:
+        random.seed(0)
+        dict_bytes = measure(lambda: list(decoded(payloads())))
+        random.seed(0)
+        record_bytes = measure(lambda: [convert(item) for item in decoded(payloads())])
+        scale = 1_000_000 / args.count
+        print(f"{name:<14}{dict_bytes * scale / 1e6:>10.1f}{record_bytes * scale / 1e6:>12.1f}{1 - record_bytes / dict_bytes:>8.0%}")
+    print("Sizes are normalized to one million records.")
+
+if __name__ == "__main__":
+    main()
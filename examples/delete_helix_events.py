@@ -4,9 +4,12 @@ import os
 # Add the project root directory to the sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from library.helix_vapi import HelixVapi
+from library.helix_columns import HelixEventBatch
+from library.daemon import client_for
 from pprint import pprint
 
-helix_api = HelixVapi()
+# Use the warm client in the local daemon (examples/vapid.py) when it is running
+helix_api = client_for("helix") or HelixVapi()
 
 def delete_low_speed_events(min_speed=30):
     """
@@ -16,24 +19,22 @@ def delete_low_speed_events(min_speed=30):
         min_speed (int): The minimum speed threshold. Events with speeds below this threshold will be deleted.
     """
     event_count = 0
-    # Search for all Helix events
-    response = helix_api.search_helix_events()
-    events = response.json()
-    for event in events.get("events", []):
-        # Extract the mph value from the event attributes
-        mph = event["attributes"].get("mph")
-        # Check if the mph value is below the minimum speed
-        if mph is not None and mph < min_speed:
-            # Extract necessary identifiers for deletion
-            camera_id = event.get("camera_id")
-            event_time_ms = event.get("time_ms")
-            event_uid = event.get("event_type_uid")
-
-            # Perform deletion
-            if camera_id and event_time_ms and event_uid:
+    # Search for all Helix events and filter them as columns instead of per-event dicts.
+    # The batch is built here from the streamed events, so this also works through the daemon.
+    events = HelixEventBatch.from_events(helix_api.iter_helix_events(), attributes=["mph"])
+    if "mph" not in events.numeric:
+        print("No events with a numeric mph attribute found.")
+        return
+    # Events without an mph attribute are NaN and never match
+    slow_events = events.take(events.attribute("mph") < min_speed)
+    for (camera_id, event_time_ms, event_uid), mph in zip(slow_events.keys(), slow_events.attribute("mph").tolist()):
+        # Perform deletion
+        if camera_id and event_time_ms and event_uid:
+            # Bulk deletes yield to interactive calls when a scheduler is enabled
+            with helix_api.request_priority("bulk"):
                 response = helix_api.delete_helix_event(camera_id, event_time_ms, event_uid)
-                print(f"Deleted event {event_uid} at time {event_time_ms} with speed {mph} mph from camera {camera_id}")
-                event_count += 1
+            print(f"Deleted event {event_uid} at time {event_time_ms} with speed {mph:g} mph from camera {camera_id}")
+            event_count += 1
     print(f"Deleted {event_count} events total.")
 
 if __name__ == "__main__":
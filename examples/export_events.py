@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+import sys
+import os
+import argparse
+from datetime import datetime
+# Add the project root directory to the sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from library.export import export
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream Helix events or LPR detections to NDJSON (.ndjson, .ndjson.gz) or Parquet (.parquet).")
+    parser.add_argument('source', choices=['helix', 'lpr'], help='What to export.')
+    parser.add_argument('output', help='Output file; the extension picks the format.')
+    parser.add_argument('-start', '--start_date', required=True, help='Start date in MM/DD/YYYY format.')
+    parser.add_argument('-end', '--end_date', required=True, help='End date in MM/DD/YYYY format.')
+    parser.add_argument('-camera', '--camera_id', help='Camera to export (required for lpr).')
+    args = parser.parse_args()
+
+    start = datetime.strptime(args.start_date, '%m/%d/%Y')
+    end = datetime.strptime(args.end_date, '%m/%d/%Y')
+
+    if args.source == 'helix':
+        from library.helix_vapi import HelixVapi
+        items = HelixVapi().iter_helix_events(
+            camera_ids=[args.camera_id] if args.camera_id else None,
+            event_start_time_ms=int(start.timestamp() * 1000),
+            event_end_time_ms=int(end.timestamp() * 1000),
+        )
+    else:
+        if not args.camera_id:
+            parser.error("--camera_id is required for lpr exports")
+        from library.lpr_vapi import LprVapi
+        items = LprVapi().iter_lpr_detections(args.camera_id, int(start.timestamp()), int(end.timestamp()))
+
+    count = export(items, args.output)
+    print(f"Exported {count} records to {args.output}")
+
+if __name__ == "__main__":
+    main()
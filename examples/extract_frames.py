@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+import sys
+import os
+import argparse
+from datetime import datetime
+# Add the project root directory to the sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from library.frames import FrameExtractor
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract thumbnails and frame indexes from footage, either while downloading it or from existing files.")
+    parser.add_argument('videos', nargs='*', help='Existing video files to process. Without any, footage is downloaded first.')
+    parser.add_argument('-o', '--output', default='frames', help='Output directory.')
+    parser.add_argument('-i', '--interval', type=float, default=10, help='Seconds between frames.')
+    parser.add_argument('-k', '--keyframes', action='store_true', help='Extract keyframes instead of fixed-interval frames.')
+    parser.add_argument('-w', '--workers', type=int, help='Worker processes (defaults to the number of cores).')
+    parser.add_argument('-start', '--start_date', help='Download start in MM/DD/YYYY format.')
+    parser.add_argument('-end', '--end_date', help='Download end in MM/DD/YYYY format.')
+    args = parser.parse_args()
+
+    with FrameExtractor(args.output, interval=args.interval, keyframes_only=args.keyframes, max_workers=args.workers) as extractor:
+        if args.videos:
+            for video in args.videos:
+                extractor.submit(video)
+        else:
+            if not (args.start_date and args.end_date):
+                parser.error("--start_date and --end_date are required when downloading footage")
+            from library.camera_vapi import CameraVapi
+            vcam = CameraVapi()
+            start = datetime.strptime(args.start_date, '%m/%d/%Y')
+            end = datetime.strptime(args.end_date, '%m/%d/%Y')
+            vcam.download_all_cameras(vcam.org_id, start, end, on_chunk=extractor.submit)
+
+    print(f"Indexed {len(extractor.results)} videos into {args.output}, {len(extractor.errors)} failed.")
+
+if __name__ == "__main__":
+    main()
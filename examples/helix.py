@@ -3,55 +3,13 @@ import sys
 import os
 # Add the project root directory to the sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-import json
-import serial
 import time
-from pprint import pprint
 from library.helix_vapi import HelixVapi
+from library.sensor_bridge import SerialRadarBridge, DetectionCoalescer, FakeRadar, find_serial_device, helix_radar_handler, open_pty_pair
 
 SPEEDING = 30
-
-def connect_to_serial():
-    for i in range(10):  # Try /dev/ttyACM0 to /dev/ttyACM9
-        try:
-            device_name = f"/dev/ttyACM{i}"
-            ser = serial.Serial(device_name)
-            ser.flushInput()
-            print(f"Connected to {device_name}")
-            return ser
-        except serial.SerialException:
-            print(f"Failed to connect to {device_name}")
-    # sourcery skip: raise-specific-error
-    raise Exception("Unable to connect to any serial device")
-
-def format_helix_and_post_event(vapi, org_id, camera_id, event_type_uid, direction, velocity):
-    new_direction = "East" if direction == "inbound" else "West"
-    read_time = int(time.time() * 1000)  # Convert to milliseconds
-    attributes = {
-        "direction": new_direction,
-        "mph": velocity
-    }
-    post_event(vapi, org_id, camera_id, attributes, read_time, event_type_uid)
-
-def post_event(vapi, org_id, camera_id, attributes, time_ms, event_type_uid):
-    response = vapi.create_helix_event(
-        org_id=org_id,
-        camera_id=camera_id,
-        attributes=attributes,
-        time_ms=time_ms,
-        event_type_uid=event_type_uid,
-    )
-
-def parse_radar_data(vapi, org_id, camera_id, event_type_uid, data):
-    try:
-        json_data = json.loads(data)
-        direction = json_data.get("direction")
-        velocity = abs(int(json_data.get("DetectedObjectVelocity", 0)))
-        print(f"Direction: {direction}, Velocity: {velocity}")
-        if velocity > SPEEDING:
-            format_helix_and_post_event(vapi, org_id, camera_id, event_type_uid, direction, velocity)
-    except json.JSONDecodeError:
-        print(f"Failed to decode JSON: {data}")
+# Seconds of silence that separate one vehicle from the next
+BURST_GAP = 0.75
 
 def main():
     # Initialize the Vapi instance
@@ -61,19 +19,32 @@ def main():
     camera_id = "663c5bbf-e033-40fb-b9f5-e0437560840f"
     event_type_id = "a4cde31e-e984-4fcc-a026-dbd5c80d13e8"
 
-    # Connect to the serial device
-    ser = connect_to_serial()
-
-    # Main loop to read and process radar data
-    while True:
-        try:
-            if ser.in_waiting > 0:
-                data = ser.readline().decode('utf-8').strip()
-                parse_radar_data(vapi, org_id, camera_id, event_type_id, data)
-            time.sleep(0.1)
-        except Exception as e:
-            print(f"Error: {e}")
-            time.sleep(1)  # Add delay to prevent high CPU usage
+    # Find the radar; --fake runs against a pseudo-terminal stand-in instead
+    if "--fake" in sys.argv:
+        master_fd, device_name = open_pty_pair()
+        print(f"Using fake radar on {device_name}")
+    else:
+        device_name = find_serial_device()
+        if device_name is None:
+            # sourcery skip: raise-specific-error
+            raise Exception("Unable to connect to any serial device")
+        print(f"Connected to {device_name}")
+
+    # Readings are picked up as soon as they arrive and posted off the read loop
+    handler = helix_radar_handler(vapi, camera_id, event_type_id, min_speed=SPEEDING, org_id=org_id)
+    # One passing vehicle produces a burst of readings; post one event per burst
+    bridge = SerialRadarBridge(device_name, handler, coalescer=DetectionCoalescer(gap=BURST_GAP))
+    if "--fake" in sys.argv:
+        bridge.start()
+        radar = FakeRadar(master_fd)
+        for burst in ((12, 14, 13), (38, 41, 39, 35), (-33, -37, -36)):
+            for velocity in burst:
+                radar.send(direction="inbound" if velocity > 0 else "outbound", velocity=velocity)
+                time.sleep(0.05)
+            time.sleep(BURST_GAP * 2)
+        bridge.stop()
+    else:
+        bridge.run_forever()
 
 if __name__ == "__main__":
     main()
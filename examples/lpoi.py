@@ -7,6 +7,7 @@ from pprint import pprint
 # Add the project root directory to the sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from library.lpr_vapi import LprVapi
+from library.daemon import client_for
 
 def main():
     # Initialize argument parser
@@ -15,10 +16,13 @@ def main():
     parser.add_argument('-u', '--update', metavar='plate', help='Update a license plate in the list of interest.')
     parser.add_argument('-d', '--delete', metavar='plate', help='Delete a license plate from the list of interest.')
     parser.add_argument('-desc', '--description', metavar='desc', help='Description for the license plate (optional).')
+    parser.add_argument('-s', '--sync', metavar='file', help='Reconcile the list of interest against a CSV/JSON file.')
+    parser.add_argument('--dry-run', action='store_true', help='With --sync, print the plan without making changes.')
+    parser.add_argument('--keep-missing', action='store_true', help='With --sync, do not delete plates missing from the file.')
     
     args = parser.parse_args()
-    # Initialize the Vapi instance
-    vlpr = LprVapi()
+    # Use the warm client in the local daemon (examples/vapid.py) when it is running
+    vlpr = client_for("lpr") or LprVapi()
     description = args.description or "No description provided"
     if args.add:
         result = vlpr.create_license_plate_of_interest(args.add, description)
@@ -37,10 +41,22 @@ def main():
     elif args.delete:
         result = vlpr.delete_license_plate_of_interest(args.delete)
         print(result['status'])
-        
+
+    elif args.sync:
+        # Load the file here so a relative path resolves against this script, not the daemon
+        plan = vlpr.sync_license_plates_of_interest(LprVapi.load_license_plates_of_interest(args.sync), dry_run=args.dry_run, delete_missing=not args.keep_missing)
+        for action in ("create", "update", "delete"):
+            print(f"{action}: {len(plan[action])}")
+        if args.dry_run:
+            pprint(plan)
+        else:
+            failed = [result for result in plan["results"] if result[2] != 200]
+            print(f"Applied {len(plan['results']) - len(failed)} changes, {len(failed)} failed.")
+            for action, plate, status in failed:
+                print(f"Failed to {action} plate {plate}: {status}")
 
     else:
-        print("Please specify an action: --add (-a), --update (-u),  or --delete (-d)")
+        print("Please specify an action: --add (-a), --update (-u), --delete (-d) or --sync (-s)")
         parser.print_help()
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ from datetime import datetime
 # Add the project root directory to the sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from library.lpr_vapi import LprVapi
+from library.daemon import client_for
 
 def download_image(url, output_folder, filename):
     # Make sure the output folder exists
@@ -36,8 +37,8 @@ def main():
     start_timestamp = int(datetime.strptime(args.start_date, '%m/%d/%Y').timestamp())
     end_timestamp = int(datetime.strptime(args.end_date, '%m/%d/%Y').timestamp())
 
-    # Initialize the Vapi instance
-    vlpr = LprVapi()
+    # Use the warm client in the local daemon (examples/vapid.py) when it is running
+    vlpr = client_for("lpr") or LprVapi()
     page_token = None  # Initialize page_token to None for the first request
     total_downloads = 0
 
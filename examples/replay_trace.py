@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+import sys
+import os
+import argparse
+# Add the project root directory to the sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from library.base_vapi import BaseVapi
+from library.standin import StandinServer
+from library.tracing import DEFAULT_TRACE_PATH, load_trace, replay_trace
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay a recorded request trace (see BaseVapi.enable_tracing) against the local stand-in server."
+    )
+    parser.add_argument('trace', nargs='?', default=DEFAULT_TRACE_PATH, help='Trace file to replay.')
+    parser.add_argument('-s', '--speed', default='1', help='Replay speed: 1, 10, ... or "max".')
+    parser.add_argument('-w', '--workers', type=int, default=32, help='Concurrent requests.')
+    parser.add_argument('--server-latency', type=float, default=0.0, help='Milliseconds the stand-in waits before each response.')
+    parser.add_argument('--url', help='Replay against this base URL instead of starting a stand-in server.')
+    parser.add_argument('--resilient', action='store_true',
+                        help='Keep request coalescing, retries and circuit breakers on. By default every entry is sent exactly once.')
+    args = parser.parse_args()
+
+    entries = load_trace(args.trace)
+    if not entries:
+        parser.error(f"No trace entries in {args.trace}")
+    speed = None if args.speed == 'max' else float(args.speed)
+
+    server = None
+    url = args.url
+    if url is None:
+        server = StandinServer(trace=entries, latency_ms=args.server_latency).start()
+        url = server.url
+    try:
+        vapi = BaseVapi(run_test=False, api_key="standin", streaming_api_key="standin", api_url=url)
+        report = replay_trace(vapi, entries, speed=speed, max_workers=args.workers, raw=not args.resilient)
+    finally:
+        if server is not None:
+            server.stop()
+
+    latency, recorded = report["latency_ms"], report["recorded_latency_ms"]
+    print(f"Replayed {report['requests']} requests in {report['duration_s']:.2f}s ({report['throughput_rps']:.1f} req/s)")
+    print(f"Latency ms    p50 {latency['p50']:.2f}  p90 {latency['p90']:.2f}  p99 {latency['p99']:.2f}  max {latency['max']:.2f}")
+    if recorded["p50"] is not None:
+        print(f"Recorded ms   p50 {recorded['p50']:.2f}  p90 {recorded['p90']:.2f}  p99 {recorded['p99']:.2f}  max {recorded['max']:.2f}")
+    print(f"Error rate    {report['error_rate']:.2%}")
+    print(f"Statuses      {report['statuses']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+import sys
+import os
+import argparse
+from datetime import datetime
+# Add the project root directory to the sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from library.environment_vapi import EnvironmentVapi, INTERVALS
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch environmental sensor history into a local .npz store for dashboards.")
+    parser.add_argument('output', help='Output .npz file; read it back with SensorStore.load().')
+    parser.add_argument('device_ids', nargs='+', help='Sensor device IDs.')
+    parser.add_argument('-start', '--start_date', required=True, help='Start date in MM/DD/YYYY format.')
+    parser.add_argument('-end', '--end_date', required=True, help='End date in MM/DD/YYYY format.')
+    parser.add_argument('-f', '--fields', help='Comma-separated fields, e.g. temperature,humidity,pm_2_5.')
+    parser.add_argument('-i', '--interval', choices=list(INTERVALS), help='Downsample at the source.')
+    parser.add_argument('-w', '--workers', type=int, default=8, help='Concurrent window requests.')
+    args = parser.parse_args()
+
+    start = int(datetime.strptime(args.start_date, '%m/%d/%Y').timestamp())
+    end = int(datetime.strptime(args.end_date, '%m/%d/%Y').timestamp())
+    fields = args.fields.split(",") if args.fields else None
+
+    store = EnvironmentVapi().fetch_sensor_data(args.device_ids, start, end, fields=fields, interval=args.interval, max_workers=args.workers)
+    store.save(args.output)
+    print(f"Stored {len(store)} readings from {len(store.device_ids)} sensors ({store.nbytes / 1e6:.1f} MB) in {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+import sys
+import os
+import argparse
+# Add the project root directory to the sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from library.daemon import VapiDaemon, DEFAULT_SOCKET
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the local Verkada API daemon so CLI tools reuse warm clients, tokens and one rate budget.")
+    parser.add_argument('-s', '--socket', default=DEFAULT_SOCKET, help='Unix socket to listen on.')
+    parser.add_argument('-r', '--rate', type=float, default=10, help='Shared requests per second for all connected scripts.')
+    parser.add_argument('--cache-ttl', type=float, default=30, help='Seconds GET responses stay cached (0 disables).')
+    args = parser.parse_args()
+
+    daemon = VapiDaemon(args.socket, requests_per_second=args.rate, cache_ttl=args.cache_ttl)
+    print(f"Listening on {args.socket}")
+    daemon.serve_forever()
+
+if __name__ == "__main__":
+    main()
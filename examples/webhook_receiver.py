@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+import sys
+import os
+import time
+import argparse
+# Add the project root directory to the sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from library.webhooks import WebhookReceiver, post_sample
+
+def main():
+    parser = argparse.ArgumentParser(description="Receive Verkada webhooks locally and print them as they arrive.")
+    parser.add_argument('-p', '--port', type=int, default=8080, help='Port to listen on.')
+    parser.add_argument('-s', '--secret', default=os.getenv("VERKADA_WEBHOOK_SECRET"), help='Webhook shared secret.')
+    parser.add_argument('--insecure', action='store_true', help='Accept unsigned requests when no secret is set (local testing only).')
+    parser.add_argument('--sample', action='store_true', help='Post signed sample payloads to the receiver and exit.')
+    args = parser.parse_args()
+
+    secret = args.secret
+    if args.sample and secret is None:
+        secret = "sample-secret"
+    if secret is None and not args.insecure:
+        parser.error("A webhook secret is required: pass --secret or set VERKADA_WEBHOOK_SECRET (or --insecure to skip verification)")
+    receiver = WebhookReceiver(secret, port=args.port, insecure=args.insecure)
+
+    @receiver.on("lpr")
+    def plate_seen(detection, payload):
+        print(f"Plate {detection.license_plate} seen by camera {detection.camera_id} at {detection.timestamp}")
+
+    @receiver.on("helix_event")
+    def helix_event(event, payload):
+        print(f"Helix event {event.event_type_uid} on camera {event.camera_id}: {event.attributes}")
+
+    @receiver.on("*")
+    def any_event(data, payload):
+        print(f"Received {payload.get('webhook_type')} webhook")
+
+    receiver.start()
+    print(f"Listening on {receiver.url}")
+    if args.sample:
+        post_sample(receiver.url, secret, {"webhook_type": "lpr", "org_id": "sample", "data": {"camera_id": "sample-camera", "license_plate": "ABC123", "timestamp": int(time.time())}})
+        post_sample(receiver.url, secret, {"webhook_type": "helix_event", "org_id": "sample", "data": {"camera_id": "sample-camera", "event_type_uid": "sample-type", "time_ms": int(time.time() * 1000), "attributes": {"mph": 42}}})
+        receiver.stop()
+        print(receiver.stats)
+        return
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        receiver.stop()
+
+if __name__ == "__main__":
+    main()
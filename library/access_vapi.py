@@ -1,8 +1,269 @@
 from library.base_vapi import BaseVapi
 import library.utils as utils
 import sys
+import json
+from collections import deque
+import requests
+from concurrent.futures import ThreadPoolExecutor
+
+# Credential lists carried on an access user's detail record
+CREDENTIAL_TYPES = ("cards", "license_plates", "mfa_codes", "ble_unlock")
+
 
 class AccessVapi(BaseVapi):
-    def __init__(self, run_test=False):
-        super().__init__(run_test)
-        
+    def __init__(self, run_test=False, **kwargs):
+        super().__init__(run_test, **kwargs)
+
+    def iter_access_users(self, page_size=200):
+        """
+        Streams every access user in the organization.
+
+        HTTP Method: GET
+
+        Args:
+            page_size (int): Number of users requested per page.
+
+        Yields:
+            dict: One access user summary, e.g. {"user_id": "...", "full_name": "...", "email": "..."}.
+        """
+        yield from self.paginate(self.ENDPOINTS['access_users'], "access_members", page_size=page_size)
+
+    def get_access_user(self, user_id):
+        """
+        Retrieves one access user with their groups and credentials.
+
+        HTTP Method: GET
+
+        Args:
+            user_id (str): The access user's ID.
+
+        Returns:
+            dict: The user's access information, including cards, license_plates and access_groups.
+
+        Raises:
+            HTTPError: If the response status code indicates an error.
+        """
+        response = self.send_request(self.ENDPOINTS['access_user'], params={"user_id": user_id})
+        if response.status_code != 200:
+            response.raise_for_status()
+        return self.decode_json(response)
+
+    def iter_access_groups(self, page_size=200):
+        """
+        Streams every access group in the organization.
+
+        HTTP Method: GET
+
+        Yields:
+            dict: One access group summary, e.g. {"group_id": "...", "name": "..."}.
+        """
+        yield from self.paginate(self.ENDPOINTS['access_groups'], "access_groups", page_size=page_size)
+
+    def get_access_group(self, group_id):
+        """
+        Retrieves one access group with its member user IDs.
+
+        HTTP Method: GET
+
+        Args:
+            group_id (str): The access group's ID.
+
+        Returns:
+            dict: The group, e.g. {"group_id": "...", "name": "...", "user_ids": [...]}.
+
+        Raises:
+            HTTPError: If the response status code indicates an error.
+        """
+        response = self.send_request(self.ENDPOINTS['access_group'], params={"group_id": group_id})
+        if response.status_code != 200:
+            response.raise_for_status()
+        return self.decode_json(response)
+
+    @staticmethod
+    def _fetch_concurrently(fetch, keys, max_workers, errors=None):
+        """
+        Yields fetch(key) for every key, in input order, with at most max_workers * 2
+        fetches pending at once so memory stays bounded however many keys there are.
+
+        A key whose fetch raises (e.g. a user deleted since it was listed returns 404)
+        is skipped instead of ending the stream, and (key, "ErrorType: message") is
+        appended to errors when a list is given.
+        """
+        def result(future, key):
+            try:
+                return True, future.result()
+            except requests.exceptions.RequestException as e:
+                if isinstance(e, requests.exceptions.HTTPError):
+                    # Transport failures were already logged by the request path
+                    utils.error_handler.handle(e, f"Skipped {key}", echo=False)
+                if errors is not None:
+                    errors.append((key, f"{type(e).__name__}: {e}"))
+                return False, None
+
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for key in keys:
+                pending.append((executor.submit(fetch, key), key))
+                if len(pending) >= max_workers * 2:
+                    ok, value = result(*pending.popleft())
+                    if ok:
+                        yield value
+            while pending:
+                ok, value = result(*pending.popleft())
+                if ok:
+                    yield value
+
+    def iter_access_group_details(self, group_ids=None, max_workers=8, errors=None):
+        """
+        Streams full access group records, fetching group details concurrently.
+
+        Args:
+            group_ids (iterable, optional): Groups to fetch. Defaults to every group in the organization.
+            max_workers (int): Number of concurrent detail requests.
+            errors (list, optional): Collects (group_id, error message) for groups that could not be fetched; they are skipped.
+
+        Yields:
+            dict: One group with its user_ids, in the order the groups were listed.
+        """
+        if group_ids is None:
+            group_ids = (group["group_id"] for group in self.iter_access_groups())
+        yield from self._fetch_concurrently(self.get_access_group, group_ids, max_workers, errors)
+
+    def iter_access_user_details(self, user_ids=None, max_workers=8, errors=None):
+        """
+        Streams full access user records (groups and credentials), fetching them concurrently.
+
+        Args:
+            user_ids (iterable, optional): Users to fetch. Defaults to every access user.
+            max_workers (int): Number of concurrent detail requests.
+            errors (list, optional): Collects (user_id, error message) for users that could not be fetched; they are skipped.
+
+        Yields:
+            dict: One user's access information, in the order the users were listed.
+        """
+        if user_ids is None:
+            user_ids = (user["user_id"] for user in self.iter_access_users())
+        yield from self._fetch_concurrently(self.get_access_user, user_ids, max_workers, errors)
+
+    def iter_access_credentials(self, user_ids=None, max_workers=8, errors=None):
+        """
+        Streams every credential held by access users, one row per credential.
+
+        Yields:
+            dict: The credential fields plus "user_id" and "credential_type" (e.g. "cards").
+        """
+        for user in self.iter_access_user_details(user_ids, max_workers=max_workers, errors=errors):
+            for credential_type in CREDENTIAL_TYPES:
+                for credential in user.get(credential_type) or []:
+                    row = dict(credential) if isinstance(credential, dict) else {"value": credential}
+                    row["user_id"] = user.get("user_id")
+                    row["credential_type"] = credential_type
+                    yield row
+
+    def add_user_to_access_group(self, group_id, user_id):
+        """
+        Adds an access user to an access group.
+
+        HTTP Method: PUT
+
+        Returns:
+            Response: The API response.
+        """
+        return self.send_request(self.ENDPOINTS['access_group_user'], json={"user_id": user_id},
+                                 params={"group_id": group_id}, method="PUT")
+
+    def remove_user_from_access_group(self, group_id, user_id):
+        """
+        Removes an access user from an access group.
+
+        HTTP Method: DELETE
+
+        Returns:
+            Response: The API response.
+        """
+        return self.send_request(self.ENDPOINTS['access_group_user'],
+                                 params={"group_id": group_id, "user_id": user_id}, method="DELETE")
+
+    @staticmethod
+    def load_access_group_memberships(path):
+        """
+        Loads the desired group memberships from a JSON file of {group_id: [user_id, ...]}.
+
+        Returns:
+            dict: A mapping of group_id to a set of user_ids.
+        """
+        with open(path, "r") as f:
+            data = json.load(f)
+        return {group_id: set(user_ids) for group_id, user_ids in data.items()}
+
+    @staticmethod
+    def diff_access_group_memberships(current, desired, remove_missing=True):
+        """
+        Computes the membership changes needed to turn current into desired.
+
+        Only groups named in desired are touched; other groups are left as they are.
+
+        Args:
+            current (dict): Mapping of group_id to the set of member user_ids in Command.
+            desired (dict): Mapping of group_id to the set of user_ids from the source of truth.
+            remove_missing (bool): Whether members missing from desired should be removed.
+
+        Returns:
+            dict: A plan with "add" and "remove" lists of (group_id, user_id).
+        """
+        plan = {"add": [], "remove": []}
+        for group_id, wanted in desired.items():
+            members = current.get(group_id, set())
+            plan["add"] += [(group_id, user_id) for user_id in sorted(wanted - members)]
+            if remove_missing:
+                plan["remove"] += [(group_id, user_id) for user_id in sorted(members - wanted)]
+        return plan
+
+    def sync_access_group_memberships(self, source, dry_run=False, remove_missing=True, max_workers=8, requests_per_second=10):
+        """
+        Reconciles access group memberships against a local source of truth.
+
+        Current memberships are fetched concurrently for just the groups in the source,
+        diffed against it, and only the needed adds and removes are sent, concurrently,
+        rate limited and in the bulk priority lane.
+
+        HTTP Methods: GET, PUT, DELETE
+
+        Args:
+            source (str or dict): Path to a JSON file, or a {group_id: [user_id, ...]} mapping.
+            dry_run (bool): If True, return the plan without making any writes.
+            remove_missing (bool): Remove members that are not in the source.
+            max_workers (int): Number of concurrent requests.
+            requests_per_second (float): Upper bound on the write rate.
+
+        Returns:
+            dict: The plan with an "errors" list of (group_id, error message) for groups that could
+            not be read (and were skipped), plus a "results" list of (action, group_id, user_id, status)
+            when not a dry run, where status is the status code, or the error message for a write that raised.
+        """
+        desired = self.load_access_group_memberships(source) if isinstance(source, str) else {
+            group_id: set(user_ids) for group_id, user_ids in source.items()
+        }
+        errors = []
+        current = {
+            group["group_id"]: set(group.get("user_ids") or [])
+            for group in self.iter_access_group_details(desired, max_workers=max_workers, errors=errors)
+        }
+        # Groups whose membership could not be read are left alone rather than diffed against nothing
+        for group_id, _ in errors:
+            desired.pop(group_id, None)
+        plan = self.diff_access_group_memberships(current, desired, remove_missing=remove_missing)
+        plan["errors"] = errors
+        if dry_run:
+            return plan
+
+        def write(action, group_id, user_id):
+            if action == "add":
+                return self.add_user_to_access_group(group_id, user_id)
+            return self.remove_user_from_access_group(group_id, user_id)
+
+        jobs = [("add", group_id, user_id) for group_id, user_id in plan["add"]]
+        jobs += [("remove", group_id, user_id) for group_id, user_id in plan["remove"]]
+        statuses = self.apply_bulk_writes(write, jobs, max_workers=max_workers, requests_per_second=requests_per_second)
+        plan["results"] = [job + (status,) for job, status in zip(jobs, statuses)]
+        return plan
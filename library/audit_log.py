@@ -0,0 +1,149 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from datetime import datetime
+
+
+def entry_time(entry):
+    """Returns an audit log entry's timestamp in Unix seconds, accepting epoch numbers or ISO 8601 strings."""
+    value = entry.get("timestamp")
+    if isinstance(value, (int, float)):
+        # Millisecond timestamps are far larger than any plausible seconds value
+        return int(value / 1000) if value > 1e11 else int(value)
+    if isinstance(value, str):
+        if value.isdigit():
+            return entry_time({"timestamp": int(value)})
+        return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+    return 0
+
+
+def entry_fingerprint(entry):
+    """Stable identity for an entry, used to drop duplicates re-read at page and poll boundaries."""
+    return hashlib.sha1(json.dumps(entry, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+class AuditLogCursor:
+    """
+    Persisted position in the audit log: the newest consumed timestamp and the
+    fingerprints of the consumed entries in that second.
+
+    The API's start_time is inclusive, so the next poll re-reads that second and seen
+    filters out what was already delivered. seen only ever holds one second's entries:
+    older fingerprints are dropped as the cursor advances, so the file stays small
+    however far a tailer has to catch up.
+
+    Args:
+        path (str, optional): JSON file to persist to. None keeps the cursor in memory only.
+        start_time (int, optional): Where to begin when no cursor file exists. Defaults to now.
+    """
+    def __init__(self, path=None, start_time=None):
+        self.path = path
+        self.start_time = int(start_time if start_time is not None else time.time())
+        self.seen = set()
+        if path and os.path.exists(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+            self.start_time = data.get("start_time", self.start_time)
+            self.seen = set(data.get("seen", []))
+
+    def save(self):
+        if not self.path:
+            return
+        # Write-then-rename so a crash never leaves a truncated cursor behind
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"start_time": self.start_time, "seen": sorted(self.seen)}, f)
+        os.replace(temp_path, self.path)
+
+
+class AuditLogTailer:
+    """
+    Follows the organization audit log from a persisted cursor, like `tail -f`.
+
+    Each poll pages through entries newer than the cursor and drops entries already
+    consumed (the API's start_time is inclusive, so the boundary second is re-read).
+    Entries are yielded page by page, oldest first within a page, and a page is only
+    recorded in the cursor once the consumer has taken all of it. Delivery is
+    at-least-once: if the consumer fails mid-page, that page comes again on the next
+    poll. follow() polls quickly while entries keep arriving and backs off
+    exponentially when idle.
+
+    Args:
+        vapi (BaseVapi): Any client; only send_request/paginate_pages are used.
+        cursor_path (str, optional): File that stores the cursor between runs.
+        start_time (int, optional): Where to start when there is no cursor yet. Defaults to now.
+        min_interval (float): Poll interval while busy, in seconds.
+        max_interval (float): Longest poll interval while idle.
+        page_size (int): Entries per page.
+    """
+    def __init__(self, vapi, cursor_path=None, start_time=None, min_interval=2.0, max_interval=60.0, page_size=200):
+        self.vapi = vapi
+        self.cursor = AuditLogCursor(cursor_path, start_time)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.page_size = page_size
+        self.interval = min_interval
+        self._stop = threading.Event()
+
+    def poll(self):
+        """
+        Yields entries newer than the cursor, advancing it as pages are consumed.
+
+        The cursor is advanced and saved when the generator is resumed after a page's
+        last entry, i.e. after the consumer has handled the whole page. Pages are
+        expected oldest first, as the API returns them.
+
+        Yields:
+            dict: A new audit log entry.
+        """
+        cursor = self.cursor
+        poll_start = cursor.start_time
+        params = {"start_time": poll_start, "end_time": int(time.time())}
+        pages = self.vapi.paginate_pages(self.vapi.ENDPOINTS['audit_log'], "audit_logs", params=params, page_size=self.page_size)
+        for page in pages:
+            fresh = []
+            for entry in page:
+                timestamp = entry_time(entry)
+                if timestamp < poll_start:
+                    continue
+                fingerprint = entry_fingerprint(entry)
+                if fingerprint not in cursor.seen:
+                    fresh.append((timestamp, fingerprint, entry))
+
+            fresh.sort(key=lambda item: item[0])
+            for _, _, entry in fresh:
+                yield entry
+            # Only reached once the consumer asks for more after the page's last entry
+            if fresh:
+                for timestamp, fingerprint, _ in fresh:
+                    if timestamp > cursor.start_time:
+                        # Everything before this second is consumed; forget its fingerprints
+                        cursor.start_time = timestamp
+                        cursor.seen = {fingerprint}
+                    elif timestamp == cursor.start_time:
+                        cursor.seen.add(fingerprint)
+                cursor.save()
+
+    def follow(self):
+        """
+        Yields new audit log entries as they appear until stop() is called.
+
+        The poll interval drops back to min_interval whenever a poll returns entries,
+        and doubles (up to max_interval) after each empty poll.
+        """
+        self._stop.clear()
+        while not self._stop.is_set():
+            delivered = 0
+            for entry in self.poll():
+                delivered += 1
+                yield entry
+            if delivered:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.interval * 2, self.max_interval)
+            self._stop.wait(self.interval)
+
+    def stop(self):
+        self._stop.set()
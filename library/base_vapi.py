@@ -4,10 +4,36 @@ import configparser
 import library.utils as utils
 import requests
 import time
+import threading
+from contextlib import contextmanager, nullcontext
+from library.cache import ResponseCache
+from library.singleflight import SingleFlight
+from library.codec import get_codec
+from library.resilience import RetryPolicy, CircuitBreakers
+from library.scheduler import RequestScheduler, DEFAULT_WEIGHTS
+from library.tracing import TraceRecorder, DEFAULT_TRACE_PATH
+from library.http2_transport import Http2Transport
+from library.rate_limit import RateLimiter
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.util.request import ACCEPT_ENCODING
 
 VALID_KEY_LENGTH = 100
+HTTP_METHODS = ("GET", "POST", "PATCH", "PUT", "DELETE", "HEAD", "OPTIONS")
+REGION_URLS = {
+    "US": "https://api.verkada.com",
+    "EU": "https://api.eu.verkada.com",
+}
 class BaseVapi:
-    def __init__(self, run_test=True):
+    def __init__(self, run_test=True, api_key=None, org_id=None, region=None, streaming_api_key=None, api_url=None):
+        """
+        Args:
+            run_test (bool): Validate the API key against the audit log on startup.
+            api_key (str, optional): API key to use instead of the environment/credentials file.
+            org_id (str, optional): Organization ID to use instead of ORG_ID from config.ini.
+            region (str, optional): "US" or "EU"; overrides API_URL from config.ini.
+            api_url (str, optional): Base URL to use instead of the region's, e.g. a local stand-in server.
+            streaming_api_key (str, optional): Streaming API key. When api_key is passed explicitly, no streaming key is prompted for.
+        """
         self.api_key = None
         self.streaming_api_key = None
         self.api_key_method = None
@@ -25,18 +51,61 @@ class BaseVapi:
         # Token Data
         self.current_token = None # default to no token
         self.token_expires_in = 0
+        self._token_lock = threading.Lock()
+        self.region = None
+        # Optional RateLimiter shared by every request this client sends
+        self.rate_limiter = None
+        # Optional RequestScheduler with priority lanes, see enable_scheduler()
+        self.scheduler = None
+        # Optional TraceRecorder that logs every HTTP call, see enable_tracing()
+        self.trace_recorder = None
+        self._priority = threading.local()
+
+        # Pooled connections with explicit compression negotiation. ACCEPT_ENCODING
+        # only lists encodings urllib3 can decode here (gzip, deflate, plus br/zstd
+        # when brotli/zstandard are installed).
+        self.session = requests.Session()
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        # Optional multiplexed HTTP/2 transport, see enable_http2()
+        self.http2 = None
+        # JSON codec for request and response bodies, orjson when available
+        self.codec = get_codec()
+        # Transport errors are retried with backoff and then raised to the caller;
+        # an endpoint family that keeps failing trips its breaker and fails fast
+        self.retry_policy = RetryPolicy()
+        self.circuit_breakers = CircuitBreakers()
+        # (connect, read) seconds for each attempt, capped by the retry deadline, so a
+        # hung upstream fails (and counts against its breaker) instead of blocking forever
+        self.request_timeout = (3.05, 30.0)
+
+        # Opt-in GET response cache, see enable_response_cache()
+        self.response_cache = None
+        # Coalesces identical concurrent GETs, set to None to disable
+        self.singleflight = SingleFlight()
         # Load the configuration
         self._load_config()
+        if org_id is not None:
+            self.org_id = org_id
+        if region is not None:
+            self.api_url = REGION_URLS[region.upper()]
+        if api_url is not None:
+            self.api_url = api_url.rstrip("/")
+        self.region = "EU" if self.api_url == REGION_URLS["EU"] else "US"
 
         # Load API keys
-        self.api_key = self._load_api_key(env_var="VERKADA_API_KEY", cred_file=self.api_default_cred_file, key_type="API")
-        self.streaming_api_key = self._load_api_key(env_var="VERKADA_STREAMING_API_KEY", cred_file=self.api_default_streaming_cred_file, key_type="Streaming API")
+        if api_key is not None:
+            self.api_key = api_key
+            self.api_key_method = "API from ARGUMENT"
+            self.streaming_api_key = streaming_api_key
+        else:
+            self.api_key = self._load_api_key(env_var="VERKADA_API_KEY", cred_file=self.api_default_cred_file, key_type="API")
+            self.streaming_api_key = streaming_api_key or self._load_api_key(env_var="VERKADA_STREAMING_API_KEY", cred_file=self.api_default_streaming_cred_file, key_type="Streaming API")
         # Validate the regular API key if run_test is True
         if run_test and self.api_key:
             self._key_test(self.api_key)
 
         # Fetch and set token
-        self.fetch_api_token(self.api_key)
+        self.fetch_api_token()
         # Grouping related constants into dictionaries
         self.PRODUCTS = {
             "camera": "cameras",
@@ -49,6 +118,13 @@ class BaseVapi:
         }
         #https://api.verkada.com/cameras/v1/analytics/lpr/license_plate_of_interest?license_plate_id=0001
         self.ENDPOINTS = {
+            "audit_log": f"{self.PRODUCTS['core']}/{self.api_version}/audit_log",
+            "access_groups": f"{self.PRODUCTS['access']}/{self.api_version}/access_groups",
+            "access_group": f"{self.PRODUCTS['access']}/{self.api_version}/access_groups/group",
+            "access_group_user": f"{self.PRODUCTS['access']}/{self.api_version}/access_groups/group/user",
+            "access_users": f"{self.PRODUCTS['access']}/{self.api_version}/access_users",
+            "access_user": f"{self.PRODUCTS['access']}/{self.api_version}/access_users/user",
+            "environment_data": f"{self.PRODUCTS['sensor']}/{self.api_version}/data",
             "camera_devices": f"{self.PRODUCTS['camera']}/{self.api_version}/devices",
             "camera_footage_token": f"{self.PRODUCTS['camera']}/{self.api_version}/footage/token",
             "alarm_devices": f"{self.PRODUCTS['alarms']}/{self.api_version}/devices",
@@ -57,27 +133,66 @@ class BaseVapi:
             "helix_event_search": f"{self.PRODUCTS['camera']}/{self.api_version}/video_tagging/event/search",
             "helix_event_type": f"{self.PRODUCTS['camera']}/{self.api_version}/video_tagging/event_type",
             "license_plate_of_interest": f"{self.PRODUCTS['camera']}/{self.api_version}/analytics/lpr/license_plate_of_interest",
+            "lpr_images": f"{self.PRODUCTS['camera']}/{self.api_version}/analytics/lpr/images",
+            "lpr_timestamps": f"{self.PRODUCTS['camera']}/{self.api_version}/analytics/lpr/timestamps",
         }
+        self._init_product()
+
+    def _init_product(self):
+        """Sets up product-specific state. Called once by __init__ and when a VapiContext creates a view."""
 
-    def fetch_api_token(self, region: str = "US") -> str:
+    def enable_response_cache(self, max_entries=512, default_ttl=60, ttls=None):
+        """
+        Turns on the LRU+TTL cache for idempotent GET requests made through send_request.
+
+        Writes (POST/PATCH/PUT/DELETE) to an endpoint invalidate its cached reads, so
+        results stay correct while repeated lookups become local.
+
+        Args:
+            max_entries (int): Maximum number of cached responses.
+            default_ttl (float): Seconds a response stays fresh unless overridden in ttls.
+            ttls (dict, optional): Per-endpoint TTLs, keyed by ENDPOINTS name or raw endpoint path.
+
+        Returns:
+            ResponseCache: The cache instance now used by this client.
+        """
+        resolved_ttls = {
+            self.ENDPOINTS.get(name, name): ttl for name, ttl in (ttls or {}).items()
+        }
+        self.response_cache = ResponseCache(max_entries=max_entries, default_ttl=default_ttl, ttls=resolved_ttls)
+        return self.response_cache
+
+    def disable_response_cache(self):
+        self.response_cache = None
+
+    def fetch_api_token(self, region: str = None) -> str:
         """
         Returns a short-lived token to use in the 'x-verkada-auth' header.
         Caches the token and only refreshes if it's expired or about to expire.
+        Defaults to the client's own region.
         """        
         # If the current token is still valid for at least 2 more minutes, reuse it
         if self.current_token and time.time() < (self.token_expires_in - 120):
             return self.current_token
-        
+
+        with self._token_lock:
+            # Another thread may have refreshed it while we waited
+            if self.current_token and time.time() < (self.token_expires_in - 120):
+                return self.current_token
+            return self._refresh_api_token(region or self.region)
+
+    def _refresh_api_token(self, region):
         # Otherwise, request a new token
-        base_url = "https://api.verkada.com" if region == "US" else "https://api.eu.verkada.com"
+        # The client's own region uses its configured URL, which may point at a stand-in server
+        base_url = self.api_url if region == self.region else REGION_URLS.get(region, REGION_URLS["US"])
         url = f"{base_url}/token"
         headers = {
             "Accept": "application/json",
             "x-api-key": self.api_key
         }
-        resp = requests.post(url, headers=headers, timeout=15)
+        resp = self.session.post(url, headers=headers, timeout=15)
         resp.raise_for_status()
-        data = resp.json()
+        data = self.decode_json(resp)
         
         # Parse the returned token and store it globally
         new_token = data["token"]
@@ -109,10 +224,9 @@ class BaseVapi:
             return None
 
     def _load_config(self, config_file="config.ini"):
+        if not os.path.exists(config_file):
+            raise utils.FailedConfigLoad()
         try:
-            if not os.path.exists(config_file):
-                raise utils.FailedConfigLoad()
-
             # Load the API configuration
             config = configparser.ConfigParser()
 
@@ -132,109 +246,371 @@ class BaseVapi:
             print(f"Error: {str(e)}")
 
     def _key_test(self, key):
-        """Stub for testing the API key."""
+        """
+        Tests the API key against the audit log, which should always be reachable.
+
+        Raises:
+            BaseAPIException: The matching HTTP error if the key is rejected.
+        """
         # Make sure the key is the right length and format
-        try:
-            if len(key) != VALID_KEY_LENGTH:
-                raise utils.InvalidAPIKeyLength(len(key))
-        except Exception as e:
-            print(f"Error: {e.message}")
+        if len(key) != VALID_KEY_LENGTH:
+            print(f"Error: {utils.InvalidAPIKeyLength(len(key)).message}")
         # Make sure the key is usable
         # Test API against the AUDIT log which should always be reachable
-        try:
-            #print(key)
-            response = self.send_request(api_key=key, endpoint="core/v1/audit_log?page_size=100")
-            if response.status_code == 200:
-                self.API_KEY = key
-                return 0
-            else:
-                self.handle_http_errors(response.status_code, "core/v1/audit_log?page_size=100", self.API_KEY)
-            print(f"Key tested successfully: {key}")
-        except Exception as e:
-            utils.colors.print_error(e.message)
-            exit(e.code)
+        response = self.send_request(api_key=key, endpoint="core/v1/audit_log?page_size=100")
+        if response.status_code == 200:
+            self.api_key_valid = True
+            return 0
+        self.handle_http_errors(response.status_code, "core/v1/audit_log?page_size=100", key)
     
-<<<<<<< HEAD
     def send_request(self, endpoint=None, api_key=None, data=None, json=None, params=None, method="GET"):
         self.fetch_api_token()
-=======
-    def send_request(self, api_key=None, endpoint=None, data=None, json=None, params=None, method="GET"):
->>>>>>> b2085b13237049b0ccf59de16d401d16079e19f6
-        try:
-            headers = {}
-            if api_key is None:
-                headers = {
-                    "accept": "application/json",
-                    "content-type": "application/json",
-                    "x-api-key": self.api_key
-                }
-            else:
-                headers = {
-                "accept": "application/json",
-                "content-type": "application/json",
-<<<<<<< HEAD
-                "x-verkada-auth": self.current_token
-            }
-=======
-                "x-api-key": api_key
-                }
->>>>>>> b2085b13237049b0ccf59de16d401d16079e19f6
-            url = f"{self.api_url}/{endpoint}"
-
-            # Dynamically build the request arguments
-            request_kwargs = {
-                "headers": headers,
-            }
-
-            if params:
-                request_kwargs["params"] = params
-            if json:
-                request_kwargs["json"] = json
-            if data:
-                request_kwargs["data"] = data
-
-            # Send the appropriate HTTP request based on method
-            if method.upper() == "POST":
-                return requests.post(url, **request_kwargs)
-            elif method.upper() == "PATCH":
-                return requests.patch(url, **request_kwargs)
-            elif method.upper() == "PUT":
-                return requests.put(url, **request_kwargs)
-            elif method.upper() == "DELETE":
-                return requests.delete(url, **request_kwargs)
-            elif method.upper() == "GET":
-                return requests.get(url, **request_kwargs)
-            elif method.upper() == "HEAD":
-                return requests.head(url, **request_kwargs)
-            elif method.upper() == "OPTIONS":
-                return requests.options(url, **request_kwargs)
+        method = method.upper()
+        cache = self.response_cache
+        # The cache is keyed on endpoint and params only, so GETs carrying a body bypass it
+        cacheable = cache is not None and method == "GET" and api_key is None and not data and not json
+        if cacheable:
+            cached = cache.get(endpoint, params)
+            if cached is not None:
+                return cached
+
+        if method == "GET" and self.singleflight is not None and (data is None or isinstance(data, (str, bytes))):
+            # Identical GETs already in flight share the one upstream call; the body is part of the identity
+            body = self.codec.dumps(json) if json else data or None
+            key = (method, api_key, ResponseCache.make_key(endpoint, params), body)
+            response = self.singleflight.do(key, self._send, endpoint, api_key=api_key, data=data, json=json, params=params, method=method)
+        else:
+            response = self._send(endpoint, api_key=api_key, data=data, json=json, params=params, method=method)
+        if cacheable:
+            if response is not None and response.status_code == 200:
+                cache.put(endpoint, params, response)
+        elif cache is not None and method not in ("GET", "HEAD", "OPTIONS"):
+            # Any write to a resource makes its cached reads stale
+            cache.invalidate(endpoint)
+        return response
+
+    def _send(self, endpoint, api_key=None, data=None, json=None, params=None, method="GET"):
+        if method not in HTTP_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        url = f"{self.api_url}/{endpoint}"
+        headers = {
+            "accept": "application/json",
+            "content-type": "application/json",
+        }
+        if api_key is None:
+            # Regular calls use the short-lived token fetched in send_request
+            headers["x-verkada-auth"] = self.current_token
+        else:
+            # An explicit key (e.g. _key_test) is sent as is
+            headers["x-api-key"] = api_key
+
+        # Dynamically build the request arguments
+        request_kwargs = {
+            "headers": headers,
+        }
+
+        if params:
+            request_kwargs["params"] = params
+        if json:
+            # Encode with the configured codec instead of requests' stdlib json
+            request_kwargs["data"] = self.codec.dumps(json)
+        if data:
+            request_kwargs["data"] = data
+
+        policy = self.retry_policy
+        breaker = self.circuit_breakers.for_endpoint(endpoint) if self.circuit_breakers is not None else None
+        deadline = time.monotonic() + policy.deadline if policy is not None else None
+        attempt = 1
+        while True:
+            if breaker is not None:
+                # Outside the try: a fast failure must not count as another failure,
+                # or an open breaker keeps pushing back its own half-open probe
+                breaker.allow()
+            request_kwargs["timeout"] = self._attempt_timeout(deadline)
+            try:
+                response = self._dispatch(method, url, request_kwargs)
+            except requests.exceptions.RequestException as e:
+                if breaker is not None:
+                    breaker.record_failure()
+                retry = policy is not None and policy.should_retry_error(method, e)
+                if retry:
+                    delay = policy.backoff(attempt)
+                    retry = attempt < policy.max_attempts and time.monotonic() + delay <= deadline
+                if not retry:
+                    utils.error_handler.handle(e, f"HTTP request failed for {method} {endpoint}", echo=False)
+                    raise
+            except BaseException:
+                # Not a transport failure (e.g. a rejected priority or a trace write error):
+                # record nothing, but free a half-open probe so the breaker is not stuck
+                if breaker is not None:
+                    breaker.release_probe()
+                raise
             else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-        except requests.exceptions.RequestException as e:
-            utils.error_handler.handle(e, f"HTTP Request failed for URL: {url}")
-            return None
-        except Exception as e:
-            utils.error_handler.handle(e, "Unexpected error in send_request")
-            return None
-    
+                if breaker is not None:
+                    # Only server-side failures count against the endpoint family
+                    if response.status_code >= 500:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                if policy is None or not policy.should_retry_status(method, response.status_code):
+                    return response
+                delay = policy.backoff(attempt, response)
+                if attempt >= policy.max_attempts or time.monotonic() + delay > deadline:
+                    return response
+            time.sleep(delay)
+            attempt += 1
+
+    def _attempt_timeout(self, deadline):
+        """Returns the (connect, read) timeout for one attempt, never running past deadline."""
+        connect, read = self.request_timeout
+        if deadline is None:
+            return connect, read
+        remaining = max(deadline - time.monotonic(), 0.001)
+        return min(connect, remaining), min(read, remaining)
+
+    def _dispatch(self, method, url, request_kwargs):
+        # Hold a scheduler slot (if any) for the whole attempt, including the rate limit wait
+        slot = self.scheduler.slot(self.current_priority()) if self.scheduler is not None else nullcontext()
+        with slot:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            if self.trace_recorder is not None:
+                endpoint = url[len(self.api_url) + 1:]
+                return self.trace_recorder.record(self._transport, method, url, endpoint, request_kwargs)
+            return self._transport(method, url, request_kwargs)
+
+    def _transport(self, method, url, request_kwargs):
+        if self.http2 is not None:
+            return self.http2.request(method, url, request_kwargs, headers=self.session.headers)
+        # Send the appropriate HTTP request based on method
+        if method == "POST":
+            return self.session.post(url, **request_kwargs)
+        elif method == "PATCH":
+            return self.session.patch(url, **request_kwargs)
+        elif method == "PUT":
+            return self.session.put(url, **request_kwargs)
+        elif method == "DELETE":
+            return self.session.delete(url, **request_kwargs)
+        elif method == "GET":
+            return self.session.get(url, **request_kwargs)
+        elif method == "HEAD":
+            return self.session.head(url, **request_kwargs)
+        elif method == "OPTIONS":
+            return self.session.options(url, **request_kwargs)
+        else:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+    def enable_scheduler(self, max_concurrency=8, weights=None, scheduler=None):
+        """
+        Routes every request through a RequestScheduler with priority lanes.
+
+        Requests go to the "normal" lane unless request_priority() says otherwise.
+        Interactive calls jump ahead of bulk traffic while bulk jobs keep a weighted
+        share of the slots. Pass an existing scheduler to share one concurrency budget
+        between clients.
+
+        Args:
+            max_concurrency (int): Requests allowed in flight at once.
+            weights (dict, optional): Lane weights, see scheduler.DEFAULT_WEIGHTS.
+            scheduler (RequestScheduler, optional): Scheduler to share instead of creating one.
+
+        Returns:
+            RequestScheduler: The scheduler now in use.
+        """
+        self.scheduler = scheduler or RequestScheduler(max_concurrency=max_concurrency, weights=weights)
+        return self.scheduler
+
+    def current_priority(self):
+        """The priority lane for requests sent from the calling thread."""
+        return getattr(self._priority, "value", "normal")
+
+    @contextmanager
+    def request_priority(self, priority):
+        """
+        Sends every request made by this thread inside the block in the given lane.
+
+        Usage:
+            with helix_api.request_priority("bulk"):
+                helix_api.delete_helix_event(...)
+
+        Raises:
+            ValueError: If priority is not one of the scheduler's lanes.
+        """
+        lanes = self.scheduler.weights if self.scheduler is not None else DEFAULT_WEIGHTS
+        if priority not in lanes:
+            raise ValueError(f"Unknown priority {priority!r}, expected one of {', '.join(lanes)}")
+        previous = self.current_priority()
+        self._priority.value = priority
+        try:
+            yield
+        finally:
+            self._priority.value = previous
+
+    def enable_tracing(self, path=DEFAULT_TRACE_PATH):
+        """
+        Records every HTTP call this client makes to a JSONL trace file.
+
+        Each attempt (retries included) is one line with the method, endpoint, params,
+        request and response sizes, status and latency. examples/replay_trace.py
+        replays a trace against the local stand-in server.
+
+        Args:
+            path (str): Trace file; lines are appended.
+
+        Returns:
+            TraceRecorder: The recorder, also stored on the client.
+        """
+        self.disable_tracing()
+        self.trace_recorder = TraceRecorder(path)
+        return self.trace_recorder
+
+    def disable_tracing(self):
+        if self.trace_recorder is not None:
+            self.trace_recorder.close()
+            self.trace_recorder = None
+
+    def enable_http2(self, max_connections=4, timeout=30.0, prior_knowledge=False):
+        """
+        Sends API requests over multiplexed HTTP/2 connections (needs httpx[http2]).
+
+        Useful for fan-out jobs: many concurrent requests share a few connections as
+        streams instead of each holding a socket. Responses are still requests.Response
+        objects, so nothing above the transport changes. The token endpoint and
+        streaming requests keep using the HTTP/1.1 session.
+
+        Args:
+            max_connections (int): Upper bound on open connections.
+            timeout (float): Per-request timeout in seconds.
+            prior_knowledge (bool): Skip negotiation, for plain http:// HTTP/2 servers such as the local stand-in.
+
+        Returns:
+            Http2Transport: The transport, also stored on the client.
+        """
+        self.disable_http2()
+        self.http2 = Http2Transport(max_connections=max_connections, timeout=timeout, prior_knowledge=prior_knowledge)
+        return self.http2
+
+    def disable_http2(self):
+        if self.http2 is not None:
+            self.http2.close()
+            self.http2 = None
+
+    def configure_resilience(self, retry_policy=None, circuit_breakers=None, request_timeout=None):
+        """
+        Replaces the retry policy, circuit breakers and per-attempt timeout used by send_request.
+
+        Pass retry_policy=False or circuit_breakers=False to turn either off.
+
+        Args:
+            retry_policy (RetryPolicy, optional): Backoff policy for transport errors and 5xx/429 responses.
+            circuit_breakers (CircuitBreakers, optional): Per-endpoint-family breakers.
+            request_timeout (tuple, optional): (connect, read) seconds allowed for each attempt.
+        """
+        if retry_policy is not None:
+            self.retry_policy = retry_policy or None
+        if circuit_breakers is not None:
+            self.circuit_breakers = circuit_breakers or None
+        if request_timeout is not None:
+            self.request_timeout = tuple(request_timeout)
+
+    def apply_bulk_writes(self, write, jobs, max_workers=8, requests_per_second=10):
+        """
+        Runs write(*job) for every job concurrently, rate limited and in the bulk priority lane.
+
+        A job whose request raises (after retries) does not stop the others; its error is
+        recorded in place of a status code, so the results cover every job, including
+        the writes that were already applied.
+
+        Args:
+            write (callable): Sends one write and returns its Response.
+            jobs (list): Argument tuples for write.
+            max_workers (int): Number of concurrent requests.
+            requests_per_second (float): Upper bound on the write rate.
+
+        Returns:
+            list: One entry per job, in job order: the response status code, or
+            "ErrorType: message" when the request raised.
+        """
+        limiter = RateLimiter(requests_per_second)
+
+        def apply(job):
+            limiter.acquire()
+            try:
+                # Bulk writes yield to interactive calls when a scheduler is enabled
+                with self.request_priority("bulk"):
+                    return write(*job).status_code
+            except requests.exceptions.RequestException as e:
+                return f"{type(e).__name__}: {e}"
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(apply, jobs))
+
+    def paginate(self, endpoint, items_key, params=None, page_size=100, method="GET", json=None):
+        """
+        Yields items from a paginated endpoint, following next_page_token until it runs out.
+
+        Only one page is held in memory at a time, so callers can stream very large
+        result sets.
+
+        Args:
+            endpoint (str): The endpoint to page through.
+            items_key (str): Key of the list of items in each page of the response.
+            params (dict, optional): Extra query parameters sent with every page.
+            page_size (int): Number of items to request per page.
+            method (str): HTTP method, "GET" for list endpoints or "POST" for search endpoints.
+            json (dict, optional): Request body for search endpoints; the page token is sent in the query string.
+
+        Yields:
+            dict: One item from the response list.
+
+        Raises:
+            HTTPError: If a page request fails.
+        """
+        for page in self.paginate_pages(endpoint, items_key, params, page_size, method, json):
+            yield from page
+
+    def paginate_pages(self, endpoint, items_key, params=None, page_size=100, method="GET", json=None):
+        """
+        Like paginate(), but yields each page's list of items, for callers that act once per page.
+
+        Yields:
+            list: The items of one page.
+
+        Raises:
+            HTTPError: If a page request fails.
+        """
+        page_params = dict(params or {})
+        page_params["page_size"] = page_size
+        while True:
+            response = self.send_request(endpoint, params=page_params, json=json, method=method)
+            if response.status_code != 200:
+                response.raise_for_status()
+            page = self.decode_json(response)
+            yield page.get(items_key) or []
+
+            next_token = page.get("next_page_token")
+            if not next_token:
+                break
+            page_params["page_token"] = next_token
+
     def send_streaming_request(self, endpoint, params=None):
         headers = {
             "accept": "application/json",
             "x-api-key": self.streaming_api_key
         }
         url = f"{self.api_url}/{endpoint}"
-        return requests.get(url, headers=headers, params=params)
+        return self.session.get(url, headers=headers, params=params, timeout=self.request_timeout)
+
+    def decode_json(self, response):
+        """Decodes a response body with the client's JSON codec; a faster stand-in for response.json()."""
+        return self.codec.loads(response.content)
+
+    def set_json_codec(self, name):
+        """Switches the JSON codec ("orjson" or "json") used for request and response bodies."""
+        self.codec = get_codec(name)
      
     def handle_http_errors(self, status_code, endpoint, key):
-        if status_code == 400:
-            raise utils.ClientErrorBadRequest(endpoint=endpoint, api_key=key)
-        elif status_code == 401:
-            raise utils.ClientErrorUnauthorized(endpoint=endpoint, api_key=key)
-        elif status_code == 403:
-            raise utils.ClientErrorForbidden(endpoint=endpoint, api_key=key)
-        elif status_code == 404:
-            raise utils.ClientErrorNotFound(endpoint=endpoint, api_key=key)
-        elif status_code == 429:
-            raise utils.ClientErrorTooManyRequests(endpoint=endpoint, api_key=key)
-        elif status_code == 500:
-            raise utils.ServerErrorInternal(endpoint=endpoint, api_key=key)
\ No newline at end of file
+        """Logs and raises the BaseAPIException subclass matching an HTTP error status; does nothing for non-error statuses."""
+        if error := utils.error_for_status(status_code, endpoint=endpoint, api_key=key):
+            utils.error_handler.handle(error, f"HTTP error from {endpoint}", echo=False)
+            raise error
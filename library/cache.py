@@ -0,0 +1,107 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache with per-endpoint TTLs for idempotent GET responses.
+
+    Entries are keyed by endpoint and a normalized form of the query params, so
+    ``{"a": 1, "b": 2}`` and ``{"b": 2, "a": 1}`` hit the same entry. Mutations
+    (POST/PATCH/PUT/DELETE) against an endpoint drop every cached entry for that
+    endpoint, which keeps list-style reads correct after a write.
+
+    Args:
+        max_entries (int): Maximum number of responses held before the least recently used one is evicted.
+        default_ttl (float): Seconds a response stays fresh when no per-endpoint TTL matches.
+        ttls (dict, optional): Mapping of endpoint (or endpoint prefix) to TTL in seconds. The longest matching prefix wins.
+    """
+    def __init__(self, max_entries=512, default_ttl=60, ttls=None):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(endpoint, params=None):
+        """Builds a hashable cache key from an endpoint and its query params."""
+        if not params:
+            return (endpoint, ())
+        if isinstance(params, dict):
+            items = params.items()
+        else:
+            items = params
+        normalized = []
+        for name, value in items:
+            if isinstance(value, (list, tuple)):
+                value = tuple(str(v) for v in value)
+            else:
+                value = str(value)
+            normalized.append((str(name), value))
+        return (endpoint, tuple(sorted(normalized)))
+
+    def ttl_for(self, endpoint):
+        """Returns the TTL for an endpoint, preferring the longest matching configured prefix."""
+        best = None
+        for prefix in self.ttls:
+            if endpoint.startswith(prefix) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        return self.default_ttl if best is None else self.ttls[best]
+
+    def get(self, endpoint, params=None):
+        """Returns a fresh cached response or None."""
+        key = self.make_key(endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, response = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def put(self, endpoint, params, response):
+        """Stores a response, evicting the least recently used entries when full."""
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+        key = self.make_key(endpoint, params)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint):
+        """
+        Drops every cached entry for an endpoint, its sub-resources and its parent resources.
+
+        A write to ``access/v1/access_groups/group/user`` changes what
+        ``access/v1/access_groups/group`` returns, so parents are dropped too.
+        """
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if key[0] == endpoint
+                or key[0].startswith(f"{endpoint}/")
+                or endpoint.startswith(f"{key[0]}/")
+            ]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -3,13 +3,13 @@ import library.utils as utils
 import os
 import json
 import requests
-import tqdm # type: ignore
+from tqdm import tqdm # type: ignore
 import subprocess
 import threading
 from datetime import datetime, timedelta, time
 class CameraVapi(BaseVapi):
-    def __init__(self, run_test=False):
-        super().__init__(run_test)
+    def __init__(self, run_test=False, **kwargs):
+        super().__init__(run_test, **kwargs)
 
     def get_camera_devices(self):
         """
@@ -26,7 +26,7 @@ class CameraVapi(BaseVapi):
         endpoint = f"{self.ENDPOINTS['camera_devices']}"
         response = self.send_request(endpoint=endpoint)
         if response.status_code == 200:
-            return response.json()
+            return self.decode_json(response)
     
     def get_stream_token(self, TTL=3600):
         token_file = "stream_token.cred"
@@ -46,7 +46,7 @@ class CameraVapi(BaseVapi):
         response = self.send_streaming_request(endpoint=self.ENDPOINTS['camera_footage_token'], params={"expiration": TTL})
 
         if response.status_code == 200:
-            token_data = response.json()
+            token_data = self.decode_json(response)
             token = token_data.get("jwt")
 
             # Store the token with the current timestamp
@@ -61,7 +61,7 @@ class CameraVapi(BaseVapi):
     '''
     This is experimental code below to stream and save footage in real time with the streaming api
     '''
-    def get_historic_footage_chunk(self, camera_id, org_id, chunk_start, chunk_end, chunk_num, semaphore, position):
+    def get_historic_footage_chunk(self, camera_id, org_id, chunk_start, chunk_end, chunk_num, semaphore, position, on_chunk=None):
         with semaphore:
             token = self.get_stream_token()
             if not token:
@@ -89,11 +89,15 @@ class CameraVapi(BaseVapi):
             pbar = tqdm(total=total_duration, desc=f"Camera {camera_id} Chunk {chunk_num}", position=position, leave=True)
 
             try:
-                self.download_footage_from_m3u8(final_url, total_duration, camera_id, pbar, chunk_output_file, chunk_num)
+                returncode = self.download_footage_from_m3u8(final_url, total_duration, camera_id, pbar, chunk_output_file, chunk_num)
             except subprocess.CalledProcessError as e:
                 print(f"Error during FFmpeg conversion: {e}")
+                returncode = e.returncode
             finally:
                 pbar.close()
+        # Hand the finished chunk to the next stage outside the semaphore so downloads keep flowing
+        if on_chunk is not None and returncode == 0:
+            on_chunk(chunk_output_file, camera_id, start_time_epoch)
 
     def download_footage_from_m3u8(self, final_url, total_duration, camera_id, pbar, output_file, chunk_num):
         command = [
@@ -120,8 +124,16 @@ class CameraVapi(BaseVapi):
             print(f"\nCamera {camera_id} Chunk {chunk_num}: Footage saved to {output_file}")
         else:
             print(f"\nError during FFmpeg conversion for camera {camera_id} Chunk {chunk_num}: {process.returncode}")
+        return process.returncode
 
-    def download_all_cameras(self, org_id, start_time, end_time, max_concurrent_downloads=3):
+    def download_all_cameras(self, org_id, start_time, end_time, max_concurrent_downloads=3, on_chunk=None):
+        """
+        Downloads footage for every camera in one-hour chunks, then joins each camera's chunks.
+
+        Args:
+            on_chunk (callable, optional): Called as on_chunk(path, camera_id, chunk_start_epoch) as soon as
+                each chunk finishes, e.g. FrameExtractor.submit to extract frames while downloads continue.
+        """
         camera_ids = self.get_camera_ids()
         semaphore = threading.Semaphore(max_concurrent_downloads)
         chunk_size = timedelta(seconds=3600)
@@ -136,7 +148,7 @@ class CameraVapi(BaseVapi):
                 chunk_end = min(chunk_start + chunk_size, end_time)
                 thread = threading.Thread(
                     target=self.get_historic_footage_chunk,
-                    args=(camera_id, org_id, chunk_start, chunk_end, chunk_num, semaphore, position)
+                    args=(camera_id, org_id, chunk_start, chunk_end, chunk_num, semaphore, position, on_chunk)
                 )
                 threads.append(thread)
                 thread.start()
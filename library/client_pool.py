@@ -0,0 +1,158 @@
+import os
+import threading
+import configparser
+from concurrent.futures import ThreadPoolExecutor
+
+from library.context import VapiContext
+from library.rate_limit import RateLimiter
+
+
+class Tenant:
+    """
+    One (org, region, API key) combination managed by a ClientPool.
+
+    Args:
+        name (str): Label used in results, e.g. the org's display name.
+        org_id (str): The organization ID.
+        api_key (str): The org's API key.
+        region (str): "US" or "EU".
+        requests_per_second (float): This tenant's sustained request budget.
+        burst (int, optional): Extra requests allowed in a burst.
+    """
+    def __init__(self, name, org_id, api_key, region="US", requests_per_second=10, burst=None):
+        self.name = name
+        self.org_id = org_id
+        self.api_key = api_key
+        self.region = region.upper()
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+
+    @property
+    def key(self):
+        return (self.org_id, self.region, self.api_key)
+
+    def __repr__(self):
+        # Never print the API key
+        return f"Tenant(name={self.name!r}, org_id={self.org_id!r}, region={self.region!r})"
+
+
+class ClientPool:
+    """
+    Holds one VapiContext per tenant and runs cross-org operations concurrently.
+
+    Every product client for a tenant is a view on that tenant's context, so they share
+    its token, connection pool and RateLimiter. Fanning out over dozens of orgs never
+    exceeds any single org's budget. Contexts are created lazily.
+
+    Args:
+        tenants (iterable): Tenant instances.
+        max_workers (int): Number of tenants worked on at the same time.
+    """
+    def __init__(self, tenants, max_workers=16):
+        self.tenants = {tenant.name: tenant for tenant in tenants}
+        self.max_workers = max_workers
+        self._contexts = {}
+        self._tenant_locks = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, path, max_workers=16):
+        """
+        Loads tenants from an ini file with one section per org:
+
+            [Main Campus]
+            ORG_ID = 48684ea6-...
+            REGION = US
+            API_KEY_FILE = main.cred        ; or API_KEY_ENV = MAIN_VERKADA_KEY, or API_KEY = ...
+            REQUESTS_PER_SECOND = 10
+        """
+        config = configparser.ConfigParser()
+        if not config.read(path):
+            raise FileNotFoundError(path)
+        tenants = []
+        for name in config.sections():
+            section = config[name]
+            if "API_KEY_ENV" in section:
+                api_key = os.getenv(section["API_KEY_ENV"])
+            elif "API_KEY_FILE" in section:
+                with open(section["API_KEY_FILE"], "r") as f:
+                    api_key = f.read().strip()
+            else:
+                api_key = section.get("API_KEY")
+            if not api_key:
+                raise ValueError(f"No API key configured for tenant {name}")
+            tenants.append(Tenant(
+                name,
+                section["ORG_ID"],
+                api_key,
+                region=section.get("REGION", "US"),
+                requests_per_second=section.getfloat("REQUESTS_PER_SECOND", 10),
+                burst=section.getint("BURST", None),
+            ))
+        return cls(tenants, max_workers=max_workers)
+
+    def context(self, tenant):
+        """Returns the tenant's VapiContext, creating it (and fetching its token) on first use."""
+        if isinstance(tenant, str):
+            tenant = self.tenants[tenant]
+        context = self._contexts.get(tenant.key)
+        if context is not None:
+            return context
+        with self._lock:
+            tenant_lock = self._tenant_locks.setdefault(tenant.key, threading.Lock())
+        # Build under the tenant's own lock so racing threads authenticate once,
+        # without making other tenants wait on this one's token request
+        with tenant_lock:
+            context = self._contexts.get(tenant.key)
+            if context is None:
+                context = VapiContext(api_key=tenant.api_key, org_id=tenant.org_id, region=tenant.region)
+                context.rate_limiter = RateLimiter(tenant.requests_per_second, tenant.burst)
+                self._contexts[tenant.key] = context
+        return context
+
+    def client(self, tenant, product):
+        """
+        Returns the tenant's client for a product class (CameraVapi, HelixVapi, LprVapi, ...), creating it on first use.
+
+        Args:
+            tenant (Tenant or str): The tenant or its name.
+            product (type): A BaseVapi subclass.
+        """
+        return self.context(tenant).view(product)
+
+    def run(self, fn, product, tenants=None):
+        """
+        Calls fn(client) for every tenant concurrently.
+
+        Args:
+            fn (callable): Receives the tenant's product client.
+            product (type): The BaseVapi subclass to hand to fn.
+            tenants (iterable, optional): Tenant names to limit the run to. Defaults to all.
+
+        Returns:
+            dict: Tenant name to fn's result, or to the exception it raised.
+        """
+        names = list(tenants) if tenants is not None else list(self.tenants)
+
+        def call(name):
+            try:
+                return name, fn(self.client(name, product))
+            except Exception as e:
+                return name, e
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(len(names), 1))) as executor:
+            return dict(executor.map(call, names))
+
+    def list_camera_devices(self, tenants=None):
+        """Returns every org's camera device list, keyed by tenant name."""
+        from library.camera_vapi import CameraVapi
+        return self.run(lambda client: client.get_camera_devices(), CameraVapi, tenants)
+
+    def push_license_plates_of_interest(self, source, dry_run=False, delete_missing=True, tenants=None):
+        """Reconciles every org's LPOI list against the same CSV/JSON source, keyed by tenant name."""
+        from library.lpr_vapi import LprVapi
+        return self.run(
+            lambda client: client.sync_license_plates_of_interest(source, dry_run=dry_run, delete_missing=delete_missing),
+            LprVapi,
+            tenants,
+        )
@@ -0,0 +1,74 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is the fallback
+    orjson = None
+
+
+class JsonCodec:
+    """
+    Encodes request bodies and decodes response bodies.
+
+    Subclasses work on bytes in both directions so the transport never has to
+    round-trip through str.
+    """
+    name = None
+
+    def dumps(self, obj):
+        raise NotImplementedError
+
+    def loads(self, data):
+        raise NotImplementedError
+
+
+class StdlibJsonCodec(JsonCodec):
+    name = "json"
+
+    def __init__(self):
+        self._encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+    def dumps(self, obj):
+        return self._encode(obj).encode("utf-8")
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec needs orjson. Install it with 'pip install orjson'.")
+
+    def dumps(self, obj):
+        # OPT_NON_STR_KEYS matches json.dumps for int keys; numpy arrays serialize natively
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+CODECS = {
+    "json": StdlibJsonCodec,
+    "orjson": OrjsonCodec,
+}
+
+
+def get_codec(name=None):
+    """
+    Returns a codec instance by name, or the fastest one available when name is None.
+
+    Args:
+        name (str, optional): "orjson" or "json".
+
+    Returns:
+        JsonCodec: The codec.
+    """
+    if name is None:
+        name = "orjson" if orjson is not None else "json"
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown JSON codec: {name}") from None
@@ -0,0 +1,80 @@
+import threading
+
+from library.base_vapi import BaseVapi
+
+
+class VapiContext(BaseVapi):
+    """
+    One authenticated client whose product APIs are lightweight views on it.
+
+    The context loads config and keys, fetches one token, and owns the session,
+    codec, caches, rate limiter, scheduler and resilience settings. Product APIs
+    (client.helix, client.cameras, client.alarms, client.lpr, client.access,
+    client.environment) share the context's instance state outright, so a job that
+    touches several products authenticates once, uses one connection pool, and draws
+    from one rate budget. Settings changed on any view apply to all of them.
+
+    Usage:
+        client = VapiContext()
+        client.rate_limiter = RateLimiter(10)
+        cameras = client.cameras.get_camera_devices()
+        client.helix.create_helix_event(...)
+
+    Args:
+        run_test (bool): Validate the API key on startup.
+        **kwargs: Passed to BaseVapi (api_key, org_id, region, api_url, ...).
+    """
+    def __init__(self, run_test=False, **kwargs):
+        super().__init__(run_test, **kwargs)
+        self._views = {}
+        self._views_lock = threading.Lock()
+
+    def view(self, product):
+        """
+        Returns the product API bound to this context, creating it on first use.
+
+        Args:
+            product (type): A BaseVapi subclass, e.g. HelixVapi.
+        """
+        view = self._views.get(product)
+        if view is not None:
+            return view
+        with self._views_lock:
+            view = self._views.get(product)
+            if view is None:
+                view = product.__new__(product)
+                # Share the instance dict itself: token, session, caches and limits are the same objects
+                view.__dict__ = self.__dict__
+                view._init_product()
+                self._views[product] = view
+        return view
+
+    @property
+    def cameras(self):
+        from library.camera_vapi import CameraVapi
+        return self.view(CameraVapi)
+
+    @property
+    def lpr(self):
+        from library.lpr_vapi import LprVapi
+        return self.view(LprVapi)
+
+    @property
+    def helix(self):
+        from library.helix_vapi import HelixVapi
+        return self.view(HelixVapi)
+
+    @property
+    def alarms(self):
+        from library.alarms_vapi import AlarmVapi
+        return self.view(AlarmVapi)
+
+    @property
+    def access(self):
+        from library.access_vapi import AccessVapi
+        return self.view(AccessVapi)
+
+    @property
+    def environment(self):
+        from library.environment_vapi import EnvironmentVapi
+        return self.view(EnvironmentVapi)
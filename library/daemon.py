@@ -0,0 +1,346 @@
+import os
+import json
+import socket
+import tempfile
+import threading
+import importlib
+import socketserver
+from contextlib import contextmanager
+
+import requests
+
+import library.utils as utils
+from library.rate_limit import RateLimiter
+from library.scheduler import RequestScheduler
+from library.records import Record
+from library.context import VapiContext
+
+def _default_socket_path():
+    # $XDG_RUNTIME_DIR is private to the user; otherwise use a 0700 per-user directory
+    # (created by VapiDaemon.start) rather than a guessable name directly in shared /tmp
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        runtime_dir = os.path.join(tempfile.gettempdir(), f"vapid-{getattr(os, 'getuid', lambda: 'user')()}")
+    return os.path.join(runtime_dir, "vapid.sock")
+
+
+DEFAULT_SOCKET = _default_socket_path()
+
+
+def _owned_by_current_user(path):
+    """True if path (not following symlinks) belongs to the user running this process."""
+    if not hasattr(os, "getuid"):
+        return True
+    return os.lstat(path).st_uid == os.getuid()
+
+# Product name -> (module, class) served by the daemon
+PRODUCTS = {
+    "camera": ("library.camera_vapi", "CameraVapi"),
+    "lpr": ("library.lpr_vapi", "LprVapi"),
+    "helix": ("library.helix_vapi", "HelixVapi"),
+    "alarms": ("library.alarms_vapi", "AlarmVapi"),
+    "access": ("library.access_vapi", "AccessVapi"),
+    "environment": ("library.environment_vapi", "EnvironmentVapi"),
+}
+
+# Product name -> methods a script may call through the daemon. Only API calls are
+# listed: client configuration (enable_tracing, configure_resilience, ...), raw
+# send_request and helpers that write local files stay out of reach, since every
+# connected script shares the one context.
+DAEMON_METHODS = {
+    "camera": frozenset({"get_camera_devices"}),
+    "lpr": frozenset({
+        "get_lpr_images", "iter_lpr_detections", "get_lpr_timestamps", "iter_lpr_timestamps", "iter_plate_timeline",
+        "get_license_plate_of_interest", "iter_license_plates_of_interest", "create_license_plate_of_interest",
+        "update_license_plate_of_interest", "delete_license_plate_of_interest", "sync_license_plates_of_interest",
+    }),
+    "helix": frozenset({
+        "get_helix_event_types", "get_helix_event_type_uid", "create_helix_event_type", "update_helix_event_type",
+        "delete_helix_event_type", "get_helix_event", "create_helix_event", "update_helix_event", "delete_helix_event",
+        "search_helix_events", "iter_helix_events",
+    }),
+    "alarms": frozenset({"get_alarm_devices", "get_alarm_site_ids"}),
+    "access": frozenset({
+        "iter_access_users", "get_access_user", "iter_access_groups", "get_access_group", "iter_access_group_details",
+        "iter_access_user_details", "iter_access_credentials", "add_user_to_access_group",
+        "remove_user_from_access_group", "sync_access_group_memberships",
+    }),
+    "environment": frozenset({"iter_sensor_data", "fetch_sensor_data"}),
+}
+
+
+def _encode_result(value):
+    """json.dumps default hook for the values product methods return."""
+    if isinstance(value, requests.Response):
+        return {"__response__": True, "status_code": value.status_code, "body": value.text}
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if hasattr(value, "__iter__") and hasattr(value, "__next__"):
+        # Generators (iter_* methods) are drained so the client gets the full result
+        return list(value)
+    return str(value)
+
+
+def _decode_result(value):
+    if isinstance(value, dict) and value.get("__response__"):
+        return DaemonResponse(value["status_code"], value["body"])
+    return value
+
+
+class DaemonResponse:
+    """Stand-in for requests.Response returned by calls proxied through the daemon."""
+    def __init__(self, status_code, text):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode("utf-8")
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error", response=self)
+
+
+class DaemonError(Exception):
+    """An exception raised by the product method inside the daemon."""
+    def __init__(self, error_type, message):
+        self.error_type = error_type
+        super().__init__(f"{error_type}: {message}")
+
+
+class VapiDaemon:
+    """
+    Long-lived local server that keeps warm clients for CLI tools.
+
+    Product clients are views on one VapiContext created on first use, so the token,
+    connection pool and response cache stay warm across commands. They share one
+    session and one RateLimiter, so concurrent scripts draw from a single rate-limit
+    budget instead of competing. Commands arrive over a Unix socket (owner-only permissions) as one JSON
+    line: {"product": "lpr", "method": "create_license_plate_of_interest", "args": [...], "kwargs": {...}}.
+    Only the API calls listed in DAEMON_METHODS are served.
+    An optional "priority" ("interactive" by default, or "normal"/"bulk") picks the
+    scheduler lane, so a quick lookup is not stuck behind another script's bulk job.
+
+    Args:
+        socket_path (str): Where to listen.
+        requests_per_second (float): Shared request budget for every connected script.
+        cache_ttl (float): TTL for the warm GET response cache; 0 disables it.
+        max_concurrency (int): Requests in flight at once across every connected script.
+    """
+    def __init__(self, socket_path=DEFAULT_SOCKET, requests_per_second=10, cache_ttl=30, max_concurrency=8):
+        self.socket_path = socket_path
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self.scheduler = RequestScheduler(max_concurrency=max_concurrency)
+        self.cache_ttl = cache_ttl
+        self.context = None
+        self._lock = threading.Lock()
+        self._server = None
+
+    def client(self, product):
+        """Returns the warm client for a product name, creating it on first use."""
+        if product not in PRODUCTS:
+            raise ValueError(f"Unknown product: {product}")
+        with self._lock:
+            if self.context is None:
+                context = VapiContext(run_test=False)
+                context.rate_limiter = self.rate_limiter
+                context.enable_scheduler(scheduler=self.scheduler)
+                if self.cache_ttl:
+                    context.enable_response_cache(default_ttl=self.cache_ttl)
+                self.context = context
+        module_name, class_name = PRODUCTS[product]
+        return self.context.view(getattr(importlib.import_module(module_name), class_name))
+
+    def execute(self, command):
+        """Runs one command dict and returns the response dict."""
+        if not isinstance(command, dict):
+            return {"ok": False, "error": "TypeError", "message": f"Expected a JSON object command, got {type(command).__name__}"}
+        product = command.get("product")
+        method = command.get("method", "")
+        args = command.get("args", [])
+        kwargs = command.get("kwargs", {})
+        priority = command.get("priority", "interactive")
+        if not isinstance(args, list) or not isinstance(kwargs, dict) or not isinstance(priority, str):
+            return {"ok": False, "error": "TypeError", "message": "args must be a list, kwargs an object and priority a string"}
+        if not isinstance(product, str) or not isinstance(method, str) or method not in DAEMON_METHODS.get(product, ()):
+            return {"ok": False, "error": "PermissionError", "message": f"{product}.{method} is not served by the daemon"}
+        try:
+            client = self.client(product)
+            target = getattr(client, method)
+            with client.request_priority(priority):
+                result = target(*args, **kwargs)
+                if hasattr(result, "__iter__") and hasattr(result, "__next__"):
+                    # Drain generators while the priority still applies
+                    result = list(result)
+            return {"ok": True, "result": result}
+        except Exception as e:
+            return {"ok": False, "error": type(e).__name__, "message": str(e)}
+
+    def _make_handler(self):
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                # One connection may send many commands, one JSON line each
+                for line in self.rfile:
+                    try:
+                        reply = daemon.execute(json.loads(line))
+                    except ValueError as e:
+                        reply = {"ok": False, "error": "ValueError", "message": str(e)}
+                    self.wfile.write(json.dumps(reply, default=_encode_result).encode("utf-8") + b"\n")
+                    self.wfile.flush()
+
+        return Handler
+
+    def start(self):
+        """
+        Starts serving on socket_path, creating its directory (mode 0700) if needed.
+
+        Raises:
+            PermissionError: If the socket's directory or an existing socket belongs to another user,
+                or the directory is writable by other users.
+        """
+        directory = os.path.dirname(os.path.abspath(self.socket_path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not _owned_by_current_user(directory) or (hasattr(os, "getuid") and os.stat(directory).st_mode & 0o022):
+            raise PermissionError(f"{directory} must belong to the current user and not be writable by others")
+        if os.path.lexists(self.socket_path):
+            if not _owned_by_current_user(self.socket_path):
+                raise PermissionError(f"{self.socket_path} belongs to another user")
+            if daemon_available(self.socket_path):
+                raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+            # Stale socket from a daemon that did not shut down cleanly
+            os.remove(self.socket_path)
+        old_umask = os.umask(0o077)
+        try:
+            self._server = socketserver.ThreadingUnixStreamServer(self.socket_path, self._make_handler())
+        finally:
+            os.umask(old_umask)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="vapid", daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    def serve_forever(self):
+        self.start()
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            self.stop()
+
+
+class DaemonClient:
+    """
+    Thin client for VapiDaemon. Keeps one connection open for repeated calls.
+
+    Args:
+        socket_path (str): The daemon's socket.
+        timeout (float): Seconds to wait for a reply.
+    """
+    def __init__(self, socket_path=DEFAULT_SOCKET, timeout=300):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._sock = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(self.timeout)
+        self._sock.connect(self.socket_path)
+        self._file = self._sock.makefile("rwb")
+
+    def call(self, product, method, *args, priority="interactive", **kwargs):
+        """
+        Runs product.method(*args, **kwargs) inside the daemon in the given priority lane.
+
+        Raises:
+            DaemonError: If the method raised inside the daemon.
+        """
+        command = {"product": product, "method": method, "args": list(args), "kwargs": kwargs, "priority": priority}
+        with self._lock:
+            if self._sock is None:
+                self._connect()
+            self._file.write(json.dumps(command).encode("utf-8") + b"\n")
+            self._file.flush()
+            line = self._file.readline()
+        if not line:
+            self.close()
+            raise ConnectionError("The daemon closed the connection")
+        reply = json.loads(line)
+        if not reply["ok"]:
+            raise DaemonError(reply["error"], reply["message"])
+        return _decode_result(reply["result"])
+
+    def product(self, product):
+        return DaemonProxy(self, product)
+
+    def close(self):
+        if self._sock is not None:
+            self._file.close()
+            self._sock.close()
+            self._sock = self._file = None
+
+
+class DaemonProxy:
+    """Looks like a product client; every method call is forwarded to the daemon."""
+    def __init__(self, client, product):
+        self._client = client
+        self._product = product
+        self._priority = threading.local()
+
+    @contextmanager
+    def request_priority(self, priority):
+        """Sends every call made by this thread inside the block in the given lane, like BaseVapi.request_priority."""
+        previous = getattr(self._priority, "value", None)
+        self._priority.value = priority
+        try:
+            yield
+        finally:
+            self._priority.value = previous
+
+    def __getattr__(self, method):
+        if method.startswith("_"):
+            raise AttributeError(method)
+
+        def call(*args, **kwargs):
+            priority = getattr(self._priority, "value", None) or "interactive"
+            return self._client.call(self._product, method, *args, priority=priority, **kwargs)
+        return call
+
+
+def daemon_available(socket_path=DEFAULT_SOCKET):
+    """Returns True if a daemon run by the current user is accepting connections on socket_path."""
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return False
+    if not _owned_by_current_user(socket_path):
+        # Someone else's socket would receive every proxied call and its payload
+        utils.error_handler.handle(PermissionError(f"{socket_path} belongs to another user"), "Ignoring daemon socket", echo=False)
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+            return True
+        except OSError:
+            return False
+
+
+def client_for(product, socket_path=DEFAULT_SOCKET):
+    """Returns a DaemonProxy for product if a daemon is running, else None so callers can build a local client."""
+    if daemon_available(socket_path):
+        return DaemonClient(socket_path).product(product)
+    return None
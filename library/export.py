@@ -0,0 +1,197 @@
+import os
+import gzip
+import json
+
+from library.records import Record
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is only needed for Parquet output
+    pa = pq = None
+
+
+def _as_dict(item):
+    return item.to_dict() if isinstance(item, Record) else item
+
+
+def _flatten(item, parent="", out=None):
+    """Flattens nested dicts into dotted column names, e.g. attributes.mph."""
+    if out is None:
+        out = {}
+    for name, value in item.items():
+        column = f"{parent}.{name}" if parent else name
+        if isinstance(value, dict):
+            _flatten(value, column, out)
+        else:
+            out[column] = value
+    return out
+
+
+def export_ndjson(items, path, compress=None, flush_every=1000):
+    """
+    Streams items to a newline-delimited JSON file as they arrive.
+
+    Only one item is held at a time, so exporting from a paginated iterator such as
+    HelixVapi.iter_helix_events() runs in constant memory, and output starts with the
+    first page.
+
+    Args:
+        items (iterable): Dicts or Record instances.
+        path (str): Output file. A ".gz" suffix turns on gzip unless compress says otherwise.
+        compress (bool, optional): Force gzip on or off.
+        flush_every (int): Flush the file after this many lines so tailing readers see progress.
+
+    Returns:
+        int: The number of items written.
+    """
+    if compress is None:
+        compress = path.endswith(".gz")
+    opener = gzip.open if compress else open
+    dumps = json.JSONEncoder(separators=(",", ":"), default=str).encode
+    count = 0
+    with opener(path, "wt", encoding="utf-8") as f:
+        for item in items:
+            f.write(dumps(_as_dict(item)))
+            f.write("\n")
+            count += 1
+            if count % flush_every == 0:
+                f.flush()
+    return count
+
+
+def _unify(schema, other):
+    """Widens schema to also hold other (int -> float, null -> any type, new columns appended)."""
+    try:
+        return pa.unify_schemas([schema, other], promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        raise ValueError(f"Incompatible column types in Parquet export, pass schema= to choose them: {e}") from e
+
+
+def _conform(table, schema):
+    """Casts table to schema, filling columns it lacks with nulls and dropping columns the schema lacks."""
+    columns = []
+    for field in schema:
+        if field.name in table.column_names:
+            # Safe cast: raises instead of truncating, e.g. 30.5 into an int64 column
+            columns.append(table.column(field.name).cast(field.type))
+        else:
+            columns.append(pa.nulls(table.num_rows, field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _group_table(rows, schema=None):
+    """
+    Builds a row group's table from flattened rows.
+
+    Columns come from every row, not just the first, and each column's type is inferred
+    from all of its values, including the fields of nested structs. With a schema,
+    columns it lacks are skipped; _conform then casts the rest to the declared types.
+    """
+    names = dict.fromkeys(name for row in rows for name in row)
+    columns = {}
+    for name in names:
+        if schema is not None and schema.get_field_index(name) < 0:
+            continue
+        values = [row.get(name) for row in rows]
+        try:
+            columns[name] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ValueError(f"Incompatible values in Parquet column {name}, pass schema= to choose its type: {e}") from e
+    return pa.Table.from_arrays(list(columns.values()), names=list(columns))
+
+
+def _rewrite(source_path, target_path, schema, compression):
+    """Copies the row groups of source_path into a new file with a wider schema and returns its open writer."""
+    writer = pq.ParquetWriter(target_path, schema, compression=compression)
+    with pq.ParquetFile(source_path) as source:
+        for i in range(source.num_row_groups):
+            writer.write_table(_conform(source.read_row_group(i), schema))
+    return writer
+
+
+def export_parquet(items, path, row_group_size=50000, compression="zstd", schema=None):
+    """
+    Streams items to a Parquet file, writing one row group every row_group_size items.
+
+    Nested dicts (such as Helix attributes) are flattened into dotted columns. Without
+    a schema, column types are inferred and widened as rows arrive: an int column that
+    later holds a float becomes a float column, a column that was all None picks up the
+    type of its first values, and new columns are added with nulls for earlier rows.
+    Widening rewrites the row groups already written, once per change. Values that
+    cannot share a column (e.g. numbers and strings) raise ValueError. With an explicit
+    schema, columns it lacks are dropped and values that do not fit it raise instead of
+    being truncated.
+
+    The file is written under a temporary name and only moved to path once complete,
+    so a failed export never leaves a partial file behind.
+
+    Args:
+        items (iterable): Dicts or Record instances.
+        path (str): Output file.
+        row_group_size (int): Rows buffered before each row group is written.
+        compression (str): Parquet compression codec.
+        schema (pyarrow.Schema, optional): Column names and types to write.
+
+    Returns:
+        int: The number of items written.
+    """
+    if pq is None:
+        raise ImportError("Parquet export needs pyarrow. Install it with 'pip install pyarrow'.")
+
+    partial = [f"{path}.partial", f"{path}.partial.1"]
+    writer = None
+    file_schema = schema
+    rows = []
+    count = 0
+
+    def write_group():
+        nonlocal writer, file_schema
+        table = _group_table(rows, schema)
+        if file_schema is None:
+            file_schema = table.schema
+        elif schema is None:
+            unified = _unify(file_schema, table.schema)
+            if not unified.equals(file_schema):
+                # Earlier row groups have narrower types; copy them into a new file with the wider schema
+                writer.close()
+                writer = None
+                partial.reverse()
+                writer = _rewrite(partial[1], partial[0], unified, compression)
+                os.remove(partial[1])
+                file_schema = unified
+        if writer is None:
+            writer = pq.ParquetWriter(partial[0], file_schema, compression=compression)
+        writer.write_table(_conform(table, file_schema))
+        rows.clear()
+
+    try:
+        for item in items:
+            rows.append(_flatten(_as_dict(item)))
+            count += 1
+            if len(rows) >= row_group_size:
+                write_group()
+        if rows or writer is None:
+            write_group()
+        writer.close()
+        writer = None
+        os.replace(partial[0], path)
+    finally:
+        if writer is not None:
+            writer.close()
+        for leftover in partial:
+            if os.path.exists(leftover):
+                os.remove(leftover)
+    return count
+
+
+def export(items, path, **kwargs):
+    """
+    Streams items to NDJSON (.ndjson/.jsonl, optionally .gz) or Parquet (.parquet) based on the file name.
+
+    Returns:
+        int: The number of items written.
+    """
+    if path.endswith(".parquet"):
+        return export_parquet(items, path, **kwargs)
+    return export_ndjson(items, path, **kwargs)
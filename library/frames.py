@@ -0,0 +1,184 @@
+import os
+import sys
+import re
+import bisect
+import struct
+import subprocess
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+# Frame index file layout: magic, version, video start (epoch ms, 0 if unknown),
+# frame count, then one little-endian uint32 millisecond offset per frame
+INDEX_MAGIC = b"VFRI"
+INDEX_VERSION = 1
+_HEADER = struct.Struct("<4sHqI")
+_PTS_TIME = re.compile(rb"pts_time:\s*(-?[0-9.]+)")
+
+
+def frame_path(output_dir, stem, number):
+    """Path of the number-th (1-based) frame written for a video."""
+    return os.path.join(output_dir, f"{stem}_{number:06d}.jpg")
+
+
+def extract_frames(video_path, output_dir, interval=10, width=320, keyframes_only=False, start_epoch=None):
+    """
+    Extracts thumbnails from one video with ffmpeg and writes a frame index next to them.
+
+    Runs in a worker process, so it only takes and returns plain values.
+
+    Args:
+        video_path (str): Video file to read.
+        output_dir (str): Directory for the JPEGs and the index.
+        interval (float): Seconds between frames. Ignored with keyframes_only.
+        width (int): Thumbnail width in pixels; height keeps the aspect ratio.
+        keyframes_only (bool): Decode only keyframes and emit each one, which is much cheaper than full decoding.
+        start_epoch (float, optional): Wall-clock time of the video's first frame, stored in the index.
+
+    Returns:
+        str: The index file path.
+
+    Raises:
+        CalledProcessError: If ffmpeg fails.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(video_path))[0]
+    command = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "info", "-threads", "1"]
+    if keyframes_only:
+        command += ["-skip_frame", "nokey"]
+        filters = f"scale={width}:-2,showinfo"
+    else:
+        filters = f"fps=1/{interval},scale={width}:-2,showinfo"
+    command += ["-i", video_path, "-vf", filters, "-fps_mode", "vfr", "-q:v", "5", "-y", os.path.join(output_dir, f"{stem}_%06d.jpg")]
+    result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(result.returncode, command, stderr=result.stderr)
+
+    # showinfo logs one line per frame written, carrying its presentation time
+    offsets = array("I", (int(float(match) * 1000) for match in _PTS_TIME.findall(result.stderr)))
+    index_path = os.path.join(output_dir, f"{stem}.frames.idx")
+    FrameIndex(offsets, int(start_epoch * 1000) if start_epoch is not None else 0).save(index_path)
+    return index_path
+
+
+class FrameIndex:
+    """
+    Compact index of the frames extracted from one video.
+
+    Holds each frame's offset from the start of the video in milliseconds (4 bytes per
+    frame), so review tools can map a time to the nearest thumbnail with a binary
+    search instead of decoding the video.
+
+    Args:
+        offsets_ms (array): Sorted uint32 millisecond offsets, one per frame.
+        start_epoch_ms (int): Wall-clock time of the first frame, 0 if unknown.
+        path (str, optional): Index file the frames belong to; used to locate the JPEGs.
+    """
+    def __init__(self, offsets_ms, start_epoch_ms=0, path=None):
+        self.offsets_ms = offsets_ms
+        self.start_epoch_ms = start_epoch_ms
+        self.path = path
+
+    def __len__(self):
+        return len(self.offsets_ms)
+
+    def save(self, path):
+        offsets = array("I", self.offsets_ms)
+        if offsets.itemsize != 4:
+            raise ValueError("uint32 offsets need a 4-byte array item size")
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, self.start_epoch_ms, len(offsets)))
+            if sys.byteorder != "little":
+                offsets.byteswap()
+            offsets.tofile(f)
+        self.path = path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            magic, version, start_epoch_ms, count = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != INDEX_MAGIC or version != INDEX_VERSION:
+                raise ValueError(f"{path} is not a version {INDEX_VERSION} frame index")
+            offsets = array("I")
+            offsets.fromfile(f, count)
+            if sys.byteorder != "little":
+                offsets.byteswap()
+        return cls(offsets, start_epoch_ms, path)
+
+    def nearest(self, offset_ms):
+        """
+        Returns the frame closest to an offset into the video.
+
+        Returns:
+            tuple: (frame number, offset_ms of that frame), or None if the index is empty.
+        """
+        if not self.offsets_ms:
+            return None
+        position = bisect.bisect_left(self.offsets_ms, offset_ms)
+        if position == len(self.offsets_ms) or (position > 0 and offset_ms - self.offsets_ms[position - 1] <= self.offsets_ms[position] - offset_ms):
+            position -= 1
+        return position + 1, self.offsets_ms[position]
+
+    def frame_at(self, epoch_ms):
+        """Returns the JPEG path of the frame closest to a wall-clock time (needs start_epoch_ms)."""
+        found = self.nearest(epoch_ms - self.start_epoch_ms)
+        if found is None:
+            return None
+        stem = os.path.basename(self.path)[:-len(".frames.idx")]
+        return frame_path(os.path.dirname(self.path), stem, found[0])
+
+
+class FrameExtractor:
+    """
+    Pipeline stage that extracts frames from footage chunks as they finish downloading.
+
+    Chunks are handed to a process pool sized to the machine's cores (ffmpeg runs
+    single-threaded in each worker), so extraction overlaps with the downloads still
+    in flight instead of running as a serial pass afterwards.
+
+    Usage:
+        with FrameExtractor("frames", interval=5) as extractor:
+            vcam.download_all_cameras(org_id, start, end, on_chunk=extractor.submit)
+        print(extractor.results)
+
+    Args:
+        output_dir (str): Root directory; each camera gets a sub-directory.
+        interval (float): Seconds between frames.
+        width (int): Thumbnail width in pixels.
+        keyframes_only (bool): Emit keyframes instead of frames at a fixed interval.
+        max_workers (int, optional): Worker processes. Defaults to the number of cores.
+    """
+    def __init__(self, output_dir="frames", interval=10, width=320, keyframes_only=False, max_workers=None):
+        self.output_dir = output_dir
+        self.interval = interval
+        self.width = width
+        self.keyframes_only = keyframes_only
+        self.executor = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count())
+        self.futures = {}
+        self.results = {}
+        self.errors = {}
+
+    def submit(self, video_path, camera_id=None, start_epoch=None):
+        """Queues a finished video for extraction and returns its Future."""
+        output_dir = os.path.join(self.output_dir, camera_id) if camera_id else self.output_dir
+        future = self.executor.submit(extract_frames, video_path, output_dir, self.interval, self.width, self.keyframes_only, start_epoch)
+        self.futures[video_path] = future
+        future.add_done_callback(lambda done, path=video_path: self._record(path, done))
+        return future
+
+    def _record(self, video_path, future):
+        error = future.exception()
+        if error is None:
+            self.results[video_path] = future.result()
+        else:
+            self.errors[video_path] = error
+            print(f"Frame extraction failed for {video_path}: {error}")
+
+    def close(self, wait=True):
+        self.executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,219 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the columnar helpers
+    np = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("Columnar Helix results need NumPy. Install it with 'pip install numpy'.")
+
+
+_INT64_MIN, _INT64_MAX = -(2 ** 63), 2 ** 63 - 1
+
+
+class _Dictionary:
+    """Assigns dense integer codes to repeated strings such as camera ids."""
+    __slots__ = ("codes", "values")
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def encode(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class HelixEventBatch:
+    """
+    Columnar batch of Helix events backed by NumPy arrays.
+
+    Columns:
+        time_ms (int64): Event timestamps in milliseconds.
+        camera_codes (int32): Index into cameras for each event.
+        event_type_codes (int32): Index into event_types for each event.
+        numeric[name] (int64 or float64): Numeric attributes. Columns whose values are all
+            ints stay int64 so they round-trip exactly; present[name] then marks which
+            events have the attribute. Other numeric columns are float64 with NaN where
+            an event lacks the attribute.
+        categorical[name] (int32): Codes into categories[name] for string/bool attributes, -1 where missing.
+
+    Boolean masks over these columns select events without touching Python dicts, e.g.
+    ``batch.take(batch.attribute("mph") < 30)``.
+    """
+    def __init__(self, time_ms, camera_codes, cameras, event_type_codes, event_types, numeric=None, categorical=None, categories=None,
+                 present=None):
+        _require_numpy()
+        self.time_ms = time_ms
+        self.camera_codes = camera_codes
+        self.cameras = cameras
+        self.event_type_codes = event_type_codes
+        self.event_types = event_types
+        self.numeric = numeric or {}
+        self.categorical = categorical or {}
+        self.categories = categories or {}
+        self.present = present or {}
+
+    @classmethod
+    def from_events(cls, events, attributes=None):
+        """
+        Builds a batch from an iterable of Helix event dicts (e.g. HelixVapi.iter_helix_events()).
+
+        Args:
+            events (iterable): Helix events as returned by the search endpoint.
+            attributes (list, optional): Attribute names to keep. Defaults to every attribute seen.
+
+        Returns:
+            HelixEventBatch: The events in columnar form.
+        """
+        _require_numpy()
+        keep = set(attributes) if attributes is not None else None
+        time_ms = []
+        camera_codes = []
+        event_type_codes = []
+        cameras = _Dictionary()
+        event_types = _Dictionary()
+        # Attribute name -> list of raw values, padded with None for events without it
+        columns = {}
+
+        for row, event in enumerate(events):
+            time_ms.append(event.get("time_ms") or 0)
+            camera_codes.append(cameras.encode(event.get("camera_id")))
+            event_type_codes.append(event_types.encode(event.get("event_type_uid")))
+            for name, value in (event.get("attributes") or {}).items():
+                if keep is not None and name not in keep:
+                    continue
+                column = columns.get(name)
+                if column is None:
+                    column = columns[name] = [None] * row
+                column.append(value)
+            for column in columns.values():
+                if len(column) == row:
+                    column.append(None)
+
+        numeric, categorical, categories, present = {}, {}, {}, {}
+        for name, values in columns.items():
+            given = [value for value in values if value is not None]
+            if given and all(isinstance(value, int) and not isinstance(value, bool) and _INT64_MIN <= value <= _INT64_MAX for value in given):
+                # int64 keeps integers exact (float64 would turn 25 into 25.0 and round values above 2**53)
+                numeric[name] = np.array([0 if value is None else value for value in values], dtype=np.int64)
+                present[name] = np.array([value is not None for value in values], dtype=bool)
+            elif all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in given):
+                numeric[name] = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+            else:
+                lookup = _Dictionary()
+                categorical[name] = np.array([-1 if value is None else lookup.encode(value) for value in values], dtype=np.int32)
+                categories[name] = lookup.values
+
+        return cls(
+            np.array(time_ms, dtype=np.int64),
+            np.array(camera_codes, dtype=np.int32),
+            cameras.values,
+            np.array(event_type_codes, dtype=np.int32),
+            event_types.values,
+            numeric,
+            categorical,
+            categories,
+            present,
+        )
+
+    def __len__(self):
+        return len(self.time_ms)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the array columns."""
+        arrays = [self.time_ms, self.camera_codes, self.event_type_codes, *self.numeric.values(), *self.categorical.values(),
+                  *self.present.values()]
+        return sum(array.nbytes for array in arrays)
+
+    def attribute(self, name):
+        """
+        Returns an attribute column.
+
+        Numeric attributes come back as their stored int64 or float64 column. An integer
+        column with missing values comes back as float64 with NaN in the gaps instead;
+        comparisons against NaN are False, so ``batch.attribute("mph") < 30`` skips
+        events without mph. String attributes come back as an object array of values
+        (None where missing).
+        """
+        if name in self.numeric:
+            column = self.numeric[name]
+            present = self.present.get(name)
+            if present is None or present.all():
+                return column
+            return np.where(present, column, np.nan)
+        if name in self.categorical:
+            lookup = np.array(list(self.categories[name]) + [None], dtype=object)
+            return lookup[self.categorical[name]]
+        raise KeyError(f"No attribute column named '{name}'")
+
+    def attribute_equals(self, name, value):
+        """Returns a mask of events whose categorical attribute equals value, without decoding the column."""
+        try:
+            code = self.categories[name].index(value)
+        except (KeyError, ValueError):
+            return np.zeros(len(self), dtype=bool)
+        return self.categorical[name] == code
+
+    def time_mask(self, start_ms=None, end_ms=None):
+        """Returns a mask of events with start_ms <= time_ms < end_ms."""
+        mask = np.ones(len(self), dtype=bool)
+        if start_ms is not None:
+            mask &= self.time_ms >= start_ms
+        if end_ms is not None:
+            mask &= self.time_ms < end_ms
+        return mask
+
+    def camera_mask(self, camera_ids):
+        """Returns a mask of events from any of the given camera ids."""
+        if isinstance(camera_ids, str):
+            camera_ids = [camera_ids]
+        codes = [self.cameras.index(camera_id) for camera_id in camera_ids if camera_id in self.cameras]
+        return np.isin(self.camera_codes, codes)
+
+    def take(self, selector):
+        """Returns a new batch with the rows picked by a boolean mask or an index array."""
+        return HelixEventBatch(
+            self.time_ms[selector],
+            self.camera_codes[selector],
+            self.cameras,
+            self.event_type_codes[selector],
+            self.event_types,
+            {name: column[selector] for name, column in self.numeric.items()},
+            {name: column[selector] for name, column in self.categorical.items()},
+            self.categories,
+            {name: column[selector] for name, column in self.present.items()},
+        )
+
+    def keys(self):
+        """Yields (camera_id, time_ms, event_type_uid) for each event, the identifiers Helix calls take."""
+        cameras = self.cameras
+        event_types = self.event_types
+        for camera_code, time_ms, event_type_code in zip(self.camera_codes.tolist(), self.time_ms.tolist(), self.event_type_codes.tolist()):
+            yield cameras[camera_code], time_ms, event_types[event_type_code]
+
+    def to_events(self):
+        """Rebuilds the list of event dicts, e.g. to hand a filtered selection to existing code."""
+        events = []
+        numeric = {name: column.tolist() for name, column in self.numeric.items()}
+        # NaN marks missing floats; integer columns carry an explicit presence mask
+        present = {name: self.present[name].tolist() if name in self.present else [value == value for value in column]
+                   for name, column in numeric.items()}
+        categorical = {name: column.tolist() for name, column in self.categorical.items()}
+        for row, (camera_id, time_ms, event_type_uid) in enumerate(self.keys()):
+            attributes = {name: column[row] for name, column in numeric.items() if present[name][row]}
+            for name, column in categorical.items():
+                if column[row] >= 0:
+                    attributes[name] = self.categories[name][column[row]]
+            events.append({
+                "camera_id": camera_id,
+                "time_ms": time_ms,
+                "event_type_uid": event_type_uid,
+                "attributes": attributes,
+            })
+        return events
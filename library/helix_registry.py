@@ -0,0 +1,148 @@
+import threading
+import library.utils as utils
+
+# Python types accepted for each Helix attribute data type. bool is a subclass of
+# int, so it is rejected explicitly for the numeric types in _check_value.
+HELIX_ATTRIBUTE_TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "float": (int, float),
+    "boolean": (bool,),
+}
+
+
+class HelixEventTypeRegistry:
+    """
+    Cached view of the organization's Helix event types, indexed by uid and by name.
+
+    The registry loads with a single get_helix_event_types call on first use and is
+    invalidated by HelixVapi whenever an event type is created, updated or deleted, so
+    the next lookup reloads it. Attribute payloads can be checked against the cached
+    schema before create_helix_event sends them.
+
+    Args:
+        helix_vapi (HelixVapi): The client used to load event types.
+    """
+    def __init__(self, helix_vapi):
+        self.helix_vapi = helix_vapi
+        self._by_uid = None
+        self._by_name = None
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """
+        Reloads every event type from the API.
+
+        Returns:
+            tuple: The new (by_uid, by_name) maps.
+        """
+        response = self.helix_vapi.get_helix_event_types()
+        if response.status_code != 200:
+            response.raise_for_status()
+        event_types = self.helix_vapi.decode_json(response).get("event_types", [])
+        by_uid = {event_type["event_type_uid"]: event_type for event_type in event_types}
+        by_name = {event_type["name"]: event_type for event_type in event_types if event_type.get("name")}
+        with self._lock:
+            self._by_uid, self._by_name = by_uid, by_name
+        return by_uid, by_name
+
+    def invalidate(self):
+        """Marks the cache stale; the next lookup reloads it."""
+        with self._lock:
+            self._by_uid = self._by_name = None
+
+    def _ensure_loaded(self):
+        """
+        Returns the current (by_uid, by_name) maps, loading them first if needed.
+
+        Lookups use the returned maps rather than the attributes, which a concurrent
+        invalidate() may reset to None at any time.
+        """
+        with self._lock:
+            by_uid, by_name = self._by_uid, self._by_name
+        if by_uid is None:
+            return self.refresh()
+        return by_uid, by_name
+
+    def get(self, event_type_uid, refresh_on_miss=True):
+        """Returns the event type dict for a uid, reloading once on a miss in case it was created elsewhere."""
+        by_uid, _ = self._ensure_loaded()
+        event_type = by_uid.get(event_type_uid)
+        if event_type is None and refresh_on_miss:
+            by_uid, _ = self.refresh()
+            event_type = by_uid.get(event_type_uid)
+        return event_type
+
+    def get_by_name(self, name, refresh_on_miss=True):
+        """Returns the event type dict for a name, reloading once on a miss."""
+        _, by_name = self._ensure_loaded()
+        event_type = by_name.get(name)
+        if event_type is None and refresh_on_miss:
+            _, by_name = self.refresh()
+            event_type = by_name.get(name)
+        return event_type
+
+    def resolve_uid(self, name_or_uid):
+        """
+        Resolves an event type name or uid to its uid.
+
+        Raises:
+            UnknownHelixEventType: If no event type has that uid or name.
+        """
+        by_uid, _ = self._ensure_loaded()
+        if name_or_uid in by_uid:
+            return name_or_uid
+        event_type = self.get_by_name(name_or_uid)
+        if event_type is None:
+            raise utils.UnknownHelixEventType(name_or_uid)
+        return event_type["event_type_uid"]
+
+    def names(self):
+        _, by_name = self._ensure_loaded()
+        return sorted(by_name)
+
+    @staticmethod
+    def _check_value(data_type, value):
+        accepted = HELIX_ATTRIBUTE_TYPES.get(data_type)
+        if accepted is None:
+            # Unknown schema type, let the API decide
+            return True
+        if isinstance(value, bool) and data_type != "boolean":
+            return False
+        return isinstance(value, accepted)
+
+    def find_problems(self, event_type_uid, attributes):
+        """
+        Lists the ways attributes do not match the event type's schema.
+
+        Returns:
+            list: Human-readable problems; empty if the attributes are valid.
+
+        Raises:
+            UnknownHelixEventType: If the event type does not exist.
+        """
+        event_type = self.get(event_type_uid)
+        if event_type is None:
+            raise utils.UnknownHelixEventType(event_type_uid)
+        if not isinstance(attributes, dict):
+            return [f"attributes must be a dict, got {type(attributes).__name__}"]
+
+        schema = event_type.get("event_schema") or {}
+        problems = []
+        for name, value in attributes.items():
+            if name not in schema:
+                problems.append(f"'{name}' is not in the schema")
+            elif not self._check_value(schema[name], value):
+                problems.append(f"'{name}' should be {schema[name]}, got {type(value).__name__}")
+        return problems
+
+    def validate(self, event_type_uid, attributes):
+        """
+        Checks attributes against the cached schema before they are posted.
+
+        Raises:
+            InvalidHelixAttributes: If any attribute is unknown or has the wrong type.
+            UnknownHelixEventType: If the event type does not exist.
+        """
+        if problems := self.find_problems(event_type_uid, attributes):
+            raise utils.InvalidHelixAttributes(event_type_uid, problems)
@@ -1,6 +1,8 @@
 from library.base_vapi import BaseVapi
 import library.utils as utils
 import pprint as pprint
+from library.helix_registry import HelixEventTypeRegistry
+from library.helix_columns import HelixEventBatch
 class HelixVapi(BaseVapi):
     """
     HelixVapi provides a set of methods for interacting with the Helix API, allowing management of events, event types, 
@@ -31,14 +33,29 @@ class HelixVapi(BaseVapi):
         create_helix_event_type(event_schema):
             Creates a new Helix event type.
 
-        create_helix_event(camera_id, attributes, time_ms, event_type_uid, org_id=None):
+        create_helix_event(camera_id, attributes, time_ms, event_type_uid, org_id=None, validate=True):
             Creates a new Helix event.
 
         search_helix_events(attribute_filters=None, camera_ids=None, event_start_time_ms=None, event_end_time_ms=None, event_uid=None, flagged=None, keywords=None):
             Searches for Helix events based on provided filters.
+
+        iter_helix_events(page_size=100, **filters):
+            Streams search results across pages.
+
+        search_helix_events_columnar(attributes=None, page_size=100, **filters):
+            Returns search results as a columnar HelixEventBatch for vectorized filtering.
+
+        get_helix_event_type_uid(event_name):
+            Resolves an event type name to its uid using the cached event type registry.
+
+    Attributes:
+        event_types (HelixEventTypeRegistry): Cached event types indexed by uid and name, used to validate attributes locally.
     """
-    def __init__(self, run_test=False):
-        super().__init__(run_test)
+    def __init__(self, run_test=False, **kwargs):
+        super().__init__(run_test, **kwargs)
+
+    def _init_product(self):
+        self.event_types = HelixEventTypeRegistry(self)
     
     def delete_helix_event(self, camera_id, event_time_ms, event_uid):
         """
@@ -78,7 +95,9 @@ class HelixVapi(BaseVapi):
         params = {
             "event_type_uid": event_uid
         }
-        return self.send_request(self.ENDPOINTS['helix_event'], params=params, method="DELETE")
+        response = self.send_request(self.ENDPOINTS['helix_event_type'], params=params, method="DELETE")
+        self.event_types.invalidate()
+        return response
 
     def get_helix_event(self, camera_id, event_time_ms, event_uid):
         """
@@ -168,7 +187,9 @@ class HelixVapi(BaseVapi):
             HTTPError: If the response status code indicates an error.
         """
         params = {"event_type_uid": event_type_uid}
-        return self.send_request(self.ENDPOINTS['helix_event_type'], json=event_schema, params=params, method="PATCH")
+        response = self.send_request(self.ENDPOINTS['helix_event_type'], json=event_schema, params=params, method="PATCH")
+        self.event_types.invalidate()
+        return response
     
     def create_helix_event_type(self, event_schema):
         """
@@ -183,9 +204,26 @@ class HelixVapi(BaseVapi):
         Raises:
             HTTPError: If the response status code indicates an error.
         """
-        return self.send_request(self.ENDPOINTS['helix_event_type'], json=event_schema, method="POST")
+        response = self.send_request(self.ENDPOINTS['helix_event_type'], json=event_schema, method="POST")
+        self.event_types.invalidate()
+        return response
+
+    def get_helix_event_type_uid(self, event_name):
+        """
+        Resolves a Helix event type name to its uid without a round trip once the registry is loaded.
+
+        Args:
+            event_name (str): The name of the event type (a uid is returned unchanged).
+
+        Returns:
+            str: The event type uid.
+
+        Raises:
+            UnknownHelixEventType: If no event type has that name.
+        """
+        return self.event_types.resolve_uid(event_name)
     
-    def create_helix_event(self, camera_id, attributes, time_ms, event_type_uid, org_id=None):
+    def create_helix_event(self, camera_id, attributes, time_ms, event_type_uid, org_id=None, validate=True):
         """
         Creates a new Helix event.
 
@@ -195,13 +233,17 @@ class HelixVapi(BaseVapi):
             time_ms (int): The timestamp of the event in milliseconds since the epoch.
             event_type_uid (str): The unique identifier of the event type.
             org_id (str, optional): The organization ID. If not provided, the default org_id of the instance is used.
+            validate (bool): Check the attributes against the cached event type schema before posting.
 
         Returns:
             dict: The API response containing the details of the newly created event.
 
         Raises:
             HTTPError: If the response status code indicates an error.
+            InvalidHelixAttributes: If validate is True and the attributes do not match the schema.
         """
+        if validate:
+            self.event_types.validate(event_type_uid, attributes)
         if org_id is None:
             org_id=self.org_id
         headers = {
@@ -216,6 +258,25 @@ class HelixVapi(BaseVapi):
         }
         return self.send_request(endpoint=self.ENDPOINTS['helix_event'], json=data, params=org_id, method="POST")
     
+    def _search_payload(self, attribute_filters=None, camera_ids=None, event_start_time_ms=None, event_end_time_ms=None, event_uid=None, flagged=None, keywords=None):
+        payload = {}
+        
+        if attribute_filters is not None:
+            payload['attribute_filters'] = attribute_filters
+        if camera_ids is not None:
+            payload['camera_ids'] = ','.join(camera_ids)  # Convert list to comma-separated string
+        if event_start_time_ms is not None:
+            payload['event_start_time_ms'] = event_start_time_ms
+        if event_end_time_ms is not None:
+            payload['event_end_time_ms'] = event_end_time_ms
+        if event_uid is not None:
+            payload['event_uid'] = event_uid
+        if flagged is not None:
+            payload['flagged'] = flagged
+        if keywords is not None:
+            payload['keywords'] = keywords
+        return payload
+
     def search_helix_events(self, attribute_filters=None, camera_ids=None, event_start_time_ms=None, event_end_time_ms=None, event_uid=None, flagged=None, keywords=None):
         """
         Searches for Helix events based on provided filters.
@@ -235,22 +296,38 @@ class HelixVapi(BaseVapi):
             dict: The search results from the API.
         """
          # Construct the query parameters dynamically
-        
-        payload = {}
-        
-        if attribute_filters is not None:
-            payload['attribute_filters'] = attribute_filters
-        if camera_ids is not None:
-            payload['camera_ids'] = ','.join(camera_ids)  # Convert list to comma-separated string
-        if event_start_time_ms is not None:
-            payload['event_start_time_ms'] = event_start_time_ms
-        if event_end_time_ms is not None:
-            payload['event_end_time_ms'] = event_end_time_ms
-        if event_uid is not None:
-            payload['event_uid'] = event_uid
-        if flagged is not None:
-            payload['flagged'] = flagged
-        if keywords is not None:
-            payload['keywords'] = keywords
+        payload = self._search_payload(attribute_filters, camera_ids, event_start_time_ms, event_end_time_ms, event_uid, flagged, keywords)
         
         return self.send_request(self.ENDPOINTS['helix_event_search'], data=None, json=payload, params=None, method="POST")
+
+    def iter_helix_events(self, page_size=100, **filters):
+        """
+        Streams Helix search results page by page instead of returning one large response.
+
+        Args:
+            page_size (int): Number of events requested per page.
+            **filters: Any of the search_helix_events filters.
+
+        Yields:
+            dict: One Helix event.
+        """
+        payload = self._search_payload(**filters)
+        yield from self.paginate(self.ENDPOINTS['helix_event_search'], "events", page_size=page_size, method="POST", json=payload)
+
+    def search_helix_events_columnar(self, attributes=None, page_size=100, **filters):
+        """
+        Searches for Helix events and returns them as a columnar HelixEventBatch backed by NumPy arrays.
+
+        Pages are folded into the columns as they arrive, so the full list of event dicts
+        is never held in memory. Predicates such as ``batch.attribute("mph") < 30`` then
+        become vectorized operations.
+
+        Args:
+            attributes (list, optional): Attribute names to keep as columns. Defaults to every attribute seen.
+            page_size (int): Number of events requested per page.
+            **filters: Any of the search_helix_events filters.
+
+        Returns:
+            HelixEventBatch: The search results in columnar form.
+        """
+        return HelixEventBatch.from_events(self.iter_helix_events(page_size=page_size, **filters), attributes=attributes)
@@ -0,0 +1,101 @@
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# httpx (with h2) is only needed for the HTTP/2 transport, and is imported on first
+# use so clients that never enable HTTP/2 do not pay for it at startup
+httpx = None
+
+# Connection-specific headers that HTTP/2 forbids (requests' session sets Connection: keep-alive)
+_HOP_BY_HOP = {"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"}
+
+
+def _require_httpx():
+    """Imports httpx and h2, raising an ImportError with install instructions if either is missing."""
+    global httpx
+    try:
+        import httpx as module
+    except ImportError:
+        raise ImportError("The HTTP/2 transport needs httpx with HTTP/2 support. Install it with 'pip install httpx[http2]'.")
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        raise ImportError("The HTTP/2 transport needs the h2 package. Install it with 'pip install httpx[http2]'.")
+    httpx = module
+    return module
+
+
+def _to_requests_response(response, url):
+    """Wraps an httpx response as a requests.Response so callers, caches and error handling work unchanged."""
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted._content = response.content
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted.url = url
+    converted.reason = response.reason_phrase
+    converted.encoding = response.encoding
+    return converted
+
+
+class Http2Transport:
+    """
+    Sends requests over multiplexed HTTP/2 connections with httpx.
+
+    Concurrent requests from any number of threads share a few connections as
+    separate streams, instead of each holding its own HTTP/1.1 socket. Responses and
+    errors are converted to their requests equivalents, so retries, circuit breakers
+    and callers behave exactly as with the default session.
+
+    Args:
+        max_connections (int): Upper bound on open connections; HTTP/2 normally needs one per host.
+        timeout (float): Per-request timeout in seconds.
+        prior_knowledge (bool): Speak HTTP/2 without negotiation, needed for plain http:// servers such as the local stand-in.
+    """
+    def __init__(self, max_connections=4, timeout=30.0, prior_knowledge=False):
+        _require_httpx()
+        self.client = httpx.Client(
+            http1=not prior_knowledge,
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout,
+        )
+
+    def request(self, method, url, request_kwargs, headers=None):
+        """
+        Sends one request.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Full URL.
+            request_kwargs (dict): headers, params, data and an optional (connect, read) timeout, as built by BaseVapi._send.
+            headers (dict, optional): Default headers merged under the request's own (e.g. the session's).
+
+        Returns:
+            requests.Response: The response.
+
+        Raises:
+            requests.exceptions.Timeout: If the request timed out.
+            requests.exceptions.ConnectionError: If the connection failed.
+        """
+        merged = {name: value for name, value in (headers or {}).items() if name.lower() not in _HOP_BY_HOP}
+        merged.update(request_kwargs.get("headers") or {})
+        timeout = request_kwargs.get("timeout")
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        try:
+            response = self.client.request(
+                method,
+                url,
+                headers=merged,
+                params=request_kwargs.get("params"),
+                content=request_kwargs.get("data"),
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        return _to_requests_response(response, str(response.url))
+
+    def close(self):
+        self.client.close()
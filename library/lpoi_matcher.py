@@ -0,0 +1,143 @@
+import threading
+import string
+
+import library.utils as utils
+
+# Characters OCR commonly confuses on plates, mapped to one canonical character
+OCR_CONFUSIONS = {
+    "O": "0",
+    "I": "1",
+    "B": "8",
+}
+
+# Separators that never matter for matching
+PLATE_SEPARATORS = " -._\t"
+
+
+def build_key_table(confusions=None):
+    """
+    Builds a str.translate table that upper-cases, strips separators and (optionally) folds OCR confusions.
+
+    Doing all of that in a single translate call keeps per-detection normalization in C.
+    """
+    table = {ord(c): c.upper() for c in string.ascii_lowercase}
+    table.update({ord(c): None for c in PLATE_SEPARATORS})
+    for source, target in (confusions or {}).items():
+        table[ord(source.upper())] = target
+        table[ord(source.lower())] = target
+    return str.maketrans(table)
+
+
+EXACT_TABLE = build_key_table()
+FUZZY_TABLE = build_key_table(OCR_CONFUSIONS)
+
+
+class PlateMatcher:
+    """
+    In-memory matcher that flags license plates that are on the License Plate of Interest list.
+
+    The LPOI list is loaded once (and optionally refreshed in the background), then every
+    lookup is a single dict probe on a precomputed normalized key. In fuzzy mode the key
+    also folds common OCR confusions (0/O, 1/I, 8/B) so "8AD1OO" matches "BAD100".
+    Plates that share a key (e.g. "BAD100" and "8AD100" in fuzzy mode) are all kept:
+    match() returns the first one loaded, match_all() returns every one, and the
+    collision is logged when the list is loaded.
+
+    Args:
+        lpr_vapi (LprVapi, optional): Client used to load and refresh the LPOI list.
+        fuzzy (bool): Match on OCR-folded keys instead of exact normalized plates.
+        refresh_interval (float): Seconds between background refreshes once start() is called.
+        confusions (dict, optional): Overrides OCR_CONFUSIONS for fuzzy keys.
+    """
+    def __init__(self, lpr_vapi=None, fuzzy=False, refresh_interval=300, confusions=None):
+        self.lpr_vapi = lpr_vapi
+        self.fuzzy = fuzzy
+        self.refresh_interval = refresh_interval
+        self.table = build_key_table(confusions if confusions is not None else OCR_CONFUSIONS) if fuzzy else EXACT_TABLE
+        self._index = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def key(self, plate):
+        """Returns the lookup key for a plate under this matcher's mode."""
+        return plate.translate(self.table)
+
+    def load(self, plates):
+        """
+        Replaces the match index.
+
+        Args:
+            plates (iterable): LPOI dicts with a "license_plate" key, or plain plate strings.
+        """
+        table = self.table
+        index = {}
+        for entry in plates:
+            if isinstance(entry, str):
+                entry = {"license_plate": entry}
+            index.setdefault(entry["license_plate"].translate(table), []).append(entry)
+        for key, entries in index.items():
+            if len(entries) > 1:
+                names = ", ".join(entry["license_plate"] for entry in entries)
+                utils.error_handler.handle(ValueError(f"{names} all match as {key}"), "License plates of interest share a match key", echo=False)
+        # Swap in one assignment so concurrent lookups never see a half-built index
+        self._index = index
+
+    def refresh(self):
+        """Reloads the LPOI list from the API."""
+        if self.lpr_vapi is None:
+            raise ValueError("PlateMatcher needs an LprVapi instance to refresh from the API")
+        self.load(self.lpr_vapi.iter_license_plates_of_interest())
+
+    def start(self):
+        """Loads the list now and keeps refreshing it every refresh_interval seconds on a daemon thread."""
+        self.refresh()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _refresh_loop(self):
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                # Keep serving the last good list if a refresh fails
+                utils.error_handler.handle(e, "Failed to refresh license plates of interest")
+
+    def match(self, plate):
+        """Returns the matching LPOI entry for a plate (the first loaded if several share its key), or None."""
+        entries = self._index.get(plate.translate(self.table))
+        return entries[0] if entries else None
+
+    def match_all(self, plate):
+        """Returns every LPOI entry whose key matches the plate, in load order."""
+        return list(self._index.get(plate.translate(self.table), ()))
+
+    def __contains__(self, plate):
+        return plate.translate(self.table) in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def tag(self, detections, plate_key="license_plate"):
+        """
+        Yields (detection, lpoi_entry) for every detection whose plate is on the list.
+
+        Args:
+            detections (iterable): Detection dicts, e.g. from get_lpr_images or get_lpr_timestamps.
+            plate_key (str): Key holding the plate string in each detection.
+        """
+        index = self._index
+        table = self.table
+        for detection in detections:
+            plate = detection.get(plate_key)
+            if plate:
+                entries = index.get(plate.translate(table))
+                if entries:
+                    yield detection, entries[0]
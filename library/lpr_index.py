@@ -0,0 +1,74 @@
+import heapq
+import bisect
+import threading
+
+
+class LprTimestampIndex:
+    """
+    Local index of LPR sighting timestamps, keyed by (camera_id, license_plate).
+
+    For each key it keeps the sorted timestamps seen so far and the time intervals
+    that have been fetched (merged into disjoint [start, end) ranges). Sightings in
+    the same second are kept as separate entries, as in an unindexed lookup. A repeat
+    query is answered from memory, and a query that only partly overlaps what was
+    fetched needs just the missing gaps from the API.
+    """
+    def __init__(self):
+        self._timestamps = {}
+        self._coverage = {}
+        self._lock = threading.Lock()
+
+    def missing(self, camera_id, license_plate, start, end):
+        """
+        Returns the sub-ranges of [start, end) that have not been fetched for this key.
+
+        Returns:
+            list: (start, end) tuples, empty when the whole range is covered.
+        """
+        with self._lock:
+            coverage = self._coverage.get((camera_id, license_plate), [])
+            gaps = []
+            cursor = start
+            for covered_start, covered_end in coverage:
+                if covered_end <= cursor:
+                    continue
+                if covered_start >= end:
+                    break
+                if covered_start > cursor:
+                    gaps.append((cursor, covered_start))
+                cursor = max(cursor, covered_end)
+            if cursor < end:
+                gaps.append((cursor, end))
+            return gaps
+
+    def add(self, camera_id, license_plate, start, end, timestamps):
+        """
+        Records that [start, end) was fetched and returned these timestamps.
+
+        Only call this for ranges reported by missing(), so no sighting is stored twice;
+        timestamps outside [start, end) are ignored.
+        """
+        key = (camera_id, license_plate)
+        if end <= start:
+            return
+        fetched = sorted(t for t in timestamps if start <= t < end)
+        with self._lock:
+            self._timestamps[key] = list(heapq.merge(self._timestamps.get(key, []), fetched))
+            merged = []
+            for interval in sorted(self._coverage.get(key, []) + [(start, end)]):
+                if merged and interval[0] <= merged[-1][1]:
+                    merged[-1] = (merged[-1][0], max(merged[-1][1], interval[1]))
+                else:
+                    merged.append(interval)
+            self._coverage[key] = merged
+
+    def query(self, camera_id, license_plate, start, end):
+        """Returns the stored timestamps with start <= timestamp < end, in order."""
+        with self._lock:
+            stored = self._timestamps.get((camera_id, license_plate), [])
+            return stored[bisect.bisect_left(stored, start):bisect.bisect_left(stored, end)]
+
+    def clear(self):
+        with self._lock:
+            self._timestamps.clear()
+            self._coverage.clear()
@@ -1,11 +1,20 @@
 import pprint
+import os
+import csv
+import json
+import time
+import heapq
+import queue
+import threading
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor
 from library.camera_vapi import CameraVapi
 
 class LprVapi(CameraVapi):
-    def __init__(self, run_test=False):
-        super().__init__(run_test)
+    def __init__(self, run_test=False, **kwargs):
+        super().__init__(run_test, **kwargs)
 
-    def get_lpr_images(self, camera_id, start_time=None, end_time=None, license_plate=None):
+    def get_lpr_images(self, camera_id, start_time=None, end_time=None, license_plate=None, page_size=100, page_token=None):
         """
         Retrieves images captured by cameras that have recognized license plates.
 
@@ -16,11 +25,48 @@ class LprVapi(CameraVapi):
             start_time (int, optional): Start timestamp to filter images.
             end_time (int, optional): End timestamp to filter images.
             license_plate (str, optional): License plate to filter images.
+            page_size (int, optional): Number of detections per page (max 200).
+            page_token (str, optional): Token of the page to fetch, from a previous response.
 
         Returns:
             dict: The API response containing LPR images.
+
+        Raises:
+            HTTPError: If the response status code indicates an error.
         """
-        pass
+        params = self._lpr_params(camera_id, start_time, end_time, license_plate)
+        params["page_size"] = page_size
+        if page_token is not None:
+            params["page_token"] = page_token
+        response = self.send_request(self.ENDPOINTS['lpr_images'], params=params)
+        if response.status_code != 200:
+            response.raise_for_status()
+        return self.decode_json(response)
+
+    def iter_lpr_detections(self, camera_id, start_time=None, end_time=None, license_plate=None, page_size=200):
+        """
+        Streams LPR detections for a camera across every page of results.
+
+        Each detection gets the camera_id added, since the API only carries it as a query parameter.
+
+        Yields:
+            dict: One detection with license_plate, timestamp, image_url and camera_id.
+        """
+        params = self._lpr_params(camera_id, start_time, end_time, license_plate)
+        for detection in self.paginate(self.ENDPOINTS['lpr_images'], "detections", params=params, page_size=page_size):
+            detection.setdefault("camera_id", camera_id)
+            yield detection
+
+    @staticmethod
+    def _lpr_params(camera_id, start_time=None, end_time=None, license_plate=None):
+        params = {"camera_id": camera_id}
+        if start_time is not None:
+            params["start_time"] = start_time
+        if end_time is not None:
+            params["end_time"] = end_time
+        if license_plate is not None:
+            params["license_plate"] = license_plate
+        return params
 
     def delete_license_plate_of_interest(self, license_plate_id):
         """
@@ -124,19 +170,280 @@ class LprVapi(CameraVapi):
 
         
 
-    def get_lpr_timestamps(self, camera_id, license_plate=None, start_time=None, end_time=None):
+    def iter_license_plates_of_interest(self, page_size=100):
         """
-        Retrieves timestamps associated with license plate recognition events.
+        Streams every License Plate of Interest (LPOI) in the organization.
+
+        HTTP Method: GET
+
+        Args:
+            page_size (int): Number of plates requested per page.
+
+        Yields:
+            dict: One license plate of interest, e.g. {"license_plate": "ABC123", "description": "...", "creation_time": 1700000000}.
+        """
+        yield from self.paginate(self.ENDPOINTS['license_plate_of_interest'], "license_plate_of_interest", page_size=page_size)
+
+    @staticmethod
+    def load_license_plates_of_interest(path):
+        """
+        Loads the desired LPOI list from a CSV or JSON file.
+
+        CSV files need a "license_plate" column and may have a "description" column.
+        JSON files may hold a list of {"license_plate", "description"} objects or a
+        {plate: description} mapping.
+
+        Args:
+            path (str): Path to the .csv or .json source of truth.
+
+        Returns:
+            dict: A mapping of normalized license plate to description.
+        """
+        if os.path.splitext(path)[1].lower() == ".json":
+            with open(path, "r") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                rows = [{"license_plate": plate, "description": desc} for plate, desc in data.items()]
+            else:
+                rows = data
+        else:
+            with open(path, "r", newline="") as f:
+                rows = list(csv.DictReader(f))
+
+        plates = {}
+        for row in rows:
+            plate = (row.get("license_plate") or "").strip().upper()
+            if plate:
+                plates[plate] = (row.get("description") or "").strip() or "None"
+        return plates
+
+    @staticmethod
+    def diff_license_plates_of_interest(current, desired, delete_missing=True):
+        """
+        Computes the writes needed to turn the current LPOI list into the desired one.
+
+        Args:
+            current (dict): Mapping of license plate to description as it exists in Command.
+            desired (dict): Mapping of license plate to description from the source of truth.
+            delete_missing (bool): Whether plates missing from desired should be deleted.
+
+        Returns:
+            dict: A plan with "create", "update" (lists of (plate, description)) and "delete" (list of plates).
+        """
+        plan = {"create": [], "update": [], "delete": []}
+        for plate, description in desired.items():
+            if plate not in current:
+                plan["create"].append((plate, description))
+            elif current[plate] != description:
+                plan["update"].append((plate, description))
+        if delete_missing:
+            plan["delete"] = [plate for plate in current if plate not in desired]
+        return plan
+
+    def sync_license_plates_of_interest(self, source, dry_run=False, delete_missing=True, max_workers=8, requests_per_second=10):
+        """
+        Reconciles the organization's LPOI list against a local CSV/JSON source of truth.
+
+        The current list is read page by page, diffed against the source, and only the
+        needed creates, updates and deletes are sent, concurrently and rate limited.
+
+        HTTP Methods: GET, POST, PATCH, DELETE
+
+        Args:
+            source (str or dict): Path to a CSV/JSON file, or a {plate: description} mapping.
+            dry_run (bool): If True, return the plan without making any writes.
+            delete_missing (bool): Delete plates that are not in the source.
+            max_workers (int): Number of concurrent write requests.
+            requests_per_second (float): Upper bound on the write rate.
+
+        Returns:
+            dict: The plan, plus a "results" list of (action, plate, status) when not a dry run, where
+            status is the status code, or the error message for a write that raised.
+        """
+        desired = self.load_license_plates_of_interest(source) if isinstance(source, str) else {
+            plate.strip().upper(): description for plate, description in source.items()
+        }
+        current = {
+            lpoi["license_plate"].upper(): lpoi.get("description") or "None"
+            for lpoi in self.iter_license_plates_of_interest()
+        }
+        plan = self.diff_license_plates_of_interest(current, desired, delete_missing=delete_missing)
+        if dry_run:
+            return plan
+
+        endpoint = self.ENDPOINTS['license_plate_of_interest']
+
+        def write(action, plate, description):
+            if action == "create":
+                return self.send_request(endpoint, json={"license_plate": plate, "description": description}, method="POST")
+            if action == "update":
+                return self.send_request(endpoint, json={"description": description}, params={"license_plate": plate}, method="PATCH")
+            return self.send_request(endpoint, params={"license_plate": plate}, method="DELETE")
+
+        jobs = [("create", plate, desc) for plate, desc in plan["create"]]
+        jobs += [("update", plate, desc) for plate, desc in plan["update"]]
+        jobs += [("delete", plate, None) for plate in plan["delete"]]
+        statuses = self.apply_bulk_writes(write, jobs, max_workers=max_workers, requests_per_second=requests_per_second)
+        plan["results"] = [(action, plate, status) for (action, plate, _), status in zip(jobs, statuses)]
+        return plan
+
+    def get_lpr_timestamps(self, camera_id, license_plate, start_time=None, end_time=None, page_size=100, page_token=None):
+        """
+        Retrieves timestamps of when a license plate was seen by a camera.
 
         HTTP Method: GET
 
         Args:
             camera_id (str): The ID of the camera.
-            license_plate (str, optional): License plate to filter timestamps.
+            license_plate (str): License plate to look up.
             start_time (int, optional): Start timestamp to filter events.
             end_time (int, optional): End timestamp to filter events.
+            page_size (int, optional): Number of detections per page.
+            page_token (str, optional): Token of the page to fetch, from a previous response.
 
         Returns:
             dict: The API response containing LPR timestamps.
+
+        Raises:
+            HTTPError: If the response status code indicates an error.
         """
-        pass
+        params = self._lpr_params(camera_id, start_time, end_time, license_plate)
+        params["page_size"] = page_size
+        if page_token is not None:
+            params["page_token"] = page_token
+        response = self.send_request(self.ENDPOINTS['lpr_timestamps'], params=params)
+        if response.status_code != 200:
+            response.raise_for_status()
+        return self.decode_json(response)
+
+    def iter_lpr_timestamps(self, camera_id, license_plate, start_time=None, end_time=None, page_size=200):
+        """
+        Streams every timestamp at which a camera saw a license plate.
+
+        Yields:
+            int: Detection timestamps in Unix seconds, in the order the API returns them.
+        """
+        params = self._lpr_params(camera_id, start_time, end_time, license_plate)
+        for detection in self.paginate(self.ENDPOINTS['lpr_timestamps'], "detections", params=params, page_size=page_size):
+            yield detection["timestamp"]
+
+    def _indexed_plate_timestamps(self, camera_id, license_plate, start_time, end_time, index):
+        """Returns one camera's sorted timestamps for a plate in [start_time, end_time), fetching only what the index lacks."""
+        settled = int(time.time()) - 60
+        recent = []
+        for gap_start, gap_end in index.missing(camera_id, license_plate, start_time, end_time):
+            timestamps = [t for t in self.iter_lpr_timestamps(camera_id, license_plate, gap_start, gap_end) if gap_start <= t < gap_end]
+            # Sightings can still arrive for the current minute, so only the settled part is stored
+            covered_end = max(gap_start, min(gap_end, settled))
+            index.add(camera_id, license_plate, gap_start, covered_end, [t for t in timestamps if t < covered_end])
+            recent += [t for t in timestamps if t >= covered_end]
+        return list(heapq.merge(index.query(camera_id, license_plate, start_time, end_time), sorted(recent)))
+
+    def _camera_plate_pages(self, camera_id, license_plate, start_time, end_time, index, stop):
+        """Yields one camera's timestamps for a plate in [start_time, end_time) as sorted batches, one per API page."""
+        if index is not None:
+            yield self._indexed_plate_timestamps(camera_id, license_plate, start_time, end_time, index)
+            return
+        params = self._lpr_params(camera_id, start_time, end_time, license_plate)
+        for page in self.paginate_pages(self.ENDPOINTS['lpr_timestamps'], "detections", params=params, page_size=200):
+            yield sorted(t for t in (detection["timestamp"] for detection in page) if start_time <= t < end_time)
+            if stop.is_set():
+                return
+
+    def iter_plate_timeline(self, license_plate, start_time, end_time, camera_ids=None, max_workers=8, index=None,
+                            max_buffered_pages=4):
+        """
+        Streams every sighting of a license plate across cameras, oldest first.
+
+        Each camera's timestamps are fetched page by page on its own thread and handed
+        over through a bounded queue as pages arrive. A heap-based k-way merge
+        (heapq.merge) over those per-camera streams yields sightings as soon as every
+        camera has delivered its first page, instead of waiting for the slowest camera's
+        full history. At most max_workers page requests run at once, and a camera
+        stops fetching once max_buffered_pages of its pages are waiting, so a slow
+        consumer holds a bounded number of pages.
+
+        The merge relies on the API paging each camera's detections oldest first; a
+        page that goes back in time raises ValueError instead of yielding sightings
+        out of order.
+
+        Sightings in the same second are kept as separate entries, with or without an index.
+
+        HTTP Method: GET
+
+        Args:
+            license_plate (str): License plate to look up.
+            start_time (int): Start of the range in Unix seconds.
+            end_time (int): End of the range in Unix seconds (exclusive).
+            camera_ids (list, optional): Cameras to search. Defaults to every camera in the organization.
+            max_workers (int): Number of concurrent per-camera lookups.
+            index (LprTimestampIndex, optional): Local index used to answer repeat queries without the API.
+            max_buffered_pages (int): Pages each camera may fetch ahead of the merge.
+
+        Yields:
+            dict: {"timestamp", "camera_id", "license_plate"} for each sighting.
+
+        Raises:
+            HTTPError: If the camera list or a camera's lookup fails; the latter is raised when the merge reaches that camera.
+            ValueError: If a camera's pages are not oldest first.
+        """
+        license_plate = license_plate.strip().upper()
+        if camera_ids is None:
+            response = self.send_request(self.ENDPOINTS['camera_devices'])
+            if response.status_code != 200:
+                response.raise_for_status()
+            camera_ids = [camera["camera_id"] for camera in self.decode_json(response).get("cameras", [])]
+        stop = threading.Event()
+        fetch_slots = threading.BoundedSemaphore(max_workers)
+
+        def put(pages, item):
+            # Wait for room, but give up once the consumer has gone away
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(camera_id, pages):
+            try:
+                camera_pages = self._camera_plate_pages(camera_id, license_plate, start_time, end_time, index, stop)
+                while True:
+                    # Only the fetch holds a slot; waiting for queue room does not
+                    with fetch_slots:
+                        page = next(camera_pages, None)
+                    if page is None or not put(pages, page):
+                        break
+            except Exception as e:
+                put(pages, e)
+            finally:
+                put(pages, None)
+
+        def stream(camera_id, pages):
+            latest = None
+            while (page := pages.get()) is not None:
+                if isinstance(page, Exception):
+                    raise page
+                if page and latest is not None and page[0] < latest:
+                    raise ValueError(f"LPR timestamps for camera {camera_id} went back from {latest} to {page[0]}; "
+                                     "the timeline needs each camera's pages oldest first")
+                if page:
+                    latest = page[-1]
+                yield from zip(page, repeat(camera_id))
+
+        # One thread per camera, so a camera waiting for queue room never keeps
+        # another camera's first page (which the merge needs) from being fetched
+        executor = ThreadPoolExecutor(max_workers=max(len(camera_ids), 1))
+        try:
+            streams = []
+            for camera_id in camera_ids:
+                pages = queue.Queue(maxsize=max_buffered_pages)
+                executor.submit(produce, camera_id, pages)
+                streams.append(stream(camera_id, pages))
+            for timestamp, camera_id in heapq.merge(*streams):
+                yield {"timestamp": timestamp, "camera_id": camera_id, "license_plate": license_plate}
+        finally:
+            # A consumer that stops early should not wait for every remaining page
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,111 @@
+import sys
+
+_intern = sys.intern
+
+
+class Record:
+    """
+    Base class for compact, slot-based API records.
+
+    Subclasses list their fields in __slots__ and name the repeated identifier fields
+    (camera ids, site ids, event type uids, ...) in INTERNED so every record shares one
+    string object per distinct id. Compared with the raw dict from response.json(), a
+    record has no per-instance __dict__ and no duplicated key strings.
+    """
+    __slots__ = ()
+    INTERNED = ()
+
+    def __init__(self, *args, **kwargs):
+        fields = self.__slots__
+        if len(args) > len(fields):
+            raise TypeError(f"{type(self).__name__} takes at most {len(fields)} positional arguments")
+        for name, value in zip(fields, args):
+            setattr(self, name, value)
+        for name in fields[len(args):]:
+            setattr(self, name, kwargs.pop(name, None))
+        if kwargs:
+            raise TypeError(f"{type(self).__name__} got unexpected fields: {', '.join(kwargs)}")
+
+    @classmethod
+    def from_json(cls, data):
+        """Builds a record from one API JSON object, ignoring keys the record does not keep."""
+        record = cls.__new__(cls)
+        get = data.get
+        for name in cls.__slots__:
+            setattr(record, name, get(name))
+        for name in cls.INTERNED:
+            value = getattr(record, name)
+            if type(value) is str:
+                setattr(record, name, _intern(value))
+        return record
+
+    @classmethod
+    def from_json_list(cls, items):
+        """Converts an iterable of API JSON objects, e.g. a page of results."""
+        from_json = cls.from_json
+        return [from_json(item) for item in items]
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class HelixEvent(Record):
+    """A Helix event as returned by the video_tagging event and search endpoints."""
+    __slots__ = ("camera_id", "time_ms", "event_type_uid", "attributes", "flagged")
+    INTERNED = ("camera_id", "event_type_uid")
+
+    @classmethod
+    def from_json(cls, data):
+        record = super().from_json(data)
+        attributes = record.attributes
+        if attributes:
+            # Attribute names repeat on every event of a type, share one copy of each
+            record.attributes = {_intern(name): value for name, value in attributes.items()}
+        return record
+
+    @property
+    def key(self):
+        """(camera_id, time_ms, event_type_uid), the identifiers the Helix event calls take."""
+        return self.camera_id, self.time_ms, self.event_type_uid
+
+
+class CameraDevice(Record):
+    """A camera from cameras/v1/devices."""
+    __slots__ = ("camera_id", "name", "model", "serial", "site", "site_id", "status", "local_ip", "mac", "firmware", "timezone", "last_online")
+    INTERNED = ("camera_id", "model", "site", "site_id", "status", "firmware", "timezone")
+
+
+class AlarmDevice(Record):
+    """An alarm device from alarms/v1/devices."""
+    __slots__ = ("device_id", "device_type", "name", "site_id", "serial_number", "status")
+    INTERNED = ("device_id", "device_type", "site_id", "status")
+
+
+class LprDetection(Record):
+    """A license plate detection from the LPR images or timestamps endpoints."""
+    __slots__ = ("camera_id", "license_plate", "timestamp", "image_url")
+    INTERNED = ("camera_id", "license_plate")
+
+    @classmethod
+    def from_json(cls, data, camera_id=None):
+        """
+        Builds a detection; camera_id fills in for responses that only carry it as a query parameter.
+        """
+        record = super().from_json(data)
+        if record.camera_id is None and camera_id is not None:
+            record.camera_id = _intern(camera_id)
+        return record
+
+    @classmethod
+    def from_json_list(cls, items, camera_id=None):
+        from_json = cls.from_json
+        return [from_json(item, camera_id) for item in items]
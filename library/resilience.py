@@ -0,0 +1,143 @@
+import random
+import threading
+import time
+
+import requests
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without touching the network while an endpoint family's circuit is open."""
+    def __init__(self, family, retry_in):
+        self.family = family
+        self.retry_in = retry_in
+        super().__init__(f"Circuit open for {family}, failing fast for another {retry_in:.1f}s")
+
+
+class RetryPolicy:
+    """
+    Jittered exponential backoff for transport errors and retryable status codes.
+
+    Idempotent methods are retried on connection errors, timeouts and retry_statuses.
+    Other methods (POST, PATCH) are only retried when the connection could not be
+    opened at all, since the request never reached the server.
+
+    Args:
+        max_attempts (int): Total attempts including the first one.
+        base_delay (float): Backoff ceiling for the first retry, in seconds; doubles each attempt.
+        max_delay (float): Upper bound on a single backoff.
+        deadline (float): Overall time budget in seconds across every attempt and backoff.
+        retry_statuses (tuple): Response codes worth retrying.
+        idempotent_methods (tuple): Methods that are safe to send twice.
+    """
+    def __init__(self, max_attempts=4, base_delay=0.25, max_delay=8.0, deadline=30.0,
+                 retry_statuses=(429, 500, 502, 503, 504),
+                 idempotent_methods=("GET", "HEAD", "OPTIONS", "PUT", "DELETE")):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(idempotent_methods)
+
+    def backoff(self, attempt, response=None):
+        """Returns the sleep before the given retry (1-based), honoring Retry-After on 429/503."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), self.max_delay)
+        # "Full jitter": spreads retries from many workers instead of synchronizing them
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+    def should_retry_status(self, method, status_code):
+        return method in self.idempotent_methods and status_code in self.retry_statuses
+
+    def should_retry_error(self, method, error):
+        if isinstance(error, CircuitOpenError):
+            return False
+        if method in self.idempotent_methods:
+            return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+        return isinstance(error, requests.exceptions.ConnectTimeout)
+
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failures, fails fast for reset_timeout
+    seconds, then lets a single probe request through (half-open) before closing again.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, family, failure_threshold=5, reset_timeout=30.0):
+        self.family = family
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """
+        Checks whether a request may go out.
+
+        Raises:
+            CircuitOpenError: While the circuit is open, or while another thread is probing.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            remaining = self.opened_at + self.reset_timeout - time.monotonic()
+            if self.state == self.OPEN and remaining <= 0:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            raise CircuitOpenError(self.family, max(remaining, 0.0))
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def release_probe(self):
+        """Ends a half-open probe that never got an answer (e.g. it failed before reaching the network)."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+            self._probing = False
+
+
+class CircuitBreakers:
+    """One CircuitBreaker per endpoint family, e.g. "cameras/v1/video_tagging"."""
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, family_depth=3):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.family_depth = family_depth
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def family(self, endpoint):
+        path = endpoint.split("?", 1)[0].strip("/")
+        return "/".join(path.split("/")[:self.family_depth])
+
+    def for_endpoint(self, endpoint):
+        family = self.family(endpoint)
+        breaker = self._breakers.get(family)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    family, CircuitBreaker(family, self.failure_threshold, self.reset_timeout)
+                )
+        return breaker
+
+    def states(self):
+        return {family: breaker.state for family, breaker in self._breakers.items()}
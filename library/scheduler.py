@@ -0,0 +1,101 @@
+import threading
+from collections import deque
+
+# Default lane weights: when every lane has waiters, slots are handed out 8:3:1
+DEFAULT_WEIGHTS = {
+    "interactive": 8,
+    "normal": 3,
+    "bulk": 1,
+}
+
+
+class _Ticket:
+    __slots__ = ("event",)
+
+    def __init__(self):
+        self.event = threading.Event()
+
+
+class _Slot:
+    __slots__ = ("scheduler", "priority")
+
+    def __init__(self, scheduler, priority):
+        self.scheduler = scheduler
+        self.priority = priority
+
+    def __enter__(self):
+        self.scheduler.acquire(self.priority)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.scheduler.release()
+        return False
+
+
+class RequestScheduler:
+    """
+    Shares a fixed number of in-flight request slots between priority lanes.
+
+    Callers wait in a FIFO per lane. Whenever a slot frees up it goes to the next lane
+    chosen by smooth weighted round-robin over the lanes that have waiters, so an
+    interactive call waits behind at most a few others while a bulk job running beside
+    it still gets a steady share of the slots.
+
+    Args:
+        max_concurrency (int): Requests allowed in flight at once.
+        weights (dict, optional): Lane name to weight. Defaults to DEFAULT_WEIGHTS.
+    """
+    def __init__(self, max_concurrency=8, weights=None):
+        self.max_concurrency = max_concurrency
+        self.weights = dict(weights or DEFAULT_WEIGHTS)
+        self._lanes = {name: deque() for name in self.weights}
+        self._current = {name: 0 for name in self.weights}
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self.granted = {name: 0 for name in self.weights}
+
+    def slot(self, priority="normal"):
+        """Context manager holding one slot for the duration of a request."""
+        return _Slot(self, priority)
+
+    def acquire(self, priority="normal"):
+        if priority not in self._lanes:
+            raise ValueError(f"Unknown priority {priority!r}, expected one of {', '.join(self._lanes)}")
+        with self._lock:
+            if self._in_flight < self.max_concurrency and not any(self._lanes.values()):
+                self._in_flight += 1
+                self.granted[priority] += 1
+                return
+            ticket = _Ticket()
+            self._lanes[priority].append(ticket)
+        # release() hands the slot over directly, so there is no re-check after waking
+        ticket.event.wait()
+
+    def release(self):
+        with self._lock:
+            lane = self._next_lane()
+            if lane is None:
+                self._in_flight -= 1
+                return
+            self.granted[lane] += 1
+            self._lanes[lane].popleft().event.set()
+
+    def _next_lane(self):
+        # Smooth weighted round-robin (as used by nginx upstreams) over non-empty lanes
+        best = None
+        total = 0
+        for name, waiters in self._lanes.items():
+            if not waiters:
+                continue
+            weight = self.weights[name]
+            self._current[name] += weight
+            total += weight
+            if best is None or self._current[name] > self._current[best]:
+                best = name
+        if best is not None:
+            self._current[best] -= total
+        return best
+
+    def waiting(self):
+        with self._lock:
+            return {name: len(waiters) for name, waiters in self._lanes.items()}
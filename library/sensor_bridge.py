@@ -0,0 +1,338 @@
+import os
+import json
+import time
+import queue
+import selectors
+import threading
+from collections import deque
+
+import library.utils as utils
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows has no termios; pass an already-configured file object instead
+    termios = tty = None
+
+
+def find_serial_device(prefix="/dev/ttyACM", count=10):
+    """Returns the first existing device path from prefix0 .. prefix{count-1}, or None."""
+    for i in range(count):
+        device_name = f"{prefix}{i}"
+        if os.path.exists(device_name):
+            return device_name
+    return None
+
+
+def open_serial(path):
+    """
+    Opens a serial device (or pseudo-terminal) for non-blocking raw reads.
+
+    Returns:
+        int: The file descriptor.
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_NOCTTY | os.O_NONBLOCK)
+    if tty is not None and os.isatty(fd):
+        # Raw mode: no line editing or echo, bytes are delivered as soon as they arrive
+        tty.setraw(fd, termios.TCSANOW)
+    return fd
+
+
+def open_pty_pair():
+    """
+    Creates a pseudo-terminal stand-in for the radar.
+
+    Returns:
+        tuple: (master_fd, slave_path). Write radar lines to master_fd and point the bridge at slave_path.
+    """
+    master_fd, slave_fd = os.openpty()
+    slave_path = os.ttyname(slave_fd)
+    if tty is not None:
+        tty.setraw(slave_fd, termios.TCSANOW)
+    # Keep the slave open so the master side never sees EIO before the bridge attaches
+    return master_fd, slave_path
+
+
+class FakeRadar:
+    """Writes radar-style JSON lines to a pseudo-terminal master, for running the bridge without hardware."""
+    def __init__(self, master_fd):
+        self.master_fd = master_fd
+
+    def send(self, direction="inbound", velocity=35, **extra):
+        reading = {"direction": direction, "DetectedObjectVelocity": velocity, **extra}
+        os.write(self.master_fd, (json.dumps(reading) + "\n").encode("utf-8"))
+
+
+def parse_radar_line(line):
+    """
+    Parses one radar JSON line into a reading dict.
+
+    Returns:
+        dict: {"direction", "velocity"} or None if the line is not valid radar JSON.
+    """
+    try:
+        data = json.loads(line)
+        return {
+            "direction": data.get("direction"),
+            "velocity": abs(int(data.get("DetectedObjectVelocity", 0))),
+        }
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+class DetectionCoalescer:
+    """
+    Merges bursts of radar readings from one passing object into a single detection.
+
+    Readings are grouped by (camera_id, direction). A group is closed once no reading
+    has arrived for gap seconds (or it has been open for max_span seconds), and is
+    emitted as one reading with the peak velocity, the average velocity, the number of
+    readings merged, and the first reading's timestamps.
+
+    Args:
+        gap (float): Seconds of silence that end a burst.
+        max_span (float): Upper bound on how long one group may stay open.
+    """
+    def __init__(self, gap=1.0, max_span=10.0):
+        self.gap = gap
+        self.max_span = max_span
+        self._groups = {}
+        self.readings_in = 0
+        self.detections_out = 0
+
+    @staticmethod
+    def _merge(group):
+        first, velocities = group["first"], group["velocities"]
+        merged = dict(first)
+        merged["velocity"] = max(velocities)
+        merged["avg_velocity"] = sum(velocities) / len(velocities)
+        merged["count"] = len(velocities)
+        return merged
+
+    def add(self, reading):
+        """
+        Adds a reading and returns any detections it closes (a finished burst for the same key).
+
+        Returns:
+            list: Merged readings ready to be handled.
+        """
+        self.readings_in += 1
+        now = reading.get("received_at", time.monotonic())
+        key = (reading.get("camera_id"), reading.get("direction"))
+        closed = []
+        group = self._groups.get(key)
+        if group is not None and (now - group["last"] > self.gap or now - group["started"] > self.max_span):
+            closed.append(self._merge(self._groups.pop(key)))
+            group = None
+        if group is None:
+            self._groups[key] = {"first": reading, "velocities": [reading["velocity"]], "started": now, "last": now}
+        else:
+            group["velocities"].append(reading["velocity"])
+            group["last"] = now
+        self.detections_out += len(closed)
+        return closed
+
+    def flush_expired(self, now=None):
+        """Returns detections whose burst has gone quiet for at least gap seconds."""
+        now = time.monotonic() if now is None else now
+        expired = [key for key, group in self._groups.items()
+                   if now - group["last"] > self.gap or now - group["started"] > self.max_span]
+        closed = [self._merge(self._groups.pop(key)) for key in expired]
+        self.detections_out += len(closed)
+        return closed
+
+    def flush(self):
+        """Returns every open group, e.g. on shutdown."""
+        closed = [self._merge(group) for group in self._groups.values()]
+        self._groups.clear()
+        self.detections_out += len(closed)
+        return closed
+
+
+class SerialRadarBridge:
+    """
+    Event-driven bridge from a serial radar to a posting callback.
+
+    Three stages run on their own threads and hand off through queues:
+
+    - reader: blocks in a selector until the device is readable, then splits bytes into
+      lines. It never sleeps or parses, so a reading is picked up as soon as it lands.
+    - parser: turns lines into reading dicts with parse_radar_line.
+    - posters: call handler(reading) (e.g. create_helix_event), so a slow HTTP round
+      trip never delays reading the next detection.
+
+    Each reading carries "received_at" (time.monotonic()) and "time_ms" (wall clock at
+    read time), and the bridge keeps the detection-to-handled latency of the most recent
+    readings in latencies.
+
+    Args:
+        source (str, int or file object): Device path, file descriptor, or an object with fileno() (e.g. serial.Serial).
+        handler (callable): Called with each parsed reading.
+        parse (callable): Turns a decoded line into a reading dict, or None to skip it.
+        posters (int): Number of posting threads.
+        queue_size (int): Bound on each hand-off queue.
+        coalescer (DetectionCoalescer, optional): Merges bursts of readings before they reach the handler.
+        latency_window (int): Number of recent latencies kept, so a long-running bridge stays bounded.
+    """
+    _STOP = object()
+
+    def __init__(self, source, handler, parse=parse_radar_line, posters=2, queue_size=1000, coalescer=None, latency_window=10000):
+        self.source = source
+        self.handler = handler
+        self.parse = parse
+        self.posters = posters
+        self.coalescer = coalescer
+        self.lines = queue.Queue(maxsize=queue_size)
+        self.readings = queue.Queue(maxsize=queue_size)
+        self.latencies = deque(maxlen=latency_window)
+        self.errors = 0
+        self._fd = None
+        self._owns_fd = False
+        self._stop = threading.Event()
+        self._threads = []
+
+    def _open(self):
+        if isinstance(self.source, str):
+            self._owns_fd = True
+            return open_serial(self.source)
+        if isinstance(self.source, int):
+            return self.source
+        return self.source.fileno()
+
+    def start(self):
+        self._fd = self._open()
+        self._stop.clear()
+        self._threads = [threading.Thread(target=self._read_loop, name="radar-reader", daemon=True),
+                         threading.Thread(target=self._parse_loop, name="radar-parser", daemon=True)]
+        self._threads += [threading.Thread(target=self._post_loop, name=f"radar-poster-{i}", daemon=True) for i in range(self.posters)]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self, timeout=5):
+        """Stops reading, lets queued readings drain to the handler, and closes the device if the bridge opened it."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        if self._owns_fd and self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def run_forever(self):
+        self.start()
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            self.stop()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def _read_loop(self):
+        buffer = b""
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._fd, selectors.EVENT_READ)
+            while not self._stop.is_set():
+                # The timeout only bounds how long stop() waits; data wakes us immediately
+                if not selector.select(timeout=0.5):
+                    continue
+                try:
+                    chunk = os.read(self._fd, 4096)
+                except BlockingIOError:
+                    continue
+                except OSError as e:
+                    self.errors += 1
+                    utils.error_handler.handle(e, "Serial read failed")
+                    break
+                if not chunk:
+                    break
+                received_at = time.monotonic()
+                received_ms = int(time.time() * 1000)
+                buffer += chunk
+                *complete, buffer = buffer.split(b"\n")
+                for line in complete:
+                    if line.strip():
+                        self.lines.put((received_at, received_ms, line))
+        self.lines.put(self._STOP)
+
+    def _parse_loop(self):
+        coalescer = self.coalescer
+        # With a coalescer, wake up often enough to close bursts that went quiet
+        timeout = coalescer.gap / 4 if coalescer is not None else None
+        while True:
+            try:
+                item = self.lines.get(timeout=timeout)
+            except queue.Empty:
+                for detection in coalescer.flush_expired():
+                    self.readings.put(detection)
+                continue
+            if item is self._STOP:
+                break
+            received_at, received_ms, line = item
+            reading = self.parse(line.decode("utf-8", errors="replace").strip())
+            if reading is None:
+                # Partial or garbled lines are routine on a serial link; log them without echoing
+                utils.error_handler.handle(ValueError(f"Not a radar reading: {line!r}"), "Failed to decode radar line", echo=False)
+                continue
+            reading["received_at"] = received_at
+            reading.setdefault("time_ms", received_ms)
+            if coalescer is None:
+                self.readings.put(reading)
+                continue
+            for detection in coalescer.add(reading) + coalescer.flush_expired(received_at):
+                self.readings.put(detection)
+        if coalescer is not None:
+            for detection in coalescer.flush():
+                self.readings.put(detection)
+        for _ in range(self.posters):
+            self.readings.put(self._STOP)
+
+    def _post_loop(self):
+        while True:
+            reading = self.readings.get()
+            if reading is self._STOP:
+                break
+            try:
+                self.handler(reading)
+            except Exception as e:
+                self.errors += 1
+                utils.error_handler.handle(e, "Radar handler failed")
+            self.latencies.append(time.monotonic() - reading["received_at"])
+
+
+def helix_radar_handler(vapi, camera_id, event_type_uid, min_speed=30, org_id=None):
+    """
+    Builds a bridge handler that posts readings above min_speed as Helix events.
+
+    With a DetectionCoalescer on the bridge, velocity is the burst's peak speed, so one
+    event is posted per passing vehicle.
+
+    Args:
+        vapi (HelixVapi): Client used to create the events.
+        camera_id (str): Camera the events are attached to.
+        event_type_uid (str): Helix event type with "direction" and "mph" attributes.
+        min_speed (int): Only readings faster than this are posted.
+        org_id (str, optional): Organization ID, defaults to the client's.
+    """
+    def handle(reading):
+        if reading["velocity"] <= min_speed:
+            return
+        attributes = {
+            "direction": "East" if reading["direction"] == "inbound" else "West",
+            "mph": reading["velocity"],
+        }
+        # Timestamp the detection, not the moment the POST goes out
+        vapi.create_helix_event(
+            org_id=org_id,
+            camera_id=camera_id,
+            attributes=attributes,
+            time_ms=reading["time_ms"],
+            event_type_uid=event_type_uid,
+        )
+    return handle
@@ -0,0 +1,232 @@
+import threading
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the sensor store
+    np = None
+
+# Aggregations supported by downsample()
+AGGREGATES = ("min", "max", "mean")
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("The sensor store needs NumPy. Install it with 'pip install numpy'.")
+
+
+class _DeviceSeries:
+    """Time-sorted columns for one sensor. Appended chunks are merged lazily on the next read."""
+    __slots__ = ("time", "fields", "pending")
+
+    def __init__(self):
+        self.time = np.empty(0, dtype=np.int64)
+        self.fields = {}
+        self.pending = []
+
+    def consolidate(self):
+        if not self.pending:
+            return
+        times = [self.time] + [chunk_time for chunk_time, _ in self.pending]
+        names = set(self.fields)
+        for _, chunk_fields in self.pending:
+            names.update(chunk_fields)
+        columns = {}
+        for name in names:
+            parts = [self.fields.get(name, np.full(len(self.time), np.nan))]
+            parts += [chunk_fields.get(name, np.full(len(chunk_time), np.nan)) for chunk_time, chunk_fields in self.pending]
+            columns[name] = np.concatenate(parts)
+        time = np.concatenate(times)
+        # Stable sort, then keep the last copy of each timestamp so re-fetched windows overwrite
+        order = np.argsort(time, kind="stable")
+        time = time[order]
+        keep = np.ones(len(time), dtype=bool)
+        keep[:-1] = time[1:] != time[:-1]
+        self.time = time[keep]
+        self.fields = {name: column[order][keep] for name, column in columns.items()}
+        self.pending = []
+
+
+class SensorStore:
+    """
+    Compact columnar store for environmental sensor readings.
+
+    Each sensor keeps an int64 array of Unix-second timestamps and one float64 array
+    per field (NaN where a reading lacks the field), sorted by time. Range queries use
+    binary search, so reading a day out of months of data touches only that day's rows.
+    Chunks can be appended from several threads; they are merged and de-duplicated
+    on the next read.
+
+    Usage:
+        store = SensorStore()
+        store.append("device-id", readings)
+        times, columns = store.range("device-id", start, end, fields=["temperature"])
+        buckets = store.downsample("device-id", "temperature", 3600, start, end)
+    """
+    def __init__(self):
+        _require_numpy()
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def append(self, device_id, readings, time_key="time"):
+        """
+        Adds readings for a sensor.
+
+        Args:
+            device_id (str): The sensor's device ID.
+            readings (list): Dicts with a time_key timestamp (Unix seconds) and numeric fields.
+            time_key (str): Name of the timestamp field.
+
+        Returns:
+            int: The number of readings added.
+        """
+        if not readings:
+            return 0
+        time = np.fromiter((reading[time_key] for reading in readings), dtype=np.int64, count=len(readings))
+        names = {name for reading in readings for name in reading if name != time_key}
+        fields = {}
+        for name in names:
+            values = [reading.get(name) for reading in readings]
+            if all(value is None or (isinstance(value, (int, float)) and not isinstance(value, bool)) for value in values):
+                fields[name] = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+        self.append_columns(device_id, time, fields)
+        return len(readings)
+
+    def append_columns(self, device_id, time, fields):
+        """Adds already-columnar readings: an int64 time array and {field: float64 array}."""
+        with self._lock:
+            series = self._series.get(device_id)
+            if series is None:
+                series = self._series[device_id] = _DeviceSeries()
+            series.pending.append((np.asarray(time, dtype=np.int64), {name: np.asarray(column, dtype=np.float64) for name, column in fields.items()}))
+
+    def _get(self, device_id):
+        with self._lock:
+            series = self._series.get(device_id)
+            if series is None:
+                raise KeyError(f"No readings stored for device '{device_id}'")
+            series.consolidate()
+            return series
+
+    @property
+    def device_ids(self):
+        return list(self._series)
+
+    def fields(self, device_id):
+        return sorted(self._get(device_id).fields)
+
+    def __len__(self):
+        return sum(len(self._get(device_id).time) for device_id in self.device_ids)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the array columns."""
+        total = 0
+        for device_id in self.device_ids:
+            series = self._get(device_id)
+            total += series.time.nbytes + sum(column.nbytes for column in series.fields.values())
+        return total
+
+    def _bounds(self, series, start=None, end=None):
+        lo = 0 if start is None else int(np.searchsorted(series.time, start, side="left"))
+        hi = len(series.time) if end is None else int(np.searchsorted(series.time, end, side="left"))
+        return lo, hi
+
+    def range(self, device_id, start=None, end=None, fields=None):
+        """
+        Returns the readings with start <= time < end.
+
+        The returned arrays are views into the store; copy them before modifying.
+
+        Args:
+            device_id (str): The sensor's device ID.
+            start (int, optional): Start of the range in Unix seconds.
+            end (int, optional): End of the range (exclusive).
+            fields (list, optional): Fields to return. Defaults to every stored field.
+
+        Returns:
+            tuple: (time array, {field: value array}).
+        """
+        series = self._get(device_id)
+        lo, hi = self._bounds(series, start, end)
+        names = fields if fields is not None else series.fields
+        return series.time[lo:hi], {name: series.fields[name][lo:hi] for name in names}
+
+    def downsample(self, device_id, field, bucket_seconds, start=None, end=None, aggregates=AGGREGATES):
+        """
+        Aggregates one field into fixed-width time buckets.
+
+        Args:
+            device_id (str): The sensor's device ID.
+            field (str): Field to aggregate, e.g. "temperature".
+            bucket_seconds (int): Bucket width in seconds; buckets align to multiples of it.
+            start (int, optional): Start of the range in Unix seconds.
+            end (int, optional): End of the range (exclusive).
+            aggregates (tuple): Any of "min", "max" and "mean".
+
+        Returns:
+            dict: "time" (bucket start times) plus one array per aggregate. Empty buckets are omitted,
+            and NaN readings are ignored.
+        """
+        time, columns = self.range(device_id, start, end, fields=[field])
+        return downsample(time, columns[field], bucket_seconds, aggregates)
+
+    def save(self, path):
+        """Writes the store to a compressed .npz file that load() reads back."""
+        arrays = {}
+        for index, device_id in enumerate(self.device_ids):
+            series = self._get(device_id)
+            arrays[f"{index}/device_id"] = np.array(device_id)
+            arrays[f"{index}/time"] = series.time
+            for name, column in series.fields.items():
+                arrays[f"{index}/field/{name}"] = column
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        store = cls()
+        with np.load(path) as data:
+            devices = {}
+            for key in data.files:
+                index, kind = key.split("/", 1)
+                devices.setdefault(index, {})[kind] = data[key]
+        for arrays in devices.values():
+            fields = {kind[len("field/"):]: column for kind, column in arrays.items() if kind.startswith("field/")}
+            store.append_columns(str(arrays["device_id"]), arrays["time"], fields)
+        return store
+
+
+def downsample(time, values, bucket_seconds, aggregates=AGGREGATES):
+    """
+    Buckets a time-sorted series into fixed-width windows with vectorized reductions.
+
+    Args:
+        time (ndarray): Sorted Unix-second timestamps.
+        values (ndarray): float64 values aligned with time; NaN values are ignored.
+        bucket_seconds (int): Bucket width in seconds.
+        aggregates (tuple): Any of "min", "max" and "mean".
+
+    Returns:
+        dict: "time" (bucket start times) plus one array per aggregate.
+    """
+    _require_numpy()
+    unknown = set(aggregates) - set(AGGREGATES)
+    if unknown:
+        raise ValueError(f"Unknown aggregates: {', '.join(sorted(unknown))}")
+    present = ~np.isnan(values)
+    time, values = time[present], values[present]
+    result = {"time": np.empty(0, dtype=np.int64)}
+    result.update({name: np.empty(0, dtype=np.float64) for name in aggregates})
+    if len(time) == 0:
+        return result
+    buckets = time - time % bucket_seconds
+    # Index of the first reading in each bucket; reduceat reduces each run in one pass
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    result["time"] = buckets[starts]
+    if "min" in aggregates:
+        result["min"] = np.minimum.reduceat(values, starts)
+    if "max" in aggregates:
+        result["max"] = np.maximum.reduceat(values, starts)
+    if "mean" in aggregates:
+        counts = np.diff(np.r_[starts, len(values)])
+        result["mean"] = np.add.reduceat(values, starts) / counts
+    return result
@@ -0,0 +1,67 @@
+import threading
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls so only one of them reaches the upstream API.
+
+    The first caller for a key runs the function; callers that arrive with the same key
+    while it is in flight block until it finishes and receive the same result (or the
+    same exception). Nothing is kept once the call completes, so this never serves data
+    older than the request that produced it.
+    """
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key, fn, *args, **kwargs):
+        """
+        Runs fn(*args, **kwargs) once per key among concurrent callers.
+
+        Args:
+            key (hashable): Identity of the call, e.g. (method, endpoint, normalized params).
+            fn (callable): The function performing the upstream request.
+
+        Returns:
+            The result of the single upstream call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
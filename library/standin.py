@@ -0,0 +1,250 @@
+import time
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle
+from urllib.parse import urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import h2.config
+    import h2.events
+    import h2.connection
+    import h2.exceptions
+except ImportError:  # h2 is only needed for the HTTP/2 stand-in
+    h2 = None
+
+
+class StandinServer:
+    """
+    Local stand-in for the Verkada API, for load tests and trace replays.
+
+    POST /token returns a token, so clients authenticate as usual. Every other call
+    returns a JSON body of the recorded size and status when a trace is loaded (each
+    (method, endpoint) cycles through its recorded responses), and a small empty
+    page otherwise. latency_ms adds a fixed server-side delay to every response.
+
+    Usage:
+        with StandinServer(trace=load_trace("vapi_trace.jsonl")) as server:
+            vapi = BaseVapi(run_test=False, api_key="test", api_url=server.url)
+
+    Args:
+        host (str): Interface to bind.
+        port (int): Port to bind, 0 picks a free one.
+        trace (list, optional): Trace entries whose statuses and response sizes are replayed.
+        latency_ms (float): Delay added before each response.
+    """
+    def __init__(self, host="127.0.0.1", port=0, trace=None, latency_ms=0.0):
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.responses = {}
+        self.requests_served = 0
+        self.connections_accepted = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        recorded = {}
+        for entry in trace or []:
+            if entry.get("status") is None:
+                continue
+            key = (entry["method"], entry["endpoint"].split("?", 1)[0])
+            recorded.setdefault(key, []).append((entry["status"], entry.get("response_bytes") or 0))
+        self.responses = {key: cycle(values) for key, values in recorded.items()}
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def respond(self, method, path):
+        """Returns (status, body bytes) for a request."""
+        endpoint = urlsplit(path).path.lstrip("/")
+        if endpoint == "token":
+            return 200, b'{"token":"standin-token"}'
+        with self._lock:
+            self.requests_served += 1
+            responses = self.responses.get((method, endpoint))
+            status, size = next(responses) if responses is not None else (200, 0)
+        body = b'{"data":[],"next_page_token":null'
+        if size > len(body) + 1:
+            # Pad to the recorded size so transfer and decode costs match
+            body += b',"padding":"' + b"x" * max(size - len(body) - 14, 0) + b'"'
+        return status, body + b"}"
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out as separate writes; without this, delayed ACKs add ~40 ms
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections_accepted += 1
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                if server.latency_ms:
+                    time.sleep(server.latency_ms / 1000)
+                status, body = server.respond(self.command, self.path)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+# First bytes of every prior-knowledge HTTP/2 connection
+_H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+
+class Http2StandinServer(StandinServer):
+    """
+    HTTP/2 (cleartext, prior knowledge) variant of StandinServer, built on h2.
+
+    Streams on one connection are answered concurrently by a worker pool, so a
+    client can multiplex many requests over a single socket. Clients need
+    BaseVapi.enable_http2(prior_knowledge=True) to talk to it. Connections that do
+    not open with the HTTP/2 preface are served as HTTP/1.1, so the token request
+    and plain clients still work.
+
+    Args:
+        workers (int): Threads answering streams across all connections.
+        Other arguments are the same as StandinServer.
+    """
+    def __init__(self, host="127.0.0.1", port=0, trace=None, latency_ms=0.0, workers=64):
+        if h2 is None:
+            raise ImportError("The HTTP/2 stand-in needs h2. Install it with 'pip install h2'.")
+        super().__init__(host, port, trace, latency_ms)
+        self.workers = workers
+        self._socket = None
+        self._executor = None
+        self._stopping = threading.Event()
+
+    def start(self):
+        self._stopping.clear()
+        self._socket = socket.create_server((self.host, self.port))
+        # accept() is not woken by close() from another thread, so poll for stop()
+        self._socket.settimeout(0.5)
+        self.port = self._socket.getsockname()[1]
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        self._thread = threading.Thread(target=self._accept_loop, name="standin-h2", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._socket is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._socket.close()
+            self._socket = None
+            self._executor.shutdown(wait=False)
+
+    def _accept_loop(self):
+        while not self._stopping.is_set():
+            try:
+                client, address = self._socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            client.settimeout(None)
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self._serve_connection, args=(client, address), daemon=True).start()
+
+    def _serve_connection(self, client, address):
+        if client.recv(len(_H2_PREFACE), socket.MSG_PEEK | socket.MSG_WAITALL) != _H2_PREFACE:
+            # Plain HTTP/1.1 (e.g. the token request from the requests session) gets the regular handler
+            self._make_handler()(client, address, self)
+            client.close()
+            return
+        with self._lock:
+            self.connections_accepted += 1
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        # One lock guards the h2 state machine and the socket; window updates wake blocked senders
+        window = threading.Condition()
+        conn.initiate_connection()
+        client.sendall(conn.data_to_send())
+        requests_by_stream = {}
+        terminated = False
+        try:
+            while not self._stopping.is_set():
+                data = client.recv(65535)
+                if not data:
+                    break
+                with window:
+                    events = conn.receive_data(data)
+                    for event in events:
+                        if isinstance(event, h2.events.RequestReceived):
+                            requests_by_stream[event.stream_id] = dict(event.headers)
+                        elif isinstance(event, h2.events.DataReceived):
+                            conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                        elif isinstance(event, h2.events.StreamEnded):
+                            headers = requests_by_stream.pop(event.stream_id, {})
+                            self._executor.submit(self._reply, client, conn, window, event.stream_id, headers)
+                        elif isinstance(event, h2.events.WindowUpdated):
+                            window.notify_all()
+                        elif isinstance(event, h2.events.ConnectionTerminated):
+                            terminated = True
+                    client.sendall(conn.data_to_send())
+                if terminated:
+                    break
+        except (OSError, h2.exceptions.ProtocolError):
+            pass
+        finally:
+            client.close()
+
+    def _reply(self, client, conn, window, stream_id, headers):
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        status, body = self.respond(headers.get(":method", "GET"), headers.get(":path", "/"))
+        try:
+            with window:
+                conn.send_headers(stream_id, [
+                    (":status", str(status)),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(body))),
+                ])
+                while body:
+                    # Respect flow control: wait for the client to open the window when it is exhausted
+                    while conn.local_flow_control_window(stream_id) <= 0:
+                        window.wait(1)
+                    size = min(len(body), conn.local_flow_control_window(stream_id), conn.max_outbound_frame_size)
+                    conn.send_data(stream_id, body[:size])
+                    body = body[size:]
+                conn.end_stream(stream_id)
+                client.sendall(conn.data_to_send())
+        except (OSError, h2.exceptions.ProtocolError):
+            pass
@@ -0,0 +1,212 @@
+import json
+import math
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+# Not requests.jsonl: that name is taken by the change backlog at the repo root
+DEFAULT_TRACE_PATH = "vapi_trace.jsonl"
+
+
+def _body_size(request_kwargs):
+    body = request_kwargs.get("data")
+    if body is None:
+        return 0
+    return len(body.encode("utf-8") if isinstance(body, str) else body)
+
+
+class TraceRecorder:
+    """
+    Appends one JSON line per HTTP call.
+
+    Lines look like {"ts": 1700000000.123, "method": "GET", "endpoint": "cameras/v1/devices",
+    "params": {...}, "request_bytes": 0, "status": 200, "response_bytes": 5120,
+    "latency_ms": 84.2, "error": null}. Lines are buffered and written in batches so
+    recording stays off the request's critical path; close() flushes the rest.
+
+    Args:
+        path (str): Trace file, opened for appending.
+        flush_every (int): Lines buffered before they are written.
+    """
+    def __init__(self, path=DEFAULT_TRACE_PATH, flush_every=100):
+        self.path = path
+        self.flush_every = flush_every
+        self._file = open(path, "a", encoding="utf-8")
+        self._buffer = []
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def record(self, send, method, url, endpoint, request_kwargs):
+        """Calls send(method, url, request_kwargs), records the outcome, and returns or re-raises it."""
+        started = time.time()
+        start = time.perf_counter()
+        entry = {
+            "ts": round(started, 6),
+            "method": method,
+            "endpoint": endpoint,
+            "params": request_kwargs.get("params"),
+            "request_bytes": _body_size(request_kwargs),
+        }
+        try:
+            response = send(method, url, request_kwargs)
+        except Exception as e:
+            entry.update(status=None, response_bytes=0, error=type(e).__name__)
+            raise
+        else:
+            entry.update(status=response.status_code, response_bytes=len(response.content or b""), error=None)
+            return response
+        finally:
+            entry["latency_ms"] = round((time.perf_counter() - start) * 1000, 3)
+            self.write(entry)
+
+    def write(self, entry):
+        line = json.dumps(entry, separators=(",", ":"), default=str)
+        with self._lock:
+            self._buffer.append(line)
+            self.count += 1
+            if len(self._buffer) >= self.flush_every:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        if self._buffer:
+            self._file.write("\n".join(self._buffer) + "\n")
+            self._file.flush()
+            self._buffer = []
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        with self._lock:
+            self._flush_locked()
+            self._file.close()
+
+
+def load_trace(path):
+    """Returns the entries of a trace file sorted by start time (skipping blank or malformed lines)."""
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and "method" in entry and "endpoint" in entry:
+                entries.append(entry)
+    entries.sort(key=lambda entry: entry.get("ts", 0))
+    return entries
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize_latencies(latencies_ms):
+    values = sorted(latencies_ms)
+    return {
+        "p50": percentile(values, 0.50),
+        "p90": percentile(values, 0.90),
+        "p99": percentile(values, 0.99),
+        "max": values[-1] if values else None,
+    }
+
+
+# Client attributes cleared for a raw replay and restored afterwards
+RAW_REPLAY_ATTRIBUTES = ("singleflight", "response_cache", "retry_policy", "circuit_breakers")
+
+
+def replay_trace(vapi, entries, speed=1.0, max_workers=32, raw=True):
+    """
+    Re-issues recorded calls through a client and measures how they perform.
+
+    Calls keep their recorded spacing divided by speed (1 for real time, 10 for ten
+    times faster); speed=None sends them as fast as max_workers allows. Requests go
+    through vapi.send_request, so the codec, scheduler and rate limiter are part of
+    what is measured.
+
+    A trace already holds one line per attempt, retries included. By default the
+    client's singleflight, response cache, retries and circuit breakers are turned
+    off for the replay, so every entry is sent exactly once and recorded errors are
+    reported as errors instead of being coalesced, served from cache or retried away.
+    They are restored when the replay ends; other threads using vapi meanwhile run
+    without them, so replay on a dedicated client.
+
+    Args:
+        vapi (BaseVapi): Client to send with, usually pointed at a StandinServer.
+        entries (list): Trace entries from load_trace().
+        speed (float, optional): Replay speed multiplier, or None for maximum speed.
+        max_workers (int): Concurrent requests.
+        raw (bool): Disable coalescing, caching, retries and breakers on vapi before replaying.
+
+    Returns:
+        dict: requests, duration_s, throughput_rps, latency_ms percentiles, error_rate,
+        statuses, and the recorded latency percentiles for comparison.
+    """
+    if not entries:
+        raise ValueError("The trace has no entries to replay")
+    if not raw:
+        return _replay(vapi, entries, speed, max_workers)
+    saved = {name: getattr(vapi, name) for name in RAW_REPLAY_ATTRIBUTES}
+    for name in RAW_REPLAY_ATTRIBUTES:
+        setattr(vapi, name, None)
+    try:
+        return _replay(vapi, entries, speed, max_workers)
+    finally:
+        for name, value in saved.items():
+            setattr(vapi, name, value)
+
+
+def _replay(vapi, entries, speed, max_workers):
+    first_ts = entries[0].get("ts", 0)
+    latencies = []
+    statuses = {}
+    errors = 0
+    lock = threading.Lock()
+
+    def send(entry):
+        nonlocal errors
+        data = b"x" * entry["request_bytes"] if entry.get("request_bytes") else None
+        start = time.perf_counter()
+        try:
+            response = vapi.send_request(entry["endpoint"], data=data, params=entry.get("params"), method=entry["method"])
+            status = response.status_code
+        except requests.exceptions.RequestException as e:
+            status = type(e).__name__
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            latencies.append(elapsed)
+            statuses[status] = statuses.get(status, 0) + 1
+            if not isinstance(status, int) or status >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    futures = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for entry in entries:
+            if speed:
+                delay = (entry.get("ts", first_ts) - first_ts) / speed - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+            futures.append(executor.submit(send, entry))
+    duration = time.perf_counter() - started
+    for future in futures:
+        # Anything other than a request error (e.g. a malformed entry) fails the replay
+        future.result()
+
+    recorded = [entry["latency_ms"] for entry in entries if entry.get("latency_ms") is not None]
+    return {
+        "requests": len(latencies),
+        "duration_s": duration,
+        "throughput_rps": len(latencies) / duration if duration else None,
+        "latency_ms": summarize_latencies(latencies),
+        "recorded_latency_ms": summarize_latencies(recorded),
+        "error_rate": errors / len(latencies),
+        "statuses": statuses,
+    }
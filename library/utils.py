@@ -1,6 +1,10 @@
 # utils.py
+import atexit
+import queue
+import threading
 import traceback
 import logging
+import logging.handlers
 
 # ANSI escape codes for colors
 class colors:
@@ -15,11 +19,12 @@ class colors:
 
     @staticmethod
     def print_error(e):
+        """Prints an API error's details. Callers decide whether to exit."""
         error_details = [
-            ("Error Message", e.message),
-            ("Endpoint", e.endpoint),
-            ("API Key", e.api_key),
-            ("Traceback", ''.join(e.traceback_info))
+            ("Error Message", getattr(e, "message", str(e))),
+            ("Endpoint", getattr(e, "endpoint", None)),
+            ("API Key", getattr(e, "api_key", None)),
+            ("Traceback", ''.join(getattr(e, "traceback_info", None) or [])),
         ]
 
         for label, detail in error_details:
@@ -28,35 +33,109 @@ class colors:
                     f"{colors.colorize(colors.YELLOW, f'{label}:')} {colors.colorize(colors.CYAN, str(detail))}"
                 )
 
-        exit(e.code)
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that hands the raw record over; formatting happens on the listener thread."""
+    def prepare(self, record):
+        return record
 
 # General Error Handler Class
 class ErrorHandler:
-    def __init__(self, log_file="errors.log"):
-        logging.basicConfig(filename=log_file, level=logging.ERROR,
-                            format='%(asctime)s - %(levelname)s - %(message)s')
+    """
+    Logs errors to a file through a background queue.
 
-    def handle(self, error, custom_message="An error occurred"):
-        # Log the error details
-        logging.error(f"{custom_message}: {str(error)}")
-        logging.error(f"Traceback: {traceback.format_exc()}")
+    handle() only enqueues a record; the QueueListener thread formats the message and
+    traceback and does the file I/O, so hot request loops never block on logging.
+    The listener thread and the log file are only started on the first error, not at
+    import time. handle_http_errors and the request path's transport failures log here.
 
-        # Print the error details to the console for immediate feedback
-        print(f"{colors.colorize(colors.RED, custom_message)}")
-        print(f"{colors.colorize(colors.CYAN, str(error))}")
-        print(f"Traceback: {traceback.format_exc()}")
+    Args:
+        log_file (str): File errors are appended to.
+    """
+    def __init__(self, log_file="errors.log"):
+        self.log_file = log_file
+        self.logger = logging.getLogger("vapi.errors")
+        self.logger.setLevel(logging.ERROR)
+        self.logger.propagate = False
+        self.queue = queue.SimpleQueue()
+        self.logger.addHandler(_DeferredQueueHandler(self.queue))
+        self.listener = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        with self._lock:
+            if self.listener is not None:
+                return
+            file_handler = logging.FileHandler(self.log_file, delay=True)
+            file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+            self.listener = logging.handlers.QueueListener(self.queue, file_handler)
+            self.listener.start()
+            # Flush anything still queued when the interpreter exits
+            atexit.register(self.listener.stop)
+
+    def handle(self, error, custom_message="An error occurred", echo=True):
+        """
+        Logs an error with its traceback in the background.
+
+        Args:
+            error (Exception): The error to record.
+            custom_message (str): Context for the log line.
+            echo (bool): Also print a one-line summary to the console. Bulk paths pass False.
+        """
+        if self.listener is None:
+            self._start()
+        # exc_info is formatted once, by the listener thread
+        self.logger.error("%s: %s", custom_message, error, exc_info=(type(error), error, error.__traceback__))
+
+        if echo:
+            print(f"{colors.colorize(colors.RED, custom_message)}: {colors.colorize(colors.CYAN, str(error))}")
 
 # Initialize a global instance
 error_handler = ErrorHandler()
 class BaseAPIException(Exception):
-    """Base exception class for API errors."""
-    def __init__(self, message, code=None, endpoint=None, api_key=None):
+    """
+    Base exception class for API errors.
+
+    Construction is cheap: nothing is printed and the traceback is only formatted
+    when traceback_info is read. Raise it, or return it from bulk paths that collect
+    failures instead of stopping on the first one.
+    """
+    def __init__(self, message, code=None, endpoint=None, api_key=None, status_code=None):
         self.message = message
         self.code = code
         self.endpoint = endpoint
         self.api_key = api_key
-        self.traceback_info = traceback.format_stack()
-        super().__init__(colors.print_error(self))
+        self.status_code = status_code
+        super().__init__(message)
+
+    @property
+    def traceback_info(self):
+        """Formatted traceback lines, computed on demand from where the exception was raised."""
+        if self.__traceback__ is None:
+            return []
+        return traceback.format_tb(self.__traceback__)
+
+    def to_dict(self):
+        """Structured form for logs and bulk results."""
+        return {
+            "error": type(self).__name__,
+            "message": self.message,
+            "code": self.code,
+            "status_code": self.status_code,
+            "endpoint": self.endpoint,
+        }
+
+def error_for_status(status_code, endpoint=None, api_key=None):
+    """
+    Returns the exception matching an HTTP error status without raising it, or None for non-error statuses.
+
+    Bulk paths can collect these per item and keep going; handle_http_errors raises them.
+    """
+    if status_code < 400:
+        return None
+    error_class = HTTP_ERRORS.get(status_code)
+    if error_class is None:
+        return HTTPStatusError(status_code, endpoint=endpoint, api_key=api_key)
+    return error_class(endpoint=endpoint, api_key=api_key)
 
 class FailedConfigLoad(BaseAPIException):
     """Custom exception class for Verkada API framework."""
@@ -85,34 +164,62 @@ class ClientErrorBadRequest(BaseAPIException):
     """Custom exception for 400 Bad Request errors."""
     def __init__(self, endpoint=None, api_key=None):
         message = "Request response code 400 - Bad Request"
-        super().__init__(message, code=12, endpoint=endpoint, api_key=api_key)
+        super().__init__(message, code=12, endpoint=endpoint, api_key=api_key, status_code=400)
 
 class ClientErrorUnauthorized(BaseAPIException):
     """Custom exception for 401 unauthorized error"""
     def __init__(self, endpoint=None, api_key=None):
         message = "Request response code 401 - Unauthorized"
-        super().__init__(message, code=13, endpoint=endpoint, api_key=api_key)
+        super().__init__(message, code=13, endpoint=endpoint, api_key=api_key, status_code=401)
 
 class ClientErrorForbidden(BaseAPIException):
     """Custom exception for 403 forbidden error"""
     def __init__(self, endpoint=None, api_key=None):
         message = "Request response code 403 - Forbidden"
-        super().__init__(message, code=14, endpoint=endpoint, api_key=api_key)
+        super().__init__(message, code=14, endpoint=endpoint, api_key=api_key, status_code=403)
 
 class ClientErrorNotFound(BaseAPIException):
     """Custom exception for 404 not found error"""
     def __init__(self, endpoint=None, api_key=None):
         message = "Request response code 404 - Endpoint not found"
-        super().__init__(message, code=15, endpoint=endpoint, api_key=api_key)
+        super().__init__(message, code=15, endpoint=endpoint, api_key=api_key, status_code=404)
 
 class ClientErrorTooManyRequests(BaseAPIException):
     """Custom exception for 429 too many requests error"""
     def __init__(self, endpoint=None, api_key=None):
         message = "Request response code 429 - Too many requests, rate limited"
-        super().__init__(message, code=16, endpoint=endpoint, api_key=api_key)
+        super().__init__(message, code=16, endpoint=endpoint, api_key=api_key, status_code=429)
 
 class ServerErrorInternal(BaseAPIException):
     """Custom exception for 500 internal server error"""
     def __init__(self, endpoint=None, api_key=None):
         message = "Request response code 500 - Internal Server Error"
-        super().__init__(message, code=17, endpoint=endpoint, api_key=api_key)
+        super().__init__(message, code=17, endpoint=endpoint, api_key=api_key, status_code=500)
+
+class InvalidHelixAttributes(BaseAPIException):
+    """Custom exception for Helix event attributes that do not match the event type schema"""
+    def __init__(self, event_type_uid, problems):
+        self.problems = problems
+        message = f"Helix attributes do not match the schema of event type {event_type_uid}: {'; '.join(problems)}"
+        super().__init__(message, code=18)
+
+class UnknownHelixEventType(BaseAPIException):
+    """Custom exception for a Helix event type uid or name that does not exist in the organization"""
+    def __init__(self, event_type):
+        message = f"Unknown Helix event type: {event_type}"
+        super().__init__(message, code=19)
+
+class HTTPStatusError(BaseAPIException):
+    """Custom exception for HTTP error statuses without a dedicated class"""
+    def __init__(self, status_code, endpoint=None, api_key=None):
+        message = f"Request response code {status_code}"
+        super().__init__(message, code=20, endpoint=endpoint, api_key=api_key, status_code=status_code)
+
+HTTP_ERRORS = {
+    400: ClientErrorBadRequest,
+    401: ClientErrorUnauthorized,
+    403: ClientErrorForbidden,
+    404: ClientErrorNotFound,
+    429: ClientErrorTooManyRequests,
+    500: ServerErrorInternal,
+}
@@ -4,14 +4,22 @@ import requests
 import time
 
 class VerkadaClient:
-    def __init__(self, api_key: str, region: str = "US"):
+    def __init__(self, api_key: str = None, region: str = "US", context=None):
         """
         :param api_key:  The top-level API Key you generated in Command.
         :param region:   'US' for https://api.verkada.com, 'EU' for https://api.eu.verkada.com.
+        :param context:  Optional VapiContext; its token and connection pool are reused instead of authenticating again.
         """
-        self.api_key = api_key
-        self.base_url = "https://api.verkada.com" if region == "US" else "https://api.eu.verkada.com"
-        
+        self.context = context
+        if context is not None:
+            self.api_key = context.api_key
+            self.base_url = context.api_url
+            self.session = context.session
+        else:
+            self.api_key = api_key
+            self.base_url = "https://api.verkada.com" if region == "US" else "https://api.eu.verkada.com"
+            self.session = requests.Session()
+
         self._token = None
         self._token_expires_at = 0  # Store an expiration time (Unix timestamp) if you want to refresh automatically
 
@@ -23,12 +31,17 @@ class VerkadaClient:
         Retrieves a new short-lived token using the top-level API Key.
         Called automatically on client initialization or token expiration.
         """
+        if self.context is not None:
+            # The context caches and refreshes its own token
+            self._token = self.context.fetch_api_token()
+            self._token_expires_at = self.context.token_expires_in
+            return
         url = f"{self.base_url}/token"
         headers = {
             "Accept": "application/json",
             "x-api-key": self.api_key
         }
-        resp = requests.post(url, headers=headers, timeout=15)
+        resp = self.session.post(url, headers=headers, timeout=15)
         resp.raise_for_status()
         data = resp.json()
         self._token = data["token"]
@@ -65,7 +78,7 @@ class VerkadaClient:
         Example GET request to retrieve camera alerts.
         """
         url = f"{self.base_url}/cameras/v1/alerts"
-        resp = requests.get(url, headers=self._headers(), timeout=15)
+        resp = self.session.get(url, headers=self._headers(), timeout=15)
         resp.raise_for_status()
         return resp.json()
 
@@ -74,7 +87,7 @@ class VerkadaClient:
         Example of listing devices (assuming your environment has the correct endpoint).
         """
         url = f"{self.base_url}/cameras/v1/devices"
-        resp = requests.get(url, headers=self._headers(), timeout=15)
+        resp = self.session.get(url, headers=self._headers(), timeout=15)
         resp.raise_for_status()
         return resp.json()
 
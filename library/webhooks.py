@@ -0,0 +1,224 @@
+import hmac
+import time
+import queue
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+import library.utils as utils
+from library.codec import get_codec
+from library.records import HelixEvent, LprDetection
+
+SIGNATURE_HEADER = "Verkada-Signature"
+
+# Webhook types whose "data" is converted to a record before reaching handlers
+TYPED_PAYLOADS = {
+    "lpr": LprDetection.from_json,
+    "helix_event": HelixEvent.from_json,
+}
+
+
+def sign_payload(secret, body, timestamp=None):
+    """
+    Builds a signature header value for a body: "<timestamp>|<hex HMAC-SHA256 of '<timestamp>|<body>'>".
+
+    Args:
+        secret (str): The webhook's shared secret.
+        body (bytes): The exact request body.
+        timestamp (int, optional): Unix seconds, defaults to now.
+    """
+    timestamp = str(int(timestamp if timestamp is not None else time.time()))
+    digest = hmac.new(secret.encode("utf-8"), timestamp.encode("ascii") + b"|" + body, hashlib.sha256).hexdigest()
+    return f"{timestamp}|{digest}"
+
+
+def verify_signature(secret, body, header, tolerance=300):
+    """
+    Checks a signature header against the body, rejecting replays older than tolerance seconds.
+
+    Returns:
+        bool: True if the signature is valid and fresh.
+    """
+    if not header or "|" not in header:
+        return False
+    timestamp, signature = header.split("|", 1)
+    if not timestamp.isdigit() or abs(time.time() - int(timestamp)) > tolerance:
+        return False
+    expected = sign_payload(secret, body, int(timestamp)).split("|", 1)[1]
+    return hmac.compare_digest(expected, signature)
+
+
+def post_sample(url, secret, payload, timestamp=None):
+    """Signs and posts a sample payload to a receiver, e.g. to exercise handlers locally."""
+    body = get_codec().dumps(payload)
+    headers = {"content-type": "application/json", SIGNATURE_HEADER: sign_payload(secret, body, timestamp)}
+    return requests.post(url, data=body, headers=headers, timeout=5)
+
+
+class WebhookReceiver:
+    """
+    Lightweight HTTP receiver for Verkada webhooks.
+
+    Requests are verified and acknowledged on the connection thread, then queued on a
+    bounded queue; worker threads dispatch payloads to the handlers registered for their
+    webhook_type. When the queue is full the receiver answers 503 so Verkada retries
+    later, instead of accepting work it cannot keep up with.
+
+    Usage:
+        receiver = WebhookReceiver(secret, port=8080)
+
+        @receiver.on("lpr")
+        def plate_seen(detection, payload):
+            ...
+
+        receiver.start()
+
+    Args:
+        secret (str): Shared secret used to verify signatures.
+        host (str): Interface to bind.
+        port (int): Port to bind, 0 picks a free one.
+        workers (int): Number of dispatch threads.
+        queue_size (int): Maximum payloads waiting for dispatch.
+        tolerance (float): Maximum signature age in seconds.
+        max_body (int): Largest accepted request body in bytes.
+        insecure (bool): Accept unsigned requests when secret is None (local testing only).
+
+    Raises:
+        ValueError: If secret is None and insecure is not set.
+    """
+    def __init__(self, secret, host="127.0.0.1", port=8080, workers=4, queue_size=1000, tolerance=300, max_body=1 << 20,
+                 insecure=False):
+        if secret is None and not insecure:
+            raise ValueError("A webhook secret is required; pass insecure=True to skip signature checks for local testing")
+        self.secret = secret
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.tolerance = tolerance
+        self.max_body = max_body
+        self.codec = get_codec()
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.handlers = {}
+        self.stats = {"accepted": 0, "rejected": 0, "dropped": 0, "dispatched": 0, "errors": 0}
+        self._server = None
+        self._threads = []
+
+    def on(self, webhook_type, handler=None):
+        """
+        Registers handler(record_or_data, payload) for a webhook_type ("*" receives every type).
+
+        Usable directly or as a decorator.
+        """
+        def register(fn):
+            self.handlers.setdefault(webhook_type, []).append(fn)
+            return fn
+        return register(handler) if handler is not None else register
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/"
+
+    def _make_handler(self):
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _reply(self, status):
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length <= 0 or length > receiver.max_body:
+                    receiver.stats["rejected"] += 1
+                    return self._reply(413 if length > receiver.max_body else 400)
+                body = self.rfile.read(length)
+                if receiver.secret is not None and not verify_signature(
+                    receiver.secret, body, self.headers.get(SIGNATURE_HEADER), receiver.tolerance
+                ):
+                    receiver.stats["rejected"] += 1
+                    return self._reply(401)
+                try:
+                    payload = receiver.codec.loads(body)
+                except ValueError:
+                    payload = None
+                if not isinstance(payload, dict):
+                    # Valid JSON that is not an object (e.g. a list) is not a webhook payload
+                    receiver.stats["rejected"] += 1
+                    return self._reply(400)
+                try:
+                    receiver.queue.put_nowait(payload)
+                except queue.Full:
+                    receiver.stats["dropped"] += 1
+                    return self._reply(503)
+                receiver.stats["accepted"] += 1
+                self._reply(200)
+
+            def log_message(self, format, *args):
+                # Keep the hot path quiet; stats carry the counts
+                pass
+
+        return Handler
+
+    def start(self):
+        self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._threads = [threading.Thread(target=self._server.serve_forever, name="webhook-server", daemon=True)]
+        self._threads += [threading.Thread(target=self._dispatch_loop, name=f"webhook-worker-{i}", daemon=True) for i in range(self.workers)]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self):
+        """Stops accepting requests and lets queued payloads finish dispatching."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for _ in range(self.workers):
+            self.queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def dispatch(self, payload):
+        """Runs the handlers for one payload; called by the workers, usable directly in tests."""
+        if not isinstance(payload, dict):
+            self.stats["errors"] += 1
+            utils.error_handler.handle(TypeError(f"Expected a JSON object, got {type(payload).__name__}"), "Webhook payload rejected")
+            return
+        webhook_type = payload.get("webhook_type")
+        data = payload.get("data", payload)
+        convert = TYPED_PAYLOADS.get(webhook_type)
+        item = convert(data) if convert is not None and isinstance(data, dict) else data
+        for handler in self.handlers.get(webhook_type, []) + self.handlers.get("*", []):
+            try:
+                handler(item, payload)
+            except Exception as e:
+                self.stats["errors"] += 1
+                utils.error_handler.handle(e, f"Webhook handler {getattr(handler, '__name__', handler)} failed")
+        self.stats["dispatched"] += 1
+
+    def _dispatch_loop(self):
+        while True:
+            payload = self.queue.get()
+            if payload is None:
+                break
+            try:
+                self.dispatch(payload)
+            except Exception as e:
+                # e.g. a record conversion failing on malformed data; the worker must outlive it
+                self.stats["errors"] += 1
+                utils.error_handler.handle(e, "Webhook dispatch failed")
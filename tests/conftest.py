@@ -0,0 +1,42 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+import library.utils as utils
+from library.base_vapi import BaseVapi
+from library.standin import StandinServer
+
+
+@pytest.fixture(autouse=True, scope="session")
+def error_log(tmp_path_factory):
+    # Keep error logging out of the repository's errors.log
+    utils.error_handler.log_file = str(tmp_path_factory.mktemp("logs") / "errors.log")
+    return utils.error_handler.log_file
+
+
+@pytest.fixture
+def standin():
+    with StandinServer() as server:
+        yield server
+
+
+@pytest.fixture
+def vapi(standin, monkeypatch):
+    # BaseVapi reads config.ini from the working directory
+    monkeypatch.chdir(ROOT)
+    client = BaseVapi(run_test=False, api_key="test", streaming_api_key="test", api_url=standin.url)
+    yield client
+    client.session.close()
+
+
+@pytest.fixture
+def context(standin, monkeypatch):
+    from library.context import VapiContext
+    monkeypatch.chdir(ROOT)
+    client = VapiContext(api_key="test", streaming_api_key="test", api_url=standin.url)
+    yield client
+    client.session.close()
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from library.audit_log import AuditLogTailer
+
+
+class FakeAuditApi:
+    ENDPOINTS = {"audit_log": "core/v1/audit_log"}
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def paginate_pages(self, endpoint, items_key, params=None, page_size=100, method="GET", json=None):
+        for page in self.pages:
+            yield [entry for entry in page if entry["timestamp"] >= params["start_time"]]
+
+
+def entry(timestamp, event):
+    return {"timestamp": timestamp, "event": event}
+
+
+PAGES = [[entry(100, "a"), entry(101, "b")], [entry(102, "c")]]
+
+
+def consume(tailer, fail_on=None):
+    taken = []
+    for item in tailer.poll():
+        if item["event"] == fail_on:
+            raise RuntimeError("consumer failed")
+        taken.append(item["event"])
+    return taken
+
+
+def test_page_is_only_committed_after_the_consumer_took_it(tmp_path):
+    cursor = str(tmp_path / "audit.cursor")
+    api = FakeAuditApi(PAGES)
+    with pytest.raises(RuntimeError):
+        consume(AuditLogTailer(api, cursor_path=cursor, start_time=100), fail_on="c")
+    # The first page was taken in full; the second was not, so it comes again
+    assert consume(AuditLogTailer(api, cursor_path=cursor)) == ["c"]
+    assert consume(AuditLogTailer(api, cursor_path=cursor)) == []
+
+
+def test_failure_mid_page_redelivers_the_page(tmp_path):
+    cursor = str(tmp_path / "audit.cursor")
+    api = FakeAuditApi(PAGES)
+    with pytest.raises(RuntimeError):
+        consume(AuditLogTailer(api, cursor_path=cursor, start_time=100), fail_on="b")
+    assert consume(AuditLogTailer(api, cursor_path=cursor, start_time=100)) == ["a", "b", "c"]
+
+
+def test_completed_poll_moves_the_cursor_to_the_newest_entry(tmp_path):
+    cursor = str(tmp_path / "audit.cursor")
+    api = FakeAuditApi(PAGES)
+    tailer = AuditLogTailer(api, cursor_path=cursor, start_time=100)
+    assert consume(tailer) == ["a", "b", "c"]
+    assert tailer.cursor.start_time == 102
+    assert len(tailer.cursor.seen) == 1
+
+    api.pages = PAGES + [[entry(102, "d"), entry(103, "e")]]
+    assert consume(AuditLogTailer(api, cursor_path=cursor)) == ["d", "e"]
+
+
+def test_cursor_stays_bounded_while_catching_up(tmp_path):
+    cursor = str(tmp_path / "audit.cursor")
+    # 50 pages of 4 entries, two entries per second
+    pages = [[entry(1000 + page * 2 + i // 2, f"{page}-{i}") for i in range(4)] for page in range(50)]
+    tailer = AuditLogTailer(FakeAuditApi(pages), cursor_path=cursor, start_time=1000)
+    largest = 0
+    taken = 0
+    for _ in tailer.poll():
+        taken += 1
+        largest = max(largest, len(tailer.cursor.seen))
+    assert taken == 200
+    assert largest <= 2
+    assert tailer.cursor.start_time == 1099
+    with open(cursor) as f:
+        assert len(json.load(f)["seen"]) == 2
+    # Resuming re-reads only the boundary second and delivers nothing twice
+    assert consume(AuditLogTailer(FakeAuditApi(pages), cursor_path=cursor)) == []
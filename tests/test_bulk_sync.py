@@ -0,0 +1,47 @@
+import requests
+
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"{}"):
+        self.status_code = status_code
+        self.content = body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error")
+
+
+def test_lpoi_sync_records_a_failed_write_and_applies_the_rest(context, monkeypatch):
+    lpr = context.lpr
+    monkeypatch.setattr(lpr, "iter_license_plates_of_interest", lambda: iter([{"license_plate": "OLD1"}]))
+    sent = []
+
+    def send_request(endpoint, json=None, params=None, method="GET", **kwargs):
+        plate = (json or {}).get("license_plate") or params["license_plate"]
+        if plate == "BAD1":
+            raise requests.exceptions.ConnectionError("reset")
+        sent.append((method, plate))
+        return FakeResponse(200)
+
+    monkeypatch.setattr(lpr, "send_request", send_request)
+    plan = lpr.sync_license_plates_of_interest({"GOOD1": "a", "BAD1": "b"}, requests_per_second=1000)
+    results = {plate: status for _, plate, status in plan["results"]}
+    assert results["GOOD1"] == 200 and results["OLD1"] == 200
+    assert results["BAD1"].startswith("ConnectionError")
+    assert sorted(sent) == [("DELETE", "OLD1"), ("POST", "GOOD1")]
+
+
+def test_access_export_skips_users_that_fail_to_load(context, monkeypatch):
+    access = context.access
+
+    def get_access_user(user_id):
+        if user_id == "gone":
+            raise requests.exceptions.HTTPError("404 Client Error")
+        return {"user_id": user_id}
+
+    monkeypatch.setattr(access, "get_access_user", get_access_user)
+    errors = []
+    users = list(access.iter_access_user_details(["a", "gone", "b"], max_workers=2, errors=errors))
+    assert [user["user_id"] for user in users] == ["a", "b"]
+    assert [key for key, _ in errors] == ["gone"]
@@ -0,0 +1,27 @@
+import time
+import threading
+
+import library.client_pool as client_pool
+from library.client_pool import ClientPool, Tenant
+
+
+def test_racing_threads_build_one_context_per_tenant(monkeypatch):
+    built = []
+
+    class SlowContext:
+        def __init__(self, api_key=None, org_id=None, region=None):
+            # Stands in for the token fetch done when a real VapiContext is created
+            time.sleep(0.05)
+            built.append(org_id)
+
+    monkeypatch.setattr(client_pool, "VapiContext", SlowContext)
+    pool = ClientPool([Tenant("a", "org-a", "key-a"), Tenant("b", "org-b", "key-b")])
+    results = []
+    threads = [threading.Thread(target=lambda name=name: results.append(pool.context(name))) for name in ["a", "b"] * 8]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(built) == ["org-a", "org-b"]
+    assert len({id(context) for context in results}) == 2
@@ -0,0 +1,78 @@
+import pytest
+
+import library.codec as codec
+from library.codec import OrjsonCodec, StdlibJsonCodec, get_codec
+
+needs_orjson = pytest.mark.skipif(codec.orjson is None, reason="orjson is not installed")
+
+# Bodies shaped like the ones _send encodes: filters, bulk writes, unicode names, nested attributes
+PAYLOADS = [
+    {},
+    [],
+    {"camera_ids": ["cam-1", "cam-2"], "start_time": 1700000000, "end_time": 1700003600, "page_size": 200},
+    {"license_plate": "ABC1234", "description": "Café délivery – 配達", "emoji": "\U0001F697"},
+    {"attributes": {"mph": 42, "ratio": 0.1, "score": -3.25, "flagged": False, "note": None}},
+    {"time_ms": 2 ** 53 + 1, "offset": -(2 ** 63), "big": 2 ** 64 - 1},
+    [{"user_id": "u-1", "groups": [{"id": 1}, {"id": 2}]}, {"user_id": "u-2", "groups": []}],
+    {"quote": 'say "hi"', "path": "C:\\temp", "control": "line\nbreak\ttab"},
+]
+
+
+@needs_orjson
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_backends_encode_to_the_same_bytes(payload):
+    assert OrjsonCodec().dumps(payload) == StdlibJsonCodec().dumps(payload)
+
+
+@needs_orjson
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_each_backend_decodes_the_others_output(payload):
+    stdlib, fast = StdlibJsonCodec(), OrjsonCodec()
+    assert stdlib.loads(fast.dumps(payload)) == payload
+    assert fast.loads(stdlib.dumps(payload)) == payload
+
+
+@needs_orjson
+def test_floats_decode_to_the_same_values():
+    payload = {"values": [1e20, 1.5e-7, 123456.789, 0.0]}
+    stdlib, fast = StdlibJsonCodec(), OrjsonCodec()
+    # The exponent spelling may differ, the numbers may not
+    assert fast.loads(stdlib.dumps(payload)) == stdlib.loads(fast.dumps(payload)) == payload
+
+
+@needs_orjson
+def test_int_keys_are_written_as_strings_by_both():
+    payload = {1: "a", 2: {3: "b"}}
+    assert OrjsonCodec().dumps(payload) == StdlibJsonCodec().dumps(payload) == b'{"1":"a","2":{"3":"b"}}'
+
+
+@needs_orjson
+def test_both_accept_str_and_bytes_bodies():
+    body = '{"name":"Café"}'
+    for backend in (StdlibJsonCodec(), OrjsonCodec()):
+        assert backend.loads(body) == backend.loads(body.encode("utf-8")) == {"name": "Café"}
+
+
+@needs_orjson
+def test_get_codec_prefers_orjson_when_installed():
+    assert get_codec().name == "orjson"
+    assert get_codec("json").name == "json"
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        get_codec("simplejson")
+
+
+def test_falls_back_to_stdlib_without_orjson(monkeypatch):
+    monkeypatch.setattr(codec, "orjson", None)
+    fallback = get_codec()
+    assert isinstance(fallback, StdlibJsonCodec)
+    assert fallback.loads(fallback.dumps(PAYLOADS[3])) == PAYLOADS[3]
+    with pytest.raises(ImportError, match="pip install orjson"):
+        get_codec("orjson")
+
+
+def test_client_uses_the_fallback_without_orjson(vapi, monkeypatch):
+    monkeypatch.setattr(codec, "orjson", None)
+    vapi.set_json_codec(None)
+    assert vapi.codec.name == "json"
+    response = vapi.send_request("cameras/v1/devices")
+    assert vapi.decode_json(response) == response.json()
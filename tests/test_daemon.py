@@ -0,0 +1,96 @@
+import os
+import json
+import socket
+import tempfile
+
+import pytest
+
+from library.daemon import DaemonProxy, VapiDaemon, _default_socket_path, client_for, daemon_available
+
+
+def test_daemon_only_serves_allowlisted_api_calls(context):
+    daemon = VapiDaemon(socket_path="unused")
+    daemon.context = context
+
+    reply = daemon.execute({"product": "helix", "method": "get_helix_event_types"})
+    assert reply["ok"] and reply["result"].status_code == 200
+
+    for product, method in [("helix", "enable_tracing"), ("lpr", "configure_resilience"), ("helix", "send_request"),
+                            ("base", "send_request"), ("lpr", "_send"), ("camera", "download_all_cameras")]:
+        reply = daemon.execute({"product": product, "method": method, "args": ["/tmp/trace.jsonl"]})
+        assert reply == {"ok": False, "error": "PermissionError", "message": f"{product}.{method} is not served by the daemon"}
+    assert context.trace_recorder is None
+
+
+def test_proxy_sends_the_priority_set_by_request_priority():
+    calls = []
+
+    class Client:
+        def call(self, product, method, *args, priority="interactive", **kwargs):
+            calls.append((product, method, priority))
+
+    proxy = DaemonProxy(Client(), "helix")
+    proxy.get_helix_event_types()
+    with proxy.request_priority("bulk"):
+        proxy.delete_helix_event("camera", 1, "uid")
+    proxy.get_helix_event_types()
+    assert calls == [("helix", "get_helix_event_types", "interactive"), ("helix", "delete_helix_event", "bulk"),
+                     ("helix", "get_helix_event_types", "interactive")]
+
+
+def test_unknown_priority_gets_an_error_reply(context):
+    daemon = VapiDaemon(socket_path="unused")
+    daemon.context = context
+    reply = daemon.execute({"product": "helix", "method": "get_helix_event_types", "priority": "urgent"})
+    assert reply["ok"] is False and reply["error"] == "ValueError"
+
+
+def test_malformed_commands_get_error_replies(context):
+    daemon = VapiDaemon(socket_path="unused")
+    daemon.context = context
+    for command in [["helix"], "helix", 42, None]:
+        assert daemon.execute(command)["error"] == "TypeError"
+    for command in [{"product": "helix", "method": "get_helix_event_types", "args": {"a": 1}},
+                    {"product": "helix", "method": "get_helix_event_types", "kwargs": []}]:
+        assert daemon.execute(command)["error"] == "TypeError"
+    assert daemon.execute({"product": ["helix"], "method": "get_helix_event_types"})["error"] == "PermissionError"
+    assert daemon.execute({"product": "camera", "method": "get_stream_token"})["error"] == "PermissionError"
+
+
+def test_connection_survives_a_non_object_line(context):
+    directory = tempfile.mkdtemp(dir="/tmp")
+    daemon = VapiDaemon(socket_path=os.path.join(directory, "vapid.sock"))
+    daemon.context = context
+    daemon.start()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(5)
+            sock.connect(daemon.socket_path)
+            stream = sock.makefile("rwb")
+            stream.write(b'["helix"]\n{"product": "helix", "method": "get_helix_event_types"}\n')
+            stream.flush()
+            assert json.loads(stream.readline())["error"] == "TypeError"
+            assert json.loads(stream.readline())["ok"] is True
+    finally:
+        daemon.stop()
+        os.rmdir(directory)
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid") or os.getuid() != 0, reason="needs root to create another user's socket")
+def test_sockets_owned_by_another_user_are_ignored(tmp_path):
+    path = str(tmp_path / "vapid.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(path)
+        listener.listen()
+        os.chown(path, 12345, 12345)
+        assert daemon_available(path) is False
+        assert client_for("helix", socket_path=path) is None
+        with pytest.raises(PermissionError):
+            VapiDaemon(socket_path=path).start()
+
+
+def test_default_socket_is_not_directly_in_shared_tmp(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert _default_socket_path() == str(tmp_path / "vapid.sock")
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    assert os.path.dirname(os.path.dirname(_default_socket_path())) == tempfile.gettempdir()
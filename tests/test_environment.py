@@ -0,0 +1,129 @@
+import json
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from library.environment_vapi import EnvironmentVapi
+from library.sensor_store import SensorStore, downsample
+from library.standin import StandinServer
+
+
+def temperature(t):
+    return 20.0 + (t // 60) % 10
+
+
+class SensorStandin(StandinServer):
+    """Stand-in that serves one reading per minute, with both window ends inclusive as the API does."""
+    def __init__(self):
+        super().__init__()
+        self.windows = []
+
+    def respond(self, method, path):
+        url = urlsplit(path)
+        if not url.path.endswith("/environment/v1/data"):
+            return super().respond(method, path)
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+        start, end, page_size = int(query["start_time"]), int(query["end_time"]), int(query["page_size"])
+        offset = int(query.get("page_token", 0))
+        if offset == 0:
+            with self._lock:
+                self.windows.append((query["device_id"], start, end))
+        times = list(range(-(-start // 60) * 60, end + 1, 60))
+        page = times[offset:offset + page_size]
+        body = {
+            "data": [{"time": t, "temperature": temperature(t), "humidity": None if t % 120 else 40.0} for t in page],
+            "next_page_token": str(offset + page_size) if offset + page_size < len(times) else None,
+        }
+        return 200, json.dumps(body).encode("utf-8")
+
+
+@pytest.fixture
+def environment(context):
+    with SensorStandin() as server:
+        context.api_url = server.url
+        yield context.environment, server
+
+
+def test_time_windows_cover_the_range_without_overlap():
+    assert EnvironmentVapi.time_windows(0, 250, 100) == [(0, 100), (100, 200), (200, 250)]
+    assert EnvironmentVapi.time_windows(0, 200, 100) == [(0, 100), (100, 200)]
+    assert EnvironmentVapi.time_windows(50, 50, 100) == []
+
+
+def test_unknown_interval_is_rejected(environment):
+    vapi, _ = environment
+    with pytest.raises(ValueError):
+        list(vapi.iter_sensor_data("sensor-1", 0, 600, interval="7m"))
+
+
+def test_fetch_splits_into_windows_and_drops_boundary_duplicates(environment):
+    vapi, server = environment
+    store = vapi.fetch_sensor_data(["sensor-1", "sensor-2"], 0, 3600, window_seconds=600, max_workers=4)
+
+    assert sorted(server.windows) == sorted((device, start, start + 600) for device in ("sensor-1", "sensor-2")
+                                            for start in range(0, 3600, 600))
+    times, columns = store.range("sensor-1")
+    # 0..3600 inclusive is 61 minutes; the 5 inner window edges were each served twice but are stored once
+    assert times.tolist() == list(range(0, 3601, 60))
+    assert columns["temperature"].tolist() == [temperature(t) for t in range(0, 3601, 60)]
+    assert np.isnan(columns["humidity"][1]) and columns["humidity"][2] == 40.0
+    assert len(store) == 122
+    assert store.fields("sensor-2") == ["humidity", "temperature"]
+
+
+def test_refetched_readings_keep_the_last_copy():
+    store = SensorStore()
+    store.append("sensor-1", [{"time": 60, "temperature": 1.0}, {"time": 0, "temperature": 0.0}])
+    store.append("sensor-1", [{"time": 60, "temperature": 2.0}, {"time": 120, "temperature": 3.0}])
+    times, columns = store.range("sensor-1")
+    assert times.tolist() == [0, 60, 120]
+    assert columns["temperature"].tolist() == [0.0, 2.0, 3.0]
+
+
+def test_range_is_half_open_and_unknown_devices_raise():
+    store = SensorStore()
+    store.append("sensor-1", [{"time": t, "temperature": float(t)} for t in range(0, 600, 60)])
+    times, columns = store.range("sensor-1", 120, 300, fields=["temperature"])
+    assert times.tolist() == [120, 180, 240]
+    assert list(columns) == ["temperature"]
+    assert store.range("sensor-1", 1000, 2000)[0].tolist() == []
+    with pytest.raises(KeyError):
+        store.range("missing")
+
+
+def test_downsample_buckets_and_ignores_nan():
+    store = SensorStore()
+    store.append("sensor-1", [
+        {"time": 0, "temperature": 10.0}, {"time": 30, "temperature": 14.0},
+        {"time": 60, "temperature": None}, {"time": 90, "temperature": 8.0},
+        {"time": 200, "temperature": 1.0},
+    ])
+    buckets = store.downsample("sensor-1", "temperature", 60)
+    assert buckets["time"].tolist() == [0, 60, 180]
+    assert buckets["min"].tolist() == [10.0, 8.0, 1.0]
+    assert buckets["max"].tolist() == [14.0, 8.0, 1.0]
+    assert buckets["mean"].tolist() == [12.0, 8.0, 1.0]
+    empty = downsample(np.array([0], dtype=np.int64), np.array([np.nan]), 60, aggregates=("mean",))
+    assert empty["time"].tolist() == [] and list(empty) == ["time", "mean"]
+    with pytest.raises(ValueError):
+        store.downsample("sensor-1", "temperature", 60, aggregates=("median",))
+
+
+def test_save_and_load_round_trip(tmp_path):
+    store = SensorStore()
+    store.append("sensor-1", [{"time": 0, "temperature": 20.5, "humidity": 40.0}, {"time": 60, "temperature": 21.0}])
+    store.append("sensor-2", [{"time": 30, "pm_2_5": 3.0}])
+    path = str(tmp_path / "sensors.npz")
+    store.save(path)
+
+    loaded = SensorStore.load(path)
+    assert sorted(loaded.device_ids) == ["sensor-1", "sensor-2"]
+    for device_id in store.device_ids:
+        times, columns = store.range(device_id)
+        loaded_times, loaded_columns = loaded.range(device_id)
+        assert loaded_times.tolist() == times.tolist()
+        assert loaded_columns.keys() == columns.keys()
+        for name in columns:
+            np.testing.assert_array_equal(loaded_columns[name], columns[name])
@@ -0,0 +1,96 @@
+import os
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from library.export import export_parquet
+
+
+def read(path):
+    return pq.read_table(path)
+
+
+def test_int_column_is_promoted_to_float(tmp_path):
+    path = str(tmp_path / "events.parquet")
+    items = [{"attributes": {"mph": 20}}, {"attributes": {"mph": 25}}, {"attributes": {"mph": 30.5}}]
+    assert export_parquet(items, path, row_group_size=2) == 3
+    table = read(path)
+    assert table.schema.field("attributes.mph").type == pa.float64()
+    assert table.column("attributes.mph").to_pylist() == [20.0, 25.0, 30.5]
+    assert pq.ParquetFile(path).num_row_groups == 2
+
+
+def test_column_that_starts_null_takes_its_later_type(tmp_path):
+    path = str(tmp_path / "events.parquet")
+    items = [{"plate": "ABC123", "note": None}, {"plate": "XYZ987", "note": None}, {"plate": "LMN456", "note": "towed"}]
+    export_parquet(items, path, row_group_size=2)
+    table = read(path)
+    assert table.schema.field("note").type == pa.string()
+    assert table.column("note").to_pylist() == [None, None, "towed"]
+
+
+def test_new_columns_are_added_with_nulls_for_earlier_rows(tmp_path):
+    path = str(tmp_path / "events.parquet")
+    export_parquet([{"a": 1}, {"a": 2, "b": "x"}], path, row_group_size=1)
+    assert read(path).to_pylist() == [{"a": 1, "b": None}, {"a": 2, "b": "x"}]
+
+
+def test_incompatible_types_fail_without_leaving_a_file(tmp_path):
+    path = str(tmp_path / "events.parquet")
+    with pytest.raises(ValueError):
+        export_parquet([{"a": 1}, {"a": "one"}], path, row_group_size=1)
+    assert os.listdir(tmp_path) == []
+
+
+def test_explicit_schema_rejects_truncation(tmp_path):
+    path = str(tmp_path / "events.parquet")
+    schema = pa.schema([("mph", pa.int64())])
+    with pytest.raises(pa.ArrowInvalid):
+        export_parquet([{"mph": 20}, {"mph": 30.5}], path, row_group_size=1, schema=schema)
+    assert os.listdir(tmp_path) == []
+
+
+def test_explicit_schema_drops_unknown_columns(tmp_path):
+    path = str(tmp_path / "events.parquet")
+    schema = pa.schema([("mph", pa.float64())])
+    export_parquet([{"mph": 20, "extra": "x"}], path, schema=schema)
+    assert read(path).to_pylist() == [{"mph": 20.0}]
+
+
+def test_empty_export_writes_an_empty_file(tmp_path):
+    path = str(tmp_path / "events.parquet")
+    assert export_parquet([], path) == 0
+    assert read(path).num_rows == 0
+
+
+def test_keys_first_seen_in_later_rows_of_a_group_are_kept(tmp_path):
+    path = str(tmp_path / "events.parquet")
+    items = [
+        {"camera_id": "a", "attributes": {"dir": "E"}, "tags": [{"kind": "car"}]},
+        {"camera_id": "b", "attributes": {"dir": "W", "mph": 42}, "tags": [{"kind": "truck", "axles": 3}]},
+        {"camera_id": "c", "attributes": {"mph": 30.5}},
+    ]
+    export_parquet(items, path, row_group_size=10)
+    table = read(path)
+    assert pq.ParquetFile(path).num_row_groups == 1
+    assert table.schema.field("attributes.mph").type == pa.float64()
+    assert table.column("attributes.mph").to_pylist() == [None, 42.0, 30.5]
+    assert table.column("attributes.dir").to_pylist() == ["E", "W", None]
+    # Struct fields inside lists are also taken from every row
+    assert table.column("tags").to_pylist() == [[{"kind": "car", "axles": None}], [{"kind": "truck", "axles": 3}], None]
+
+
+def test_later_group_with_new_key_in_its_second_row_widens_the_file(tmp_path):
+    path = str(tmp_path / "events.parquet")
+    items = [{"a": 1}, {"a": 2}, {"a": 3}, {"a": 4, "b": "x"}]
+    export_parquet(items, path, row_group_size=2)
+    assert read(path).to_pylist() == [{"a": 1, "b": None}, {"a": 2, "b": None}, {"a": 3, "b": None}, {"a": 4, "b": "x"}]
+
+
+def test_mixed_values_within_a_group_raise_value_error(tmp_path):
+    path = str(tmp_path / "events.parquet")
+    with pytest.raises(ValueError):
+        export_parquet([{"a": 1}, {"a": "one"}], path, row_group_size=10)
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,86 @@
+import os
+import shutil
+import subprocess
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import library.frames as frames
+from library.frames import FrameExtractor, FrameIndex
+
+
+def test_index_round_trip(tmp_path):
+    path = str(tmp_path / "chunk.frames.idx")
+    FrameIndex(array("I", [0, 10000, 20000, 4000000000]), start_epoch_ms=1700000000000).save(path)
+    loaded = FrameIndex.load(path)
+    assert list(loaded.offsets_ms) == [0, 10000, 20000, 4000000000]
+    assert loaded.start_epoch_ms == 1700000000000
+    assert loaded.path == path
+    assert len(loaded) == 4
+    assert os.path.getsize(path) == frames._HEADER.size + 4 * 4
+
+
+def test_empty_index_round_trip(tmp_path):
+    path = str(tmp_path / "empty.frames.idx")
+    FrameIndex(array("I")).save(path)
+    loaded = FrameIndex.load(path)
+    assert len(loaded) == 0
+    assert loaded.nearest(5000) is None
+    assert loaded.frame_at(5000) is None
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "not.frames.idx"
+    path.write_bytes(b"JUNK" + b"\0" * 32)
+    with pytest.raises(ValueError):
+        FrameIndex.load(str(path))
+
+
+def test_nearest_edges_and_ties():
+    index = FrameIndex(array("I", [1000, 2000, 4000]))
+    # Before the first frame and after the last one clamp to the ends
+    assert index.nearest(0) == (1, 1000)
+    assert index.nearest(99999) == (3, 4000)
+    # Exact hits
+    assert index.nearest(1000) == (1, 1000)
+    assert index.nearest(4000) == (3, 4000)
+    # Halfway between two frames goes to the earlier one
+    assert index.nearest(1500) == (1, 1000)
+    assert index.nearest(3000) == (2, 2000)
+    assert index.nearest(3001) == (3, 4000)
+
+
+def test_frame_at_maps_wall_clock_time_to_a_jpeg(tmp_path):
+    path = str(tmp_path / "cam_chunk.frames.idx")
+    FrameIndex(array("I", [0, 10000]), start_epoch_ms=1000000).save(path)
+    assert FrameIndex.load(path).frame_at(1009000) == str(tmp_path / "cam_chunk_000002.jpg")
+
+
+def test_extractor_records_results_and_errors(tmp_path, monkeypatch):
+    def fake_extract(video_path, output_dir, interval, width, keyframes_only, start_epoch):
+        if "broken" in video_path:
+            raise subprocess.CalledProcessError(1, ["ffmpeg"])
+        return os.path.join(output_dir, "index")
+
+    monkeypatch.setattr(frames, "extract_frames", fake_extract)
+    with FrameExtractor(str(tmp_path), max_workers=1) as extractor:
+        # Threads instead of processes so the patched extract_frames is the one that runs
+        extractor.executor.shutdown()
+        extractor.executor = ThreadPoolExecutor(max_workers=2)
+        extractor.submit("good.mp4", camera_id="cam-1")
+        extractor.submit("broken.mp4")
+    assert extractor.results == {"good.mp4": os.path.join(str(tmp_path), "cam-1", "index")}
+    assert isinstance(extractor.errors["broken.mp4"], subprocess.CalledProcessError)
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="needs ffmpeg")
+def test_extract_frames_writes_an_index(tmp_path):
+    video = str(tmp_path / "clip.mp4")
+    subprocess.run(["ffmpeg", "-loglevel", "error", "-f", "lavfi", "-i", "testsrc=duration=3:size=320x240:rate=10", video], check=True)
+    with FrameExtractor(str(tmp_path / "frames"), interval=1, max_workers=1) as extractor:
+        extractor.submit(video, start_epoch=1000)
+    index = FrameIndex.load(extractor.results[video])
+    assert len(index) >= 3
+    assert index.start_epoch_ms == 1000000
+    assert os.path.exists(index.frame_at(1000000))
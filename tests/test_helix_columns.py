@@ -0,0 +1,59 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from library.helix_columns import HelixEventBatch
+
+EVENTS = [
+    {"camera_id": "cam-a", "time_ms": 1000, "event_type_uid": "speed", "attributes": {"mph": 25, "dir": "E", "plate_id": 2 ** 60 + 1}},
+    {"camera_id": "cam-b", "time_ms": 2000, "event_type_uid": "speed", "attributes": {"mph": 42, "dir": "W", "score": 0.5}},
+    {"camera_id": "cam-a", "time_ms": 3000, "event_type_uid": "door", "attributes": {"open": True}},
+]
+
+
+def test_round_trip_keeps_ints_floats_strings_and_bools():
+    batch = HelixEventBatch.from_events(EVENTS)
+    events = batch.to_events()
+    assert events == EVENTS
+    mph = events[0]["attributes"]["mph"]
+    assert mph == 25 and isinstance(mph, int)
+    # Above 2**53 a float64 column would round this
+    assert events[0]["attributes"]["plate_id"] == 2 ** 60 + 1
+    assert batch.numeric["mph"].dtype == np.int64
+    assert batch.numeric["score"].dtype == np.float64
+
+
+def test_integer_column_with_gaps_filters_like_a_float_column():
+    batch = HelixEventBatch.from_events(EVENTS)
+    mph = batch.attribute("mph")
+    assert mph.dtype == np.float64 and np.isnan(mph[2])
+    slow = batch.take(mph < 30)
+    assert [event["attributes"]["mph"] for event in slow.to_events()] == [25]
+    # An event without mph is never selected, and stays without mph after take()
+    assert "mph" not in batch.take(np.array([2])).to_events()[0]["attributes"]
+
+
+def test_integer_column_without_gaps_stays_int64():
+    batch = HelixEventBatch.from_events(EVENTS[:2])
+    assert batch.attribute("mph").dtype == np.int64
+    assert batch.attribute("mph").tolist() == [25, 42]
+
+
+def test_mixed_ints_and_floats_become_float64():
+    events = [{"camera_id": "c", "time_ms": 1, "event_type_uid": "t", "attributes": {"mph": 25}},
+              {"camera_id": "c", "time_ms": 2, "event_type_uid": "t", "attributes": {"mph": 30.5}}]
+    batch = HelixEventBatch.from_events(events)
+    assert batch.numeric["mph"].dtype == np.float64
+    assert [event["attributes"]["mph"] for event in batch.to_events()] == [25.0, 30.5]
+
+
+def test_masks_and_keys():
+    batch = HelixEventBatch.from_events(EVENTS, attributes=["dir"])
+    assert list(batch.numeric) == []
+    assert batch.attribute_equals("dir", "W").tolist() == [False, True, False]
+    assert batch.attribute_equals("dir", "N").tolist() == [False, False, False]
+    assert batch.time_mask(1500, 3000).tolist() == [False, True, False]
+    assert batch.camera_mask("cam-a").tolist() == [True, False, True]
+    assert list(batch.take(batch.camera_mask(["cam-b"])).keys()) == [("cam-b", 2000, "speed")]
+    with pytest.raises(KeyError):
+        batch.attribute("mph")
@@ -0,0 +1,65 @@
+import threading
+
+import pytest
+
+import library.utils as utils
+from library.helix_registry import HelixEventTypeRegistry
+
+
+class _Response:
+    status_code = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+
+
+class _FakeHelix:
+    def __init__(self, event_types):
+        self.event_types = event_types
+
+    def get_helix_event_types(self):
+        return _Response({"event_types": self.event_types})
+
+    def decode_json(self, response):
+        return response.payload
+
+
+class _InvalidatingLock:
+    """Lock that lets another "thread" invalidate the registry each time it is released."""
+    def __init__(self):
+        self.registry = None
+        self._lock = threading.Lock()
+        self._invalidating = False
+
+    def __enter__(self):
+        self._lock.acquire()
+
+    def __exit__(self, *exc):
+        self._lock.release()
+        if self.registry is not None and not self._invalidating:
+            self._invalidating = True
+            try:
+                self.registry.invalidate()
+            finally:
+                self._invalidating = False
+
+
+@pytest.fixture
+def registry():
+    registry = HelixEventTypeRegistry(_FakeHelix([{"event_type_uid": "uid-1", "name": "Speed", "event_schema": {}}]))
+    registry._lock = _InvalidatingLock()
+    registry._lock.registry = registry
+    return registry
+
+
+def test_lookups_survive_invalidate_between_load_and_read(registry):
+    assert registry.get("uid-1")["name"] == "Speed"
+    assert registry.get_by_name("Speed")["event_type_uid"] == "uid-1"
+    assert registry.resolve_uid("Speed") == "uid-1"
+    assert registry.names() == ["Speed"]
+    assert registry.get("missing") is None
+
+
+def test_resolve_uid_unknown_name(registry):
+    with pytest.raises(utils.UnknownHelixEventType):
+        registry.resolve_uid("Nope")
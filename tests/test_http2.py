@@ -0,0 +1,60 @@
+import sys
+
+import pytest
+import requests
+
+import library.http2_transport as http2_transport
+from library.http2_transport import Http2Transport, _to_requests_response
+
+
+def test_missing_httpx_raises_an_install_hint(monkeypatch):
+    monkeypatch.setitem(sys.modules, "httpx", None)
+    monkeypatch.setattr(http2_transport, "httpx", None)
+    with pytest.raises(ImportError, match="pip install httpx\\[http2\\]"):
+        Http2Transport()
+
+
+def test_missing_h2_raises_an_install_hint(monkeypatch):
+    pytest.importorskip("httpx")
+    monkeypatch.setitem(sys.modules, "h2", None)
+    with pytest.raises(ImportError, match="h2 package"):
+        Http2Transport()
+
+
+def test_response_adapter_looks_like_a_requests_response():
+    httpx = pytest.importorskip("httpx")
+    url = "https://api.example.com/cameras/v1/devices?page_size=1"
+    response = httpx.Response(503, headers={"Retry-After": "2", "Content-Type": "application/json"},
+                              content=b'{"devices":[]}', request=httpx.Request("GET", url))
+    converted = _to_requests_response(response, url)
+    assert isinstance(converted, requests.Response)
+    assert converted.status_code == 503 and not converted.ok
+    assert converted.headers["retry-after"] == "2"
+    assert converted.json() == {"devices": []}
+    assert converted.content == b'{"devices":[]}'
+    assert converted.reason == "Service Unavailable"
+    assert converted.url == url
+    with pytest.raises(requests.exceptions.HTTPError):
+        converted.raise_for_status()
+
+
+def test_requests_go_over_http2_with_converted_errors(vapi):
+    pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    from library.standin import Http2StandinServer
+    with Http2StandinServer() as server:
+        vapi.api_url = server.url
+        vapi.enable_http2(prior_knowledge=True)
+        try:
+            response = vapi.send_request("cameras/v1/devices")
+            assert response.status_code == 200
+            assert vapi.decode_json(response)["data"] == []
+        finally:
+            vapi.disable_http2()
+
+    transport = Http2Transport(prior_knowledge=True)
+    try:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            transport.request("GET", server.url + "/cameras/v1/devices", {"timeout": (0.5, 0.5)})
+    finally:
+        transport.close()
@@ -0,0 +1,41 @@
+import time
+import threading
+
+import library.utils as utils
+from library.lpoi_matcher import PlateMatcher
+
+
+def read_log(path):
+    utils.error_handler.listener.stop()
+    utils.error_handler.listener.start()
+    with open(path) as f:
+        return f.read()
+
+
+def test_fuzzy_collisions_keep_every_entry_and_are_logged(error_log):
+    matcher = PlateMatcher(fuzzy=True)
+    matcher.load([{"license_plate": "BAD100", "description": "first"}, {"license_plate": "8AD1OO", "description": "second"}, "XYZ9"])
+
+    assert len(matcher) == 2
+    assert matcher.match("bad-100")["description"] == "first"
+    assert [entry["description"] for entry in matcher.match_all("BAD100")] == ["first", "second"]
+    assert matcher.match_all("NOPE") == []
+    assert [entry["license_plate"] for _, entry in matcher.tag([{"license_plate": "8AD100"}, {"license_plate": "QQQ"}])] == ["BAD100"]
+    assert "BAD100, 8AD1OO all match as 8AD100" in read_log(error_log)
+
+
+def test_failed_refresh_is_logged_and_keeps_the_last_list(error_log):
+    class FailingLpr:
+        def iter_license_plates_of_interest(self):
+            raise ConnectionError("api down")
+
+    matcher = PlateMatcher(FailingLpr(), refresh_interval=0.01)
+    matcher.load(["ABC123"])
+    # start() would fail on its first refresh, so run only the background loop
+    matcher._thread = threading.Thread(target=matcher._refresh_loop, daemon=True)
+    matcher._thread.start()
+    time.sleep(0.1)
+    matcher.stop()
+
+    assert "ABC123" in matcher
+    assert "Failed to refresh license plates of interest" in read_log(error_log)
@@ -0,0 +1,100 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from library.lpr_index import LprTimestampIndex
+from library.standin import StandinServer
+
+SIGHTINGS = {
+    "cam-a": [[100, 105, 105], [130]],
+    "cam-b": [[101], [120, 140]],
+}
+
+
+def fake_pages(sightings, slow=None, release=None):
+    def paginate_pages(endpoint, items_key, params=None, page_size=100, method="GET", json=None):
+        camera_id = params["camera_id"]
+        for i, page in enumerate(sightings[camera_id]):
+            if camera_id == slow and i > 0:
+                release.wait(5)
+            yield [{"timestamp": t} for t in page if params["start_time"] <= t <= params["end_time"]]
+    return paginate_pages
+
+
+def timeline(lpr, **kwargs):
+    return [(item["timestamp"], item["camera_id"]) for item in lpr.iter_plate_timeline("abc123", 0, 1000, camera_ids=["cam-a", "cam-b"], **kwargs)]
+
+
+def test_timeline_is_merged_in_time_order(context, monkeypatch):
+    lpr = context.lpr
+    monkeypatch.setattr(lpr, "paginate_pages", fake_pages(SIGHTINGS))
+    assert timeline(lpr) == [(100, "cam-a"), (101, "cam-b"), (105, "cam-a"), (105, "cam-a"),
+                             (120, "cam-b"), (130, "cam-a"), (140, "cam-b")]
+
+
+def test_same_second_sightings_do_not_depend_on_the_index(context, monkeypatch):
+    lpr = context.lpr
+    monkeypatch.setattr(lpr, "paginate_pages", fake_pages(SIGHTINGS))
+    index = LprTimestampIndex()
+    plain = timeline(lpr)
+    assert timeline(lpr, index=index) == plain
+    # Answered from the index the second time, still with both same-second sightings
+    assert timeline(lpr, index=index) == plain
+
+
+def test_first_sightings_arrive_before_the_slowest_camera_finishes(context, monkeypatch):
+    lpr = context.lpr
+    release = threading.Event()
+    monkeypatch.setattr(lpr, "paginate_pages", fake_pages(SIGHTINGS, slow="cam-b", release=release))
+    stream = lpr.iter_plate_timeline("abc123", 0, 1000, camera_ids=["cam-a", "cam-b"])
+    started = time.monotonic()
+    first = next(stream)
+    assert (first["timestamp"], first["camera_id"]) == (100, "cam-a")
+    assert time.monotonic() - started < 1
+    release.set()
+    assert len(list(stream)) == 6
+
+
+def test_pages_that_go_back_in_time_raise(context, monkeypatch):
+    lpr = context.lpr
+    monkeypatch.setattr(lpr, "paginate_pages", fake_pages({"cam-a": [[130], [100, 105]], "cam-b": [[101]]}))
+    with pytest.raises(ValueError, match="cam-a"):
+        timeline(lpr)
+
+
+def test_slow_consumer_holds_a_bounded_number_of_pages(context, monkeypatch):
+    lpr = context.lpr
+    fetched = []
+
+    def paginate_pages(endpoint, items_key, params=None, page_size=100, method="GET", json=None):
+        for i in range(100):
+            fetched.append(i)
+            yield [{"timestamp": i}]
+
+    monkeypatch.setattr(lpr, "paginate_pages", paginate_pages)
+    stream = lpr.iter_plate_timeline("abc123", 0, 1000, camera_ids=["cam-a"], max_buffered_pages=2)
+    assert next(stream)["timestamp"] == 0
+    time.sleep(0.3)
+    # The page being merged, the queued pages and one fetched page waiting for room
+    assert len(fetched) <= 5
+    stream.close()
+
+
+def test_more_cameras_than_workers_with_small_buffers_still_complete(context, monkeypatch):
+    lpr = context.lpr
+    cameras = [f"cam-{i}" for i in range(12)]
+    sightings = {camera: [[i * 10 + page] for page in range(5)] for i, camera in enumerate(cameras)}
+    monkeypatch.setattr(lpr, "paginate_pages", fake_pages(sightings))
+    items = list(lpr.iter_plate_timeline("abc123", 0, 1000, camera_ids=cameras, max_workers=2, max_buffered_pages=1))
+    assert [item["timestamp"] for item in items] == sorted(t for pages in sightings.values() for page in pages for t in page)
+
+
+def test_failed_camera_list_raises_instead_of_an_empty_timeline(context):
+    lpr = context.lpr
+    lpr.configure_resilience(retry_policy=False)
+    with StandinServer(trace=[{"method": "GET", "endpoint": "cameras/v1/devices", "status": 500}]) as server:
+        lpr.api_url = server.url
+        with pytest.raises(requests.exceptions.HTTPError):
+            list(lpr.iter_plate_timeline("abc123", 0, 1000))
@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from library.records import AlarmDevice, CameraDevice, HelixEvent, LprDetection
+
+# Payloads as the API returns them, decoded from JSON text like a real response body
+HELIX_PAGE = json.loads("""[
+    {"camera_id": "cam-1", "time_ms": 1700000000123, "event_type_uid": "evt-speed",
+     "attributes": {"mph": 42, "direction": "East"}, "flagged": false},
+    {"camera_id": "cam-1", "time_ms": 1700000000456, "event_type_uid": "evt-speed",
+     "attributes": {"mph": 17, "direction": "West"}, "flagged": true}
+]""")
+
+CAMERA = json.loads("""{
+    "camera_id": "cam-1", "name": "Lobby", "model": "CD52", "serial": "SER00000001", "site": "Main",
+    "site_id": "7b1c1b2e-5fd0-4ad6-8e0e-8f5ad0d1c6a3", "status": "Live", "local_ip": "10.0.0.12",
+    "mac": "e0:a7:00:00:00:01", "firmware": "2.4.1", "timezone": "America/Denver", "last_online": 1700000000,
+    "cloud_retention": 30, "location": "Front door"
+}""")
+
+ALARM = json.loads("""{
+    "device_id": "dev-1", "device_type": "door_contact_sensor", "name": "Back door",
+    "site_id": "7b1c1b2e-5fd0-4ad6-8e0e-8f5ad0d1c6a3", "serial_number": "SN00000001", "status": "online"
+}""")
+
+LPR_PAGE = json.loads("""[
+    {"license_plate": "ABC1234", "timestamp": 1700000000, "image_url": "https://example.invalid/1.jpg"},
+    {"license_plate": "XYZ9876", "timestamp": 1700000060}
+]""")
+
+
+def test_helix_page_round_trips_through_to_dict():
+    events = HelixEvent.from_json_list(HELIX_PAGE)
+    assert [event.to_dict() for event in events] == HELIX_PAGE
+    assert events[1].key == ("cam-1", 1700000000456, "evt-speed")
+    assert events[1].flagged is True
+    # Repeated ids and attribute names share one string object
+    assert events[0].camera_id is events[1].camera_id
+    assert next(iter(events[0].attributes)) is next(iter(events[1].attributes))
+
+
+def test_to_dict_is_json_serializable_and_parses_back_equal():
+    camera = CameraDevice.from_json(CAMERA)
+    assert CameraDevice.from_json(json.loads(json.dumps(camera.to_dict()))) == camera
+    alarm = AlarmDevice.from_json(ALARM)
+    assert alarm.to_dict() == ALARM
+    assert AlarmDevice.from_json(json.loads(json.dumps(alarm.to_dict()))) == alarm
+
+
+def test_extra_fields_are_dropped():
+    camera = CameraDevice.from_json(CAMERA)
+    assert "cloud_retention" not in camera.to_dict()
+    assert not hasattr(camera, "__dict__")
+    assert camera.to_dict() == {name: value for name, value in CAMERA.items() if name in CameraDevice.__slots__}
+
+
+def test_missing_fields_become_none():
+    event = HelixEvent.from_json({"camera_id": "cam-1", "time_ms": 1700000000123})
+    assert event.event_type_uid is None
+    assert event.attributes is None
+    assert event.to_dict() == {"camera_id": "cam-1", "time_ms": 1700000000123, "event_type_uid": None,
+                               "attributes": None, "flagged": None}
+    assert CameraDevice.from_json({}) == CameraDevice()
+
+
+def test_lpr_detections_take_the_camera_from_the_query():
+    detections = LprDetection.from_json_list(LPR_PAGE, camera_id="cam-9")
+    assert [detection.camera_id for detection in detections] == ["cam-9", "cam-9"]
+    assert detections[1].image_url is None
+    # A camera_id in the payload wins over the query parameter
+    detection = LprDetection.from_json({"camera_id": "cam-1", "license_plate": "ABC1234"}, camera_id="cam-9")
+    assert detection.camera_id == "cam-1"
+
+
+def test_non_string_ids_are_kept_as_is():
+    alarm = AlarmDevice.from_json(dict(ALARM, device_id=12345, status=None))
+    assert alarm.device_id == 12345
+    assert alarm.status is None
+
+
+def test_constructor_rejects_unknown_or_surplus_fields():
+    assert LprDetection("cam-1", "ABC1234").timestamp is None
+    with pytest.raises(TypeError, match="unexpected fields: colour"):
+        LprDetection(camera_id="cam-1", colour="red")
+    with pytest.raises(TypeError, match="at most 4"):
+        LprDetection("cam-1", "ABC1234", 1700000000, "url", "extra")
@@ -0,0 +1,173 @@
+import time
+import threading
+
+import pytest
+import requests
+
+import library.utils as utils
+from library.resilience import CircuitBreakers, CircuitOpenError
+
+
+def failing_transport(calls):
+    def transport(method, url, request_kwargs):
+        calls.append(time.monotonic())
+        raise requests.exceptions.ConnectionError("down")
+    return transport
+
+
+def test_open_breaker_probes_under_steady_traffic(vapi):
+    breakers = CircuitBreakers(failure_threshold=2, reset_timeout=0.3)
+    vapi.configure_resilience(retry_policy=False, circuit_breakers=breakers)
+    calls = []
+    vapi._transport = failing_transport(calls)
+
+    end = time.monotonic() + 1.5
+    while time.monotonic() < end:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            vapi.send_request("cameras/v1/devices")
+        time.sleep(0.1)
+
+    # Two calls open the breaker, then roughly one probe per reset_timeout gets through
+    assert len(calls) >= 4
+    # Fast failures are not counted: only real attempts record a failure
+    assert breakers.for_endpoint("cameras/v1/devices").failures == len(calls)
+
+
+def test_fast_failure_is_raised_without_touching_the_transport(vapi):
+    vapi.configure_resilience(retry_policy=False, circuit_breakers=CircuitBreakers(failure_threshold=1, reset_timeout=60))
+    calls = []
+    vapi._transport = failing_transport(calls)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        vapi.send_request("cameras/v1/devices")
+    with pytest.raises(CircuitOpenError):
+        vapi.send_request("cameras/v1/devices")
+    assert len(calls) == 1
+
+
+def test_breaker_closes_after_a_successful_probe(vapi):
+    breakers = CircuitBreakers(failure_threshold=1, reset_timeout=0.05)
+    vapi.configure_resilience(retry_policy=False, circuit_breakers=breakers)
+    transport = vapi._transport
+    vapi._transport = failing_transport([])
+    with pytest.raises(requests.exceptions.ConnectionError):
+        vapi.send_request("cameras/v1/devices")
+
+    vapi._transport = transport
+    time.sleep(0.1)
+    assert vapi.send_request("cameras/v1/devices").status_code == 200
+    assert breakers.states()["cameras/v1/devices"] == "closed"
+
+
+def test_transport_failures_are_logged(vapi, error_log):
+    vapi.configure_resilience(retry_policy=False, circuit_breakers=False)
+    vapi._transport = failing_transport([])
+    with pytest.raises(requests.exceptions.ConnectionError):
+        vapi.send_request("cameras/v1/devices")
+    utils.error_handler.listener.stop()
+    utils.error_handler.listener.start()
+    with open(error_log) as f:
+        assert "HTTP request failed for GET cameras/v1/devices" in f.read()
+
+
+def test_coalesced_gets_keep_and_key_on_their_body(vapi):
+    vapi.configure_resilience(retry_policy=False, circuit_breakers=False)
+    bodies = []
+    release = threading.Event()
+
+    def transport(method, url, request_kwargs):
+        bodies.append(request_kwargs.get("data"))
+        release.wait(5)
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+    vapi._transport = transport
+    payloads = [{"q": "a"}, {"q": "a"}, {"q": "b"}]
+    threads = [threading.Thread(target=vapi.send_request, args=("cameras/v1/devices",), kwargs={"json": payload})
+               for payload in payloads]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    # The two identical bodies share one upstream call, the different one is sent on its own
+    assert sorted(bodies) == sorted([vapi.codec.dumps({"q": "a"}), vapi.codec.dumps({"q": "b"})])
+    assert vapi.singleflight.shared == 1
+
+
+def test_requests_authenticate_with_the_token_unless_a_key_is_given(vapi):
+    vapi.configure_resilience(retry_policy=False, circuit_breakers=False)
+    sent = []
+
+    def transport(method, url, request_kwargs):
+        sent.append(request_kwargs["headers"])
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+    vapi._transport = transport
+    vapi.send_request("cameras/v1/devices")
+    vapi.send_request("core/v1/audit_log", api_key="explicit-key")
+    assert sent[0]["x-verkada-auth"] == vapi.current_token == "standin-token"
+    assert "x-api-key" not in sent[0]
+    assert sent[1]["x-api-key"] == "explicit-key"
+    assert "x-verkada-auth" not in sent[1]
+
+
+def test_stalled_endpoint_times_out_and_counts_against_its_breaker(vapi, standin):
+    breakers = CircuitBreakers(failure_threshold=1, reset_timeout=60)
+    vapi.configure_resilience(retry_policy=False, circuit_breakers=breakers, request_timeout=(1, 0.2))
+    vapi.fetch_api_token()
+    standin.latency_ms = 2000
+
+    start = time.monotonic()
+    with pytest.raises(requests.exceptions.Timeout):
+        vapi.send_request("cameras/v1/devices")
+    assert time.monotonic() - start < 1
+    assert breakers.states()["cameras/v1/devices"] == "open"
+
+
+def test_attempt_timeout_is_capped_by_the_retry_deadline(vapi, standin):
+    from library.resilience import RetryPolicy
+    vapi.configure_resilience(retry_policy=RetryPolicy(max_attempts=10, base_delay=0.01, deadline=0.5),
+                              circuit_breakers=False, request_timeout=(5, 30))
+    vapi.fetch_api_token()
+    standin.latency_ms = 3000
+
+    start = time.monotonic()
+    with pytest.raises(requests.exceptions.Timeout):
+        vapi.send_request("cameras/v1/devices")
+    assert time.monotonic() - start < 1.5
+
+
+def test_non_transport_error_during_a_probe_does_not_wedge_the_breaker(vapi):
+    breakers = CircuitBreakers(failure_threshold=1, reset_timeout=0.1)
+    vapi.configure_resilience(retry_policy=False, circuit_breakers=breakers)
+    vapi._transport = failing_transport([])
+    with pytest.raises(requests.exceptions.ConnectionError):
+        vapi.send_request("cameras/v1/devices")
+    time.sleep(0.15)
+
+    def broken_transport(method, url, request_kwargs):
+        raise RuntimeError("trace file is read-only")
+
+    vapi._transport = broken_transport
+    with pytest.raises(RuntimeError):
+        vapi.send_request("cameras/v1/devices")
+    # The probe slot was freed, so the next call is let through instead of failing fast
+    calls = []
+    vapi._transport = failing_transport(calls)
+    with pytest.raises(requests.exceptions.ConnectionError) as raised:
+        vapi.send_request("cameras/v1/devices")
+    assert not isinstance(raised.value, CircuitOpenError)
+    assert len(calls) == 1
+
+
+def test_unknown_priority_is_rejected_before_any_request(vapi):
+    vapi.enable_scheduler(max_concurrency=2)
+    with pytest.raises(ValueError):
+        with vapi.request_priority("urgent"):
+            pass
+    assert vapi.current_priority() == "normal"
@@ -0,0 +1,78 @@
+import os
+import threading
+import time
+
+import pytest
+
+from library.sensor_bridge import DetectionCoalescer, FakeRadar, SerialRadarBridge, open_pty_pair
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "openpty"), reason="needs a pseudo-terminal")
+
+
+@pytest.fixture
+def radar():
+    master_fd, slave_path = open_pty_pair()
+    yield FakeRadar(master_fd), slave_path
+    os.close(master_fd)
+
+
+def collect(bridge_kwargs, slave_path, send):
+    handled = []
+    done = threading.Event()
+
+    def handler(reading):
+        handled.append(reading)
+        done.set()
+
+    with SerialRadarBridge(slave_path, handler, **bridge_kwargs) as bridge:
+        send()
+        done.wait(2)
+        time.sleep(0.2)
+    return handled, bridge
+
+
+def test_readings_reach_the_handler_with_low_latency(radar):
+    fake, slave_path = radar
+    handled, bridge = collect({}, slave_path, lambda: [fake.send(velocity=v) for v in (31, 32, 33)])
+    # Two posters may finish out of order
+    assert sorted(reading["velocity"] for reading in handled) == [31, 32, 33]
+    assert len(bridge.latencies) == 3
+    # Event-driven reads: well under the old polling loop's sleep
+    assert max(bridge.latencies) < 0.1
+
+
+def test_bursts_are_coalesced_into_one_detection(radar):
+    fake, slave_path = radar
+
+    def burst():
+        for velocity in (30, 42, 36):
+            fake.send(direction="inbound", velocity=velocity)
+        fake.send(direction="outbound", velocity=20)
+
+    coalescer = DetectionCoalescer(gap=0.1)
+    handled, bridge = collect({"coalescer": coalescer}, slave_path, burst)
+    by_direction = {reading["direction"]: reading for reading in handled}
+    assert len(handled) == 2
+    assert by_direction["inbound"]["velocity"] == 42
+    assert by_direction["inbound"]["count"] == 3
+    assert by_direction["inbound"]["avg_velocity"] == 36
+    assert by_direction["outbound"]["count"] == 1
+    assert coalescer.readings_in == 4 and coalescer.detections_out == 2
+
+
+def test_latency_history_is_bounded(radar):
+    fake, slave_path = radar
+    handled, bridge = collect({"latency_window": 5}, slave_path, lambda: [fake.send(velocity=v) for v in range(20)])
+    time.sleep(0.1)
+    assert len(bridge.latencies) == 5
+
+
+def test_garbled_lines_are_skipped(radar):
+    fake, slave_path = radar
+
+    def send():
+        os.write(fake.master_fd, b"{not json\n")
+        fake.send(velocity=50)
+
+    handled, bridge = collect({}, slave_path, send)
+    assert [reading["velocity"] for reading in handled] == [50]
@@ -0,0 +1,45 @@
+import pytest
+
+from library.standin import StandinServer
+from library.tracing import replay_trace
+
+
+def make_trace(count=20):
+    entries = []
+    for i in range(count):
+        status = 503 if i % 2 else 200
+        entries.append({"ts": i * 0.001, "method": "GET", "endpoint": "cameras/v1/devices",
+                        "params": None, "status": status, "response_bytes": 64, "latency_ms": 5.0})
+    return entries
+
+
+def test_replay_sends_every_entry_once_and_reports_recorded_errors(vapi):
+    entries = make_trace()
+    with StandinServer(trace=entries) as server:
+        vapi.api_url = server.url
+        report = replay_trace(vapi, entries, speed=None, max_workers=8)
+    assert server.requests_served == 20
+    assert report["statuses"] == {200: 10, 503: 10}
+    assert report["error_rate"] == 0.5
+
+def test_raw_replay_restores_the_clients_resilience(vapi):
+    vapi.enable_response_cache()
+    saved = {name: getattr(vapi, name) for name in ("singleflight", "response_cache", "retry_policy", "circuit_breakers")}
+    assert all(value is not None for value in saved.values())
+    with StandinServer(trace=make_trace(4)) as server:
+        vapi.api_url = server.url
+        report = replay_trace(vapi, make_trace(4), speed=None)
+        # Recorded 503s are reported once each, not retried away or served from cache
+        assert report["statuses"] == {200: 2, 503: 2}
+        assert server.requests_served == 4
+    for name, value in saved.items():
+        assert getattr(vapi, name) is value
+
+
+def test_raw_replay_restores_the_client_when_it_fails(vapi):
+    saved_policy = vapi.retry_policy
+    entries = make_trace(2)
+    entries[1]["method"] = "BREW"
+    with pytest.raises(ValueError):
+        replay_trace(vapi, entries, speed=None, max_workers=1)
+    assert vapi.retry_policy is saved_policy and vapi.singleflight is not None
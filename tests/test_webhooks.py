@@ -0,0 +1,42 @@
+import time
+
+import pytest
+import requests
+
+from library.webhooks import SIGNATURE_HEADER, WebhookReceiver, post_sample, sign_payload
+
+SECRET = "test-secret"
+
+
+def wait_for(condition, timeout=2.0):
+    end = time.monotonic() + timeout
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_signed_non_object_body_is_rejected(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with WebhookReceiver(SECRET, port=0, workers=1) as receiver:
+        body = b'["not", "a", "payload"]'
+        headers = {"content-type": "application/json", SIGNATURE_HEADER: sign_payload(SECRET, body)}
+        assert requests.post(receiver.url, data=body, headers=headers, timeout=5).status_code == 400
+
+
+def test_workers_survive_bad_payloads(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    seen = []
+    with WebhookReceiver(SECRET, port=0, workers=1) as receiver:
+        receiver.on("lpr", lambda detection, payload: seen.append(detection.license_plate))
+        receiver.on("boom", lambda data, payload: 1 / 0)
+        receiver.queue.put(["not", "a", "dict"])
+        post_sample(receiver.url, SECRET, {"webhook_type": "boom", "data": {}})
+        post_sample(receiver.url, SECRET, {"webhook_type": "lpr", "data": {"camera_id": "c", "license_plate": "ABC123", "timestamp": 1}})
+        assert wait_for(lambda: seen == ["ABC123"])
+    assert receiver.stats["errors"] == 2
+
+
+def test_secret_is_required_unless_insecure():
+    with pytest.raises(ValueError):
+        WebhookReceiver(None)
+    assert WebhookReceiver(None, insecure=True).secret is None